@@ -4,20 +4,17 @@
 import asyncio
 import torch
 from typing import Any, Callable
-
-try:
-    from transformers.pipelines import pipeline
-except ImportError:
-    # transformers 라이브러리가 없는 경우 대체 함수
-    def pipeline(*args, **kwargs) -> Any:
-        raise ImportError("transformers 라이브러리가 설치되지 않았습니다.")
 import numpy as np
 from typing import Dict, List, Any, Union
 import warnings
 import os
 import re
+
+from services.model_registry import model_registry, register_pipeline
 warnings.filterwarnings("ignore")
 
+EMOTION_MODEL_NAME = "j-hartmann/emotion-english-distilroberta-base"
+
 class RealAIEmotionAnalyzer:
     """진짜 AI 모델 기반 감정 분석기 (로컬 LLM 사용)"""
     
@@ -25,10 +22,16 @@ class RealAIEmotionAnalyzer:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         print(f"🔧 디바이스: {self.device}")
         
-        # 감정 분석 모델들
-        self.emotion_classifier = None
-        self.sentiment_classifier = None
-        self.feedback_generator = None  # 피드백 생성용 LLM
+        # 모델은 공용 레지스트리에 등록만 하고 처음 사용할 때 로드 (다른 분석기와 같은 모델은 공유)
+        device = 0 if self.device == "cuda" else -1
+        self.emotion_model_key = register_pipeline("text-classification", EMOTION_MODEL_NAME, device=device)
+        # 피드백 생성용 LLM 후보 (한국어 GPT-2 → 영어 대화 모델 순서)
+        self.feedback_model_keys = [
+            register_pipeline("text-generation", "skt/kogpt2-base-v2", device=device, max_length=200, pad_token_id=50256),
+            register_pipeline("text-generation", "microsoft/DialoGPT-medium", device=device, max_length=150),
+        ]
+        self.feedback_model_key = None
+        self.models_initialized = False
         
         print("🤖 로컬 LLM 모델 사용 - AI가 직접 피드백 생성!")
         
@@ -38,38 +41,22 @@ class RealAIEmotionAnalyzer:
             print("🤖 딥러닝 모델 로딩 중...")
             
             # 1. 감정 분석 모델
-            self.emotion_classifier = pipeline(
-                "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base",
-                device=0 if self.device == "cuda" else -1,
-                return_all_scores=True
-            )
+            await model_registry.preload(self.emotion_model_key)
             
-            # 2. 피드백 생성용 LLM (한국어 지원)
-            try:
-                print("🧠 한국어 텍스트 생성 모델 로딩 중...")
-                self.feedback_generator = pipeline(
-                    "text-generation",
-                    model="skt/kogpt2-base-v2",  # 한국어 GPT-2
-                    device=0 if self.device == "cuda" else -1,
-                    max_length=200,
-                    pad_token_id=50256
-                )
-                print("✅ 한국어 LLM 로딩 완료!")
-            except Exception as e:
-                print(f"⚠️  한국어 모델 로딩 실패: {e}")
-                print("🔄 영어 모델로 대체...")
+            # 2. 피드백 생성용 LLM (한국어 지원, 실패 시 영어 모델로 대체)
+            for key in self.feedback_model_keys:
                 try:
-                    self.feedback_generator = pipeline(
-                        "text-generation",
-                        model="microsoft/DialoGPT-medium",
-                        device=0 if self.device == "cuda" else -1,
-                        max_length=150
-                    )
-                    print("✅ 영어 LLM 로딩 완료!")
-                except:
-                    print("⚠️  LLM 로딩 실패, 규칙 기반 피드백 사용")
-                
+                    print(f"🧠 텍스트 생성 모델 로딩 중: {key}")
+                    await model_registry.preload(key)
+                    self.feedback_model_key = key
+                    print("✅ LLM 로딩 완료!")
+                    break
+                except Exception as e:
+                    print(f"⚠️  텍스트 생성 모델 로딩 실패: {e}")
+            else:
+                print("⚠️  LLM 로딩 실패, 규칙 기반 피드백 사용")
+            
+            self.models_initialized = True
             print("✅ 딥러닝 모델 로딩 완료!")
             
         except Exception as e:
@@ -79,17 +66,16 @@ class RealAIEmotionAnalyzer:
     
     async def analyze_emotion(self, text: str) -> Dict[str, Any]:
         """실제 딥러닝 모델을 사용한 감정 분석"""
-        if self.emotion_classifier is None:
+        if not self.models_initialized:
             await self.initialize_models()
         
         print(f"🧠 AI 모델로 감정 분석 중...")
         print(f"📝 분석 텍스트: {text}")
         
         try:
-            # 1. 감정 분석 실행
-            if self.emotion_classifier is None:
-                raise ValueError("감정 분석 모델이 로드되지 않았습니다.")
-            emotion_results = self.emotion_classifier(text)
+            # 1. 감정 분석 실행 (모든 감정 점수 반환, 퇴출된 경우 레지스트리가 다시 로드)
+            async with model_registry.use(self.emotion_model_key) as emotion_classifier:
+                emotion_results = emotion_classifier(text, top_k=None)
             
             # 결과가 리스트인 경우 첫 번째 항목 가져오기
             if isinstance(emotion_results, list) and len(emotion_results) > 0:
@@ -199,7 +185,7 @@ class RealAIEmotionAnalyzer:
     
     async def generate_real_ai_feedback(self, text: str, emotion_result: Dict[str, Any]) -> str:
         """로컬 LLM을 활용한 개인화된 피드백 생성"""
-        if self.feedback_generator is None:
+        if self.feedback_model_key is None:
             return await self._generate_smart_template_feedback(text, emotion_result)
         
         try:
@@ -214,15 +200,16 @@ class RealAIEmotionAnalyzer:
             prompt = self._create_llm_prompt(text, emotion_result, features)
             
             # LLM으로 피드백 생성
-            generated = self.feedback_generator(
-                prompt,
-                max_new_tokens=100,
-                num_return_sequences=1,
-                temperature=0.8,
-                do_sample=True,
-                repetition_penalty=1.2,
-                pad_token_id=self.feedback_generator.tokenizer.pad_token_id or 50256
-            )
+            async with model_registry.use(self.feedback_model_key) as feedback_generator:
+                generated = feedback_generator(
+                    prompt,
+                    max_new_tokens=100,
+                    num_return_sequences=1,
+                    temperature=0.8,
+                    do_sample=True,
+                    repetition_penalty=1.2,
+                    pad_token_id=feedback_generator.tokenizer.pad_token_id or 50256
+                )
             
             # 생성된 텍스트에서 피드백 부분만 추출
             full_text = generated[0]['generated_text']
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+OpenAI 감정 분석 결과로 로컬 감정 분류기 증류
+
+1. emotion_analysis 컬렉션에서 OpenAI가 분석한 (정제된 텍스트, 7개 감정 확률) 쌍 내보내기
+2. 글자 n-gram 해시 특징 위의 소프트맥스 선형 모델 학습 (교사 확률 분포를 그대로 목표로 사용)
+3. 검증 세트에서 교사 대비 1등 감정 일치율/확률 오차 평가, 기준을 통과하면 모델 저장
+
+사용법:
+    python distill_emotion_model.py --export distilled_models/teacher.jsonl
+    python distill_emotion_model.py --from-jsonl distilled_models/teacher.jsonl --epochs 15
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from config.database import db_manager
+from config.settings import settings
+from models.emotion import EmotionLabel
+from services.distilled_model import EMOTION_NAMES, CharNgramHasher, LinearEmotionModel, agreement_report
+
+COLLECTION_NAME = "emotion_analysis"
+TEACHER_MODEL_PREFIX = "openai"
+
+# 저장 기준 (교사 대비 1등 감정 일치율)
+MIN_TOP1_AGREEMENT = 0.8
+
+
+def _label_name(value) -> str:
+    """저장된 감정 값(Enum 값 또는 이름)을 교사 응답의 감정 이름으로 변환"""
+    if isinstance(value, EmotionLabel):
+        return value.name
+    try:
+        return EmotionLabel(value).name
+    except ValueError:
+        return EmotionLabel[str(value).upper()].name
+
+
+def export_teacher_labels(limit: int) -> List[dict]:
+    """OpenAI가 분석한 결과만 (텍스트, 감정 확률) 형태로 내보내기 (폴백/로컬 모델 결과 제외)"""
+    collection = db_manager.get_collection(COLLECTION_NAME)
+    query = collection.order_by("analyzed_at", direction="desc").limit(limit)
+
+    samples = []
+    seen = set()
+    for doc in query.get():
+        data = doc.to_dict()
+        text = (data.get("text") or "").strip()
+        if not text or text in seen or not str(data.get("model_used", "")).startswith(TEACHER_MODEL_PREFIX):
+            continue
+
+        scores = {name: 0.0 for name in EMOTION_NAMES}
+        try:
+            for item in data.get("all_emotions", []):
+                scores[_label_name(item["emotion"])] = float(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if sum(scores.values()) <= 0:
+            continue
+
+        seen.add(text)
+        samples.append({'text': text, 'scores': [scores[name] for name in EMOTION_NAMES]})
+    return samples
+
+
+def load_jsonl(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_jsonl(samples: List[dict], path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for sample in samples:
+            f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+
+
+def split_samples(samples: List[dict], holdout: float, seed: int) -> Tuple[List[dict], List[dict]]:
+    """학습/검증 분리 (검증 세트는 최소 1개)"""
+    order = np.random.RandomState(seed).permutation(len(samples))
+    holdout_count = max(1, int(len(samples) * holdout))
+    return [samples[i] for i in order[holdout_count:]], [samples[i] for i in order[:holdout_count]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="OpenAI 감정 분석 결과로 로컬 분류기 증류")
+    parser.add_argument("--from-jsonl", help="내보낸 교사 라벨 파일로 학습 (DB 조회 생략)")
+    parser.add_argument("--export", help="DB에서 내보낸 교사 라벨을 저장할 JSONL 경로")
+    parser.add_argument("--limit", type=int, default=50000, help="내보낼 최근 분석 결과 수")
+    parser.add_argument("--output", default=settings.distilled_model_path, help="모델 저장 경로 (.npz)")
+    parser.add_argument("--epochs", type=int, default=10, help="학습 에폭 수")
+    parser.add_argument("--learning-rate", type=float, default=0.5, help="AdaGrad 학습률")
+    parser.add_argument("--num-features", type=int, default=1 << 18, help="해시 특징 수")
+    parser.add_argument("--holdout", type=float, default=0.1, help="검증 세트 비율")
+    parser.add_argument("--min-agreement", type=float, default=MIN_TOP1_AGREEMENT, help="저장 기준 1등 감정 일치율")
+    parser.add_argument("--force", action="store_true", help="기준 미달이어도 저장")
+    args = parser.parse_args()
+
+    if args.from_jsonl:
+        samples = load_jsonl(args.from_jsonl)
+    else:
+        print(f"📥 교사 라벨 내보내는 중: {COLLECTION_NAME} (최근 {args.limit}개)")
+        samples = export_teacher_labels(args.limit)
+        if args.export:
+            save_jsonl(samples, args.export)
+            print(f"✅ 교사 라벨 저장: {args.export} ({len(samples)}개)")
+
+    if len(samples) < 10:
+        print(f"❌ 학습 데이터가 부족합니다: {len(samples)}개")
+        return 1
+
+    train, holdout = split_samples(samples, args.holdout, seed=42)
+    model = LinearEmotionModel(CharNgramHasher(num_features=args.num_features))
+
+    print(f"🏋️ 학습 중: 학습 {len(train)}개, 검증 {len(holdout)}개")
+    start = time.perf_counter()
+    history = model.fit(
+        [sample['text'] for sample in train],
+        np.array([sample['scores'] for sample in train]),
+        epochs=args.epochs,
+        learning_rate=args.learning_rate
+    )
+    train_seconds = time.perf_counter() - start
+
+    holdout_texts = [sample['text'] for sample in holdout]
+    start = time.perf_counter()
+    student = model.predict_proba(holdout_texts)
+    latency_ms = (time.perf_counter() - start) * 1000 / len(holdout_texts)
+
+    teacher = np.array([sample['scores'] for sample in holdout], dtype=np.float64)
+    teacher = teacher / teacher.sum(axis=1, keepdims=True)
+
+    report = {
+        'samples': len(samples),
+        'train_seconds': round(train_seconds, 2),
+        'loss_history': [round(loss, 4) for loss in history],
+        'latency_ms_per_text': round(latency_ms, 3),
+        'agreement': agreement_report(student, teacher),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    passed = report['agreement']['top1_agreement'] >= args.min_agreement
+    if not passed and not args.force:
+        print(f"❌ 교사 일치율 기준 미달 ({args.min_agreement}), 모델을 저장하지 않습니다.")
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    model.save(args.output)
+    print(f"✅ 증류 모델 저장: {args.output} (emotion_model_type=distilled 또는 cascade_local_model=distilled로 사용)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+KoELECTRA 감정 분류 모델 ONNX 내보내기 + int8 양자화 + 정합성 검증 + 벤치마크
+
+1. HF 모델을 ONNX(fp32)로 내보내기 (배치/길이 동적 축)
+2. onnxruntime 동적 양자화로 가중치를 int8로 변환
+3. 같은 문장에 대해 PyTorch 확률과 비교 (최대 오차, 라벨 일치율)
+4. PyTorch fp32 vs ONNX int8 지연 시간/처리량 비교
+
+사용법:
+    python export_onnx_model.py --output onnx_models/koelectra-generalized
+    python export_onnx_model.py --skip-export --benchmark-runs 50   # 기존 모델로 검증만
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from config.settings import settings
+from services.onnx_inference import QUANTIZED_MODEL_FILENAME, create_inference_session, predict_probabilities
+
+MODEL_NAME = "Copycats/koelectra-base-v3-generalized-sentiment-analysis"
+FP32_MODEL_FILENAME = "model.onnx"
+
+# 정합성 기준 (int8 양자화 오차 허용 범위)
+MAX_PROBABILITY_DIFF = 0.05
+MIN_LABEL_AGREEMENT = 0.95
+
+# 정합성 검증/벤치마크용 일기 문장
+SAMPLE_TEXTS = [
+    "오늘은 친구들과 맛있는 저녁을 먹어서 정말 행복했다.",
+    "시험을 망쳐서 너무 속상하고 눈물이 났다.",
+    "버스가 30분이나 늦게 와서 짜증이 났다.",
+    "내일 발표가 있어서 걱정되고 불안하다.",
+    "길에서 우연히 초등학교 친구를 만나서 깜짝 놀랐다.",
+    "그냥 평범한 하루였다. 별일 없이 집에 왔다.",
+    "회사에서 칭찬을 받아서 뿌듯했지만 한편으로는 부담도 된다.",
+    "비가 와서 산책은 못 했지만 집에서 책을 읽으며 쉬었다.",
+    "오랜만에 가족들과 여행을 가서 즐거운 시간을 보냈다. 바다도 보고 맛있는 회도 먹었다.",
+    "몸이 아파서 하루 종일 누워 있었다. 아무것도 못 해서 답답하다.",
+]
+
+
+def export_onnx(model, tokenizer, output_dir: str) -> str:
+    """PyTorch 모델을 ONNX로 내보내기"""
+    fp32_path = os.path.join(output_dir, FP32_MODEL_FILENAME)
+    sample = tokenizer(SAMPLE_TEXTS[:2], return_tensors="pt", padding=True)
+    input_names = list(sample.keys())
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    torch.onnx.export(
+        model,
+        tuple(sample[name] for name in input_names),
+        fp32_path,
+        input_names=input_names,
+        output_names=["logits"],
+        dynamic_axes=dynamic_axes,
+        opset_version=14,
+        do_constant_folding=True,
+    )
+    print(f"✅ ONNX 내보내기 완료: {fp32_path}")
+    return fp32_path
+
+
+def quantize_onnx(fp32_path: str, output_dir: str) -> str:
+    """가중치 int8 동적 양자화"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_path = os.path.join(output_dir, QUANTIZED_MODEL_FILENAME)
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+
+    fp32_mb = os.path.getsize(fp32_path) / 1024 / 1024
+    int8_mb = os.path.getsize(int8_path) / 1024 / 1024
+    print(f"✅ int8 양자화 완료: {int8_path} ({fp32_mb:.1f}MB → {int8_mb:.1f}MB)")
+    return int8_path
+
+
+def torch_probabilities(model, tokenizer, texts: List[str]) -> np.ndarray:
+    """PyTorch 경로 확률 (KoELECTRAGeneralizedClassifier와 같은 전처리)"""
+    inputs = tokenizer(texts, return_tensors="pt", max_length=512, truncation=True, padding=True)
+    with torch.no_grad():
+        logits = model(**inputs).logits
+    return torch.softmax(logits, dim=-1).numpy()
+
+
+def check_parity(model, tokenizer, session) -> Dict:
+    """PyTorch fp32와 ONNX int8 결과 비교 (문장 단위로 실행해 패딩 영향 제거)"""
+    torch_probs = np.vstack([torch_probabilities(model, tokenizer, [text]) for text in SAMPLE_TEXTS])
+    onnx_probs = np.vstack([predict_probabilities(session, tokenizer, [text]) for text in SAMPLE_TEXTS])
+
+    max_diff = float(np.abs(torch_probs - onnx_probs).max())
+    agreement = float((torch_probs.argmax(axis=1) == onnx_probs.argmax(axis=1)).mean())
+    return {
+        'max_probability_diff': round(max_diff, 5),
+        'label_agreement': round(agreement, 4),
+        'passed': max_diff <= MAX_PROBABILITY_DIFF and agreement >= MIN_LABEL_AGREEMENT,
+    }
+
+
+def _measure(predict, runs: int, batch_size: int) -> Dict:
+    """단건 지연 시간과 배치 처리량 측정"""
+    predict([SAMPLE_TEXTS[0]])  # 워밍업
+
+    latencies = []
+    for i in range(runs):
+        text = SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]
+        start = time.perf_counter()
+        predict([text])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    batch = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(batch_size)]
+    start = time.perf_counter()
+    for _ in range(max(runs // batch_size, 1)):
+        predict(batch)
+    elapsed = time.perf_counter() - start
+    total = batch_size * max(runs // batch_size, 1)
+
+    return {
+        'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 2),
+        'throughput_per_second': round(total / elapsed, 2),
+    }
+
+
+def benchmark(model, tokenizer, session, runs: int, batch_size: int) -> Dict:
+    """PyTorch fp32 vs ONNX int8 비교"""
+    results = {
+        'pytorch_fp32': _measure(lambda texts: torch_probabilities(model, tokenizer, texts), runs, batch_size),
+        'onnx_int8': _measure(lambda texts: predict_probabilities(session, tokenizer, texts), runs, batch_size),
+    }
+    results['speedup_p50'] = round(results['pytorch_fp32']['p50_ms'] / results['onnx_int8']['p50_ms'], 2)
+    results['speedup_throughput'] = round(
+        results['onnx_int8']['throughput_per_second'] / results['pytorch_fp32']['throughput_per_second'], 2
+    )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KoELECTRA ONNX 내보내기 및 int8 양자화")
+    parser.add_argument("--model", default=MODEL_NAME, help="HF 모델 이름")
+    parser.add_argument("--output", default=settings.onnx_model_dir, help="출력 디렉토리")
+    parser.add_argument("--skip-export", action="store_true", help="기존 ONNX 모델로 검증/벤치마크만 실행")
+    parser.add_argument("--benchmark-runs", type=int, default=30, help="벤치마크 반복 횟수 (0이면 생략)")
+    parser.add_argument("--batch-size", type=int, default=8, help="처리량 측정 배치 크기")
+    parser.add_argument("--threads", type=int, default=settings.onnx_intra_op_threads, help="intra-op 스레드 수")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+
+    print(f"🤖 모델 로드 중: {args.model}")
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModelForSequenceClassification.from_pretrained(args.model)
+    model.eval()
+
+    if not args.skip_export:
+        fp32_path = export_onnx(model, tokenizer, args.output)
+        quantize_onnx(fp32_path, args.output)
+        # 런타임 분류기가 같은 디렉토리에서 토크나이저를 읽을 수 있도록 함께 저장
+        tokenizer.save_pretrained(args.output)
+
+    session = create_inference_session(os.path.join(args.output, QUANTIZED_MODEL_FILENAME), args.threads)
+
+    report = {'model': args.model, 'output': args.output, 'parity': check_parity(model, tokenizer, session)}
+    if args.benchmark_runs > 0:
+        report['benchmark'] = benchmark(model, tokenizer, session, args.benchmark_runs, args.batch_size)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if not report['parity']['passed']:
+        print(f"❌ 정합성 검증 실패 (최대 오차 {MAX_PROBABILITY_DIFF}, 라벨 일치율 {MIN_LABEL_AGREEMENT} 기준)")
+        return 1
+    print("✅ 정합성 검증 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
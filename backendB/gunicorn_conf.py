@@ -0,0 +1,57 @@
+"""
+프로덕션 실행 설정 (gunicorn preload + uvicorn 워커)
+
+    gunicorn -c gunicorn_conf.py
+
+마스터 프로세스에서 앱을 먼저 import하고 gc.freeze()로 그때까지 만든 객체를 GC 대상에서 뺀 뒤 fork합니다.
+워커는 import된 모듈 페이지를 copy-on-write로 공유하므로 워커를 늘려도 요청 처리에 필요한 메모리만 늘어납니다.
+
+backendB는 현재 규칙 기반 감정 분석 라우터만 제공하므로 마스터에서 미리 로드할 모델은 없습니다.
+로컬 분류기를 서빙하게 되면 when_ready에서 로드한 뒤 freeze하면 됩니다.
+"""
+import gc
+import logging
+import multiprocessing
+import os
+import sys
+
+logger = logging.getLogger("gunicorn.error")
+
+# 서버 설정
+wsgi_app = "main:app"
+bind = os.getenv("BIND", f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+graceful_timeout = 30
+preload_app = True
+
+# 워커별 torch 연산 스레드 수 (코어를 워커끼리 나눠 써서 스레드가 서로 경쟁하지 않도록 함)
+torch_threads = max(1, multiprocessing.cpu_count() // max(1, workers))
+
+# torch/OpenMP가 import되기 전에 설정해야 적용됨 (설정 파일은 앱보다 먼저 로드됨)
+for _name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_name, str(torch_threads))
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+# 앱 import 중 생기는 대량의 객체를 GC가 반복 스캔하지 않도록 fork 준비가 끝날 때까지 끔
+gc.disable()
+
+
+def when_ready(server):
+    """워커를 띄우기 직전 (preload_app이므로 앱은 이미 로드됨)"""
+    # 지금까지 만든 객체를 영구 세대로 옮겨서 워커의 GC가 건드리지 않도록 함
+    # (GC가 객체 헤더를 쓰면 그 페이지가 워커마다 복사됨)
+    gc.collect()
+    gc.freeze()
+    logger.info(f"GC 고정 객체 수: {gc.get_freeze_count()}")
+    # 마스터는 워커를 다시 띄우는 동안 계속 살아 있으므로 GC를 다시 켬
+    gc.enable()
+
+
+def post_fork(server, worker):
+    """워커 프로세스 초기화"""
+    gc.enable()
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(torch_threads)
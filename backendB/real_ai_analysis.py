@@ -25,11 +25,15 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("⚠️  OpenAI 라이브러리 없음")
 
+from services.model_registry import model_registry, register_pipeline
+
+EMOTION_MODEL_NAME = "j-hartmann/emotion-english-distilroberta-base"
+
 class MBTIStyleAIAnalyzer:
     """MBTI T/F 스타일을 지원하는 AI 분석기"""
     
     def __init__(self):
-        self.emotion_model = None
+        self.emotion_model_key = None
         self.openai_client = None
         self._setup_models()
     
@@ -44,24 +48,14 @@ class MBTIStyleAIAnalyzer:
         else:
             print("⚠️  OpenAI API 키 없음 - 환경변수 OPENAI_API_KEY 설정 필요")
         
-        # Hugging Face 모델 설정
+        # Hugging Face 모델 설정 (공용 레지스트리에 등록, 첫 분석 때 로드하고 다른 분석기와 공유)
         if TRANSFORMERS_AVAILABLE:
-            try:
-                print("🤖 감정 분석 모델 로딩 중...")
-                self.emotion_model = pipeline(
-                    "text-classification",
-                    model="j-hartmann/emotion-english-distilroberta-base",
-                    device=-1  # CPU 사용
-                )
-                print("✅ Hugging Face 감정 분석 모델 로딩 완료!")
-            except Exception as e:
-                print(f"❌ 모델 로딩 실패: {e}")
-                self.emotion_model = None
+            self.emotion_model_key = register_pipeline("text-classification", EMOTION_MODEL_NAME, device=-1)  # CPU 사용
     
     def analyze_emotion_with_ai(self, text: str) -> Dict[str, Any]:
         """실제 AI 모델로 감정 분석"""
         
-        if self.emotion_model:
+        if self.emotion_model_key:
             return self._analyze_with_huggingface(text)
         else:
             return self._analyze_with_simple_ai(text)
@@ -71,8 +65,9 @@ class MBTIStyleAIAnalyzer:
         try:
             print("🧠 Hugging Face AI 모델로 감정 분석 중...")
             
-            # 감정 분석 실행
-            results = self.emotion_model(text)
+            # 감정 분석 실행 (퇴출된 경우 레지스트리가 다시 로드)
+            with model_registry.use_sync(self.emotion_model_key) as emotion_model:
+                results = emotion_model(text)
             
             # 결과 처리
             if isinstance(results, list):
@@ -107,6 +102,9 @@ class MBTIStyleAIAnalyzer:
             
         except Exception as e:
             print(f"❌ Hugging Face 분석 실패: {e}")
+            if model_registry.peek(self.emotion_model_key) is None:
+                # 모델 로딩 자체가 실패했으면 이후에는 다시 시도하지 않음
+                self.emotion_model_key = None
             return self._analyze_with_simple_ai(text)
     
     def _analyze_with_simple_ai(self, text: str) -> Dict[str, Any]:
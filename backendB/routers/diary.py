@@ -128,21 +128,37 @@ async def batch_process_diaries(
         failed_count = 0
         results = []
         
+        # 내용이 있는 일기만 모아서 감정 분석은 한 번에 요청
+        valid_diaries = []
         for diary in diaries:
+            if not (diary.get("content") or "").strip():
+                failed_count += 1
+                continue
+            valid_diaries.append(diary)
+        
+        # 일괄 분석이 실패하면 일기별로 다시 분석해서 실패한 일기만 실패로 집계
+        try:
+            emotion_requests = [
+                EmotionAnalysisRequest(text=diary["content"], user_id=user_id)
+                for diary in valid_diaries
+            ]
+            emotion_results = await emotion_service.analyze_emotions_batch(emotion_requests)
+        except Exception as e:
+            logger.warning(f"감정 일괄 분석 실패, 일기별로 분석합니다: {e}")
+            emotion_results = [None] * len(valid_diaries)
+        
+        for diary, emotion_result in zip(valid_diaries, emotion_results):
             try:
                 diary_id = diary["id"]
-                diary_content = diary.get("content", "")
-                
-                if not diary_content.strip():
-                    failed_count += 1
-                    continue
+                diary_content = diary["content"]
                 
-                # 감정 분석
-                emotion_request = EmotionAnalysisRequest(
-                    text=diary_content,
-                    user_id=user_id
-                )
-                emotion_result = await emotion_service.analyze_emotion(emotion_request)
+                # 감정 분석 (일괄 분석 실패 시)
+                if emotion_result is None:
+                    emotion_request = EmotionAnalysisRequest(
+                        text=diary_content,
+                        user_id=user_id
+                    )
+                    emotion_result = await emotion_service.analyze_emotion(emotion_request)
                 
                 # 피드백 생성 (기본 공감형)
                 feedback_request = FeedbackGenerationRequest(
@@ -1,29 +1,179 @@
 """
 감정 분류 서비스
+
+torch와 transformers는 로컬 모델을 처음 로드할 때 import합니다.
+OpenAI만 사용하는 배포에서는 이 모듈을 import해도 두 패키지를 로드하지 않습니다.
 """
-import torch
 import numpy as np
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import logging
 from abc import ABC, abstractmethod
 import openai
 from openai import OpenAI
 import json
+import os
+import asyncio
 
 from models.emotion import EmotionLabel, EmotionScore, EmotionAnalysisResult
 from config.settings import settings
+from services.onnx_inference import QUANTIZED_MODEL_FILENAME, create_inference_session, predict_probabilities
+from services.text_chunker import aggregate_probabilities, chunk_text, split_sentence_spans
+from services.emotion_timeline import build_timeline
+from services.deadline_hedge import CircuitBreaker, hedged_call
+from services.llm_gateway import LANE_BATCH, LANE_INTERACTIVE, estimate_chat_tokens, llm_gateway
+from services.distilled_model import LinearEmotionModel
+from services.model_registry import model_registry
+from services.keyword_scoring import KeywordLexicon, find_keyword_hits, first_positions, sparse_scores
 
 logger = logging.getLogger(__name__)
 
+# OpenAI 일괄 감정 예측: 요청 하나에 묶는 텍스트 수와 항목당 응답 토큰 예산
+PACKED_BATCH_SIZE = 8
+PACKED_TOKENS_PER_ITEM = 120
+
+# 세부 감정 분류용 감정별 키워드 - 더 정확하고 세밀한 분류
+DETAILED_EMOTION_KEYWORDS = {
+    EmotionLabel.JOY: [
+        "기쁘", "행복", "즐거", "좋아", "사랑", "웃", "신나", "만족", "뿌듯", "설레", "감사",
+        "축하", "성공", "완벽", "최고", "멋져", "훌륭", "대단", "놀라운", "기대", "희망",
+        "고마워", "감동", "사랑해", "재미", "좋다", "최고다", "완전", "진짜 좋", "너무 좋",
+        "정말 좋", "마음에 들", "기분 좋", "행복해", "즐거워", "신이", "기뻐", "만족해",
+        "뿌듯해", "감사해", "고마워", "사랑스러", "예쁘", "멋있", "대박", "짱"
+    ],
+    EmotionLabel.SADNESS: [
+        "슬프", "우울", "눈물", "울", "힘들", "괴로", "아프", "서러", "막막", "절망", "실망",
+        "후회", "그리워", "외로", "쓸쓸", "비참", "허탈", "안타까", "가슴", "마음이 아프",
+        "그만두", "포기", "못하겠", "지쳐", "피곤", "스트레스", "안 좋", "최악", "망했",
+        "혼났", "꾸중", "야단", "책망", "서글", "애처로", "처량", "쓸쓸", "적적", "무력",
+        "의기소침", "낙담", "좌절", "침울", "우울해", "슬퍼", "아파", "힘들어", "어려워"
+    ],
+    EmotionLabel.ANGER: [
+        "화", "짜증", "분노", "열받", "빡쳐", "미쳐", "싫어", "증오", "혐오", "빡치", "욕",
+        "정말", "진짜", "완전", "너무", "욕먹", "비난", "문제", "잘못", "못해", "어이없",
+        "한심", "멍청", "바보", "화나", "짜증나", "열받아", "빡쳐", "미쳐", "싫어죽겠",
+        "화딱지", "약오르", "분통", "격분", "격노", "분개", "울분", "분함", "성나", "노여워"
+    ],
+    EmotionLabel.FEAR: [
+        "무서", "두려", "걱정", "불안", "염려", "떨려", "긴장", "조심", "위험", "겁", "공포",
+        "무서워", "두려워", "떨어", "심장", "조마조마", "불안해", "걱정돼", "염려돼", "떨려",
+        "긴장돼", "조심스러", "위험해", "겁나", "공포스러", "무시무시", "소름", "떨림", "전율"
+    ],
+    EmotionLabel.SURPRISE: [
+        "놀라", "신기", "와", "헉", "어", "대박", "세상", "믿을 수 없", "어떻게", "갑자기",
+        "예상", "뜻밖", "의외", "깜짝", "놀랍", "신기해", "와우", "우와", "어머", "이런",
+        "세상에", "대단해", "놀래", "깜짝", "엄청", "정말", "진짜", "허걱", "까무러칠"
+    ],
+    EmotionLabel.DISGUST: [
+        "더러", "역겨", "싫", "혐오", "구역", "토할", "지겨", "못 견디", "참을 수 없",
+        "끔찍", "불쾌", "짜증나", "지긋지긋", "더러워", "역겨워", "싫어", "혐오스러",
+        "구역질", "토할 것 같", "지겨워", "못 견디겠", "참을 수 없어", "끔찍해", "불쾌해"
+    ],
+    EmotionLabel.NEUTRAL: [
+        "그냥", "보통", "평범", "일반적", "그럭저럭", "그저", "별로", "음", "글쎄", "모르겠",
+        "그런가", "아무래도", "그런 것 같", "그런지", "그런데", "하지만", "그런데도"
+    ]
+}
+
+# 감정 강도 키워드 (감정을 강화하는 부사)와 강도별 배율
+INTENSITY_KEYWORDS = {
+    "high": ["너무", "정말", "진짜", "완전", "엄청", "매우", "극도로", "정말로", "진짜로", "완전히"],
+    "medium": ["좀", "조금", "약간", "다소", "어느 정도", "그런대로", "그럭저럭"],
+    "low": ["살짝", "조금씩", "약간씩", "가볍게", "조금만"]
+}
+INTENSITY_FACTORS = {"high": 1.5, "medium": 1.2, "low": 0.8}
+
+# 부정 키워드 (감정을 뒤집는 단어들)와 적용 거리 (감정 키워드 앞 10자 이내)
+NEGATION_KEYWORDS = ["안", "않", "못", "아니", "없", "말고", "아님", "절대", "전혀", "결코"]
+NEGATION_WINDOW = 10
+
+# 키워드 점수와 이진 분류 결과 결합 계수: (키워드 점수, 긍정 점수, 부정 점수, 상수)
+KEYWORD_MIX = {
+    EmotionLabel.JOY: (0.7, 0.3, 0.0, 0.0),
+    EmotionLabel.SADNESS: (0.7, 0.0, 0.3, 0.0),
+    EmotionLabel.ANGER: (0.7, 0.0, 0.3, 0.0),
+    EmotionLabel.FEAR: (0.7, 0.0, 0.3, 0.0),
+    EmotionLabel.SURPRISE: (0.8, 0.1, 0.1, 0.0),
+    EmotionLabel.DISGUST: (0.7, 0.0, 0.3, 0.0),
+    EmotionLabel.NEUTRAL: (0.6, 0.0, 0.0, 0.2),
+}
+# 키워드 매칭이 없을 때 이진 분류 결과만 사용하는 계수 (긍정 우세 / 부정 우세)
+POSITIVE_ONLY_MIX = {
+    EmotionLabel.JOY: (0.0, 0.7, 0.0, 0.0),
+    EmotionLabel.SADNESS: (0.0, 0.0, 0.3, 0.0),
+    EmotionLabel.ANGER: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.FEAR: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.SURPRISE: (0.0, 0.2, 0.0, 0.0),
+    EmotionLabel.DISGUST: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.NEUTRAL: (0.0, 0.0, 0.0, 0.3),
+}
+NEGATIVE_ONLY_MIX = {
+    EmotionLabel.JOY: (0.0, 0.4, 0.0, 0.0),
+    EmotionLabel.SADNESS: (0.0, 0.0, 0.4, 0.0),
+    EmotionLabel.ANGER: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.FEAR: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.SURPRISE: (0.0, 0.2, 0.0, 0.0),
+    EmotionLabel.DISGUST: (0.0, 0.0, 0.2, 0.0),
+    EmotionLabel.NEUTRAL: (0.0, 0.0, 0.0, 0.4),
+}
+
+# OpenAI 실패 시 폴백용 키워드 (위에서부터 먼저 매칭된 감정 사용)
+FALLBACK_KEYWORDS = {
+    EmotionLabel.JOY: ["기쁘", "행복", "즐거", "좋", "사랑"],
+    EmotionLabel.SADNESS: ["슬프", "우울", "눈물", "힘들"],
+    EmotionLabel.ANGER: ["화", "짜증", "분노", "열받"],
+    EmotionLabel.FEAR: ["무서", "두려", "걱정", "불안"],
+    EmotionLabel.SURPRISE: ["놀라", "신기", "와", "대박"],
+    EmotionLabel.DISGUST: ["더러", "역겨", "혐오"],
+}
+
+# 일괄 채점용 키워드 사전 (키워드 × 라벨 가중치 행렬)
+DETAILED_LEXICON = KeywordLexicon(DETAILED_EMOTION_KEYWORDS)
+INTENSITY_LEXICON = KeywordLexicon(INTENSITY_KEYWORDS)
+FALLBACK_LEXICON = KeywordLexicon(FALLBACK_KEYWORDS)
+
+class ModelBundle(NamedTuple):
+    """레지스트리에 등록하는 로컬 모델 묶음"""
+    tokenizer: Any
+    model: Any
+
+
 class EmotionClassifier(ABC):
     """감정 분류기 베이스 클래스"""
     
-    def __init__(self, model_name: str):
+    # 로컬 모델은 공용 레지스트리에 등록해서 프로세스당 한 벌만 유지 (퇴출되면 None)
+    registry_key: Optional[str] = None
+    
+    def __init__(self, model_name: str, device: Optional[str] = None):
         self.model_name = model_name
-        self.tokenizer = None
-        self.model = None
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self._device_name = device  # None이면 CUDA 사용 가능 여부로 결정
+        self._device = None
+    
+    @property
+    def device(self) -> Any:
+        """torch 추론 디바이스 (처음 접근할 때 torch를 import)"""
+        if self._device is None:
+            import torch
+            self._device = torch.device(self._device_name or ("cuda" if torch.cuda.is_available() else "cpu"))
+        return self._device
+    
+    def _register_model(self, registry_key: str) -> None:
+        """_load_bundle을 공용 레지스트리에 등록 (같은 키는 인스턴스끼리 공유)"""
+        self.registry_key = registry_key
+        model_registry.register(registry_key, self._load_bundle)
+    
+    def _load_bundle(self) -> ModelBundle:
+        """레지스트리가 처음 사용할 때 호출하는 모델 로더"""
+        raise NotImplementedError
+    
+    @property
+    def tokenizer(self) -> Any:
+        bundle = model_registry.peek(self.registry_key)
+        return bundle.tokenizer if bundle is not None else None
+    
+    @property
+    def model(self) -> Any:
+        bundle = model_registry.peek(self.registry_key)
+        return bundle.model if bundle is not None else None
         
     @abstractmethod
     async def load_model(self):
@@ -42,12 +192,23 @@ class OpenAIEmotionClassifier(EmotionClassifier):
     def __init__(self):
         super().__init__("openai-gpt-3.5-turbo")
         self.client = None
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.openai_breaker_failure_threshold,
+            reset_seconds=settings.openai_breaker_reset_seconds
+        )
+        self.hedge_requests = 0
+        self.hedge_wins = 0
         
     async def load_model(self):
         """OpenAI 클라이언트 초기화"""
         try:
             if settings.openai_api_key:
-                self.client = OpenAI(api_key=settings.openai_api_key)
+                # 재시도는 공용 게이트웨이가 담당 (클라이언트 자체 재시도 끔)
+                self.client = OpenAI(
+                    api_key=settings.openai_api_key,
+                    timeout=settings.openai_request_timeout_seconds,
+                    max_retries=0
+                )
                 logger.info("OpenAI 감정 분류기 초기화 완료")
             else:
                 raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
@@ -56,7 +217,59 @@ class OpenAIEmotionClassifier(EmotionClassifier):
             raise
     
     async def predict(self, text: str) -> EmotionAnalysisResult:
-        """OpenAI API를 사용한 감정 예측"""
+        """
+        OpenAI API를 사용한 감정 예측 (응답 시간 제한 모드)
+        
+        openai_hedge_deadline_seconds 안에 OpenAI 결과가 없으면 로컬 분류기를 동시에 실행해
+        먼저 나온 사용 가능한 결과를 반환합니다. 마감 초과가 반복되면 회로 차단기가 열려
+        일정 시간 동안 OpenAI를 호출하지 않고 로컬 분류기로 바로 분석합니다.
+        """
+        deadline = settings.openai_hedge_deadline_seconds
+        if deadline <= 0:
+            return await self._predict_remote(text)
+        
+        if not self.breaker.allow():
+            return await self._predict_local(text)
+        
+        try:
+            outcome = await hedged_call(
+                lambda: self._predict_remote(text),
+                lambda: self._predict_local(text),
+                deadline,
+                accept=lambda result: not result.model_used.startswith("fallback")
+            )
+        except BaseException:
+            # 요청이 취소되거나 예상하지 못한 오류로 끝나도 half-open 시험 호출 표시가 남지 않도록 해제
+            self.breaker.record_cancel()
+            raise
+        if outcome.primary_on_time:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        if outcome.source == "hedge":
+            self.hedge_wins += 1
+        self.hedge_requests += int(not outcome.primary_on_time)
+        return outcome.result
+    
+    async def _predict_local(self, text: str) -> EmotionAnalysisResult:
+        """헤지/회로 차단 시 사용할 로컬 분류기 (keyword는 모델 로딩 없이 즉시 반환)"""
+        local_classifier = local_classifiers.get(settings.openai_hedge_local_model)
+        if local_classifier is not None:
+            return await local_classifier.predict(text)
+        return self._fallback_analysis(text)
+    
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """마감 초과 헤지 횟수, 로컬 결과 채택 횟수, 회로 차단기 상태"""
+        return {
+            'deadline_seconds': settings.openai_hedge_deadline_seconds,
+            'local_model': settings.openai_hedge_local_model,
+            'hedged': self.hedge_requests,
+            'hedge_wins': self.hedge_wins,
+            'breaker': self.breaker.stats(),
+        }
+    
+    async def _predict_remote(self, text: str, lane: str = LANE_INTERACTIVE) -> EmotionAnalysisResult:
+        """OpenAI 호출 (공용 게이트웨이를 거쳐 스레드에서 실행, 실패 시 키워드 폴백)"""
         if self.client is None:
             await self.load_model()
         
@@ -96,14 +309,20 @@ class OpenAIEmotionClassifier(EmotionClassifier):
             if self.client is None:
                 raise ValueError("OpenAI 클라이언트가 초기화되지 않았습니다.")
             
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "당신은 한국어 텍스트의 감정을 정확히 분석하는 전문가입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=300
+            messages = [
+                {"role": "system", "content": "당신은 한국어 텍스트의 감정을 정확히 분석하는 전문가입니다."},
+                {"role": "user", "content": prompt}
+            ]
+            response = await llm_gateway.run(
+                lambda: asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=300
+                ),
+                lane=lane,
+                estimated_tokens=estimate_chat_tokens(messages, 300)
             )
             
             # 응답 파싱
@@ -116,45 +335,7 @@ class OpenAIEmotionClassifier(EmotionClassifier):
             # JSON 응답 파싱
             try:
                 result_json = json.loads(response_text)
-                primary_emotion_str = result_json["primary_emotion"]
-                confidence = result_json["confidence"]
-                emotion_scores = result_json["emotions"]
-                
-                # 감정 라벨 매핑
-                emotion_label_map = {
-                    "JOY": EmotionLabel.JOY,
-                    "SADNESS": EmotionLabel.SADNESS,
-                    "ANGER": EmotionLabel.ANGER,
-                    "FEAR": EmotionLabel.FEAR,
-                    "SURPRISE": EmotionLabel.SURPRISE,
-                    "DISGUST": EmotionLabel.DISGUST,
-                    "NEUTRAL": EmotionLabel.NEUTRAL
-                }
-                
-                primary_emotion = emotion_label_map[primary_emotion_str]
-                primary_emotion_score = emotion_scores[primary_emotion_str]
-                primary_emotion_emoji = self._get_emotion_emoji(primary_emotion)
-                
-                # 모든 감정 점수 생성
-                all_emotions = []
-                for emotion_str, score in emotion_scores.items():
-                    emotion = emotion_label_map[emotion_str]
-                    emoji = self._get_emotion_emoji(emotion)
-                    all_emotions.append(EmotionScore(
-                        emotion=emotion,
-                        score=score,
-                        emoji=emoji
-                    ))
-                
-                return EmotionAnalysisResult(
-                    text=text,
-                    primary_emotion=primary_emotion,
-                    primary_emotion_score=primary_emotion_score,
-                    primary_emotion_emoji=primary_emotion_emoji,
-                    all_emotions=all_emotions,
-                    model_used="openai-gpt-3.5-turbo",
-                    confidence=confidence
-                )
+                return self._build_result(text, result_json)
                 
             except json.JSONDecodeError:
                 logger.error(f"OpenAI 응답 JSON 파싱 실패: {response_text}")
@@ -166,53 +347,183 @@ class OpenAIEmotionClassifier(EmotionClassifier):
             # 폴백: 기본 감정 분석
             return self._fallback_analysis(text)
     
-    def _fallback_analysis(self, text: str) -> EmotionAnalysisResult:
-        """OpenAI 실패 시 폴백 감정 분석"""
-        # 간단한 키워드 기반 분석
-        text_lower = text.lower()
-        
-        if any(keyword in text_lower for keyword in ["기쁘", "행복", "즐거", "좋", "사랑"]):
-            primary_emotion = EmotionLabel.JOY
-            primary_score = 0.7
-        elif any(keyword in text_lower for keyword in ["슬프", "우울", "눈물", "힘들"]):
-            primary_emotion = EmotionLabel.SADNESS
-            primary_score = 0.7
-        elif any(keyword in text_lower for keyword in ["화", "짜증", "분노", "열받"]):
-            primary_emotion = EmotionLabel.ANGER
-            primary_score = 0.7
-        elif any(keyword in text_lower for keyword in ["무서", "두려", "걱정", "불안"]):
-            primary_emotion = EmotionLabel.FEAR
-            primary_score = 0.7
-        elif any(keyword in text_lower for keyword in ["놀라", "신기", "와", "대박"]):
-            primary_emotion = EmotionLabel.SURPRISE
-            primary_score = 0.7
-        elif any(keyword in text_lower for keyword in ["더러", "역겨", "혐오"]):
-            primary_emotion = EmotionLabel.DISGUST
-            primary_score = 0.7
-        else:
-            primary_emotion = EmotionLabel.NEUTRAL
-            primary_score = 0.6
+    async def predict_batch(self, texts: List[str], pack_size: int = PACKED_BATCH_SIZE) -> List[EmotionAnalysisResult]:
+        """
+        여러 텍스트를 묶어서 감정 예측 (입력 순서대로 결과 반환)
+        
+        pack_size개씩 하나의 요청에 담아 지시문을 한 번만 보내고, 인덱스가 붙은 JSON 배열로 응답을 받습니다.
+        응답에서 빠졌거나 형식이 잘못된 항목만 predict()로 개별 재요청합니다.
+        """
+        if self.client is None:
+            await self.load_model()
+        
+        results: List[Optional[EmotionAnalysisResult]] = [None] * len(texts)
+        failed_indices = []
+        request_count = 0
+        
+        for start in range(0, len(texts), pack_size):
+            indices = list(range(start, min(start + pack_size, len(texts))))
+            request_count += 1
+            try:
+                items = await self._request_packed([texts[i] for i in indices])
+            except Exception as e:
+                logger.error(f"OpenAI 일괄 감정 예측 실패 ({len(indices)}개): {e}")
+                items = {}
+            
+            for local_index, text_index in enumerate(indices):
+                item = items.get(local_index)
+                if item is not None:
+                    try:
+                        results[text_index] = self._build_result(texts[text_index], item)
+                        continue
+                    except (KeyError, TypeError, ValueError) as e:
+                        logger.warning(f"일괄 응답 항목 {local_index} 파싱 실패: {e}")
+                failed_indices.append(text_index)
+        
+        # 실패한 항목만 개별 재요청 (일괄 처리 레인 유지)
+        for text_index in failed_indices:
+            results[text_index] = await self._predict_remote(texts[text_index], lane=LANE_BATCH)
+        
+        logger.info(
+            f"OpenAI 일괄 감정 예측 완료: {len(texts)}개 텍스트, "
+            f"묶음 요청 {request_count}회 + 개별 재요청 {len(failed_indices)}회"
+        )
+        return results
+    
+    async def _request_packed(self, texts: List[str]) -> Dict[int, dict]:
+        """텍스트 묶음을 한 번의 요청으로 분석하고 {인덱스: 결과 JSON} 반환"""
+        diaries = "\n".join(
+            f"[{index}] {json.dumps(text, ensure_ascii=False)}" for index, text in enumerate(texts)
+        )
+        prompt = f"""
+다음은 번호가 붙은 {len(texts)}개의 한국어 텍스트입니다. 각 텍스트의 감정을 분석해주세요.
+7가지 감정(JOY, SADNESS, ANGER, FEAR, SURPRISE, DISGUST, NEUTRAL) 중 하나로 분류하고,
+각 감정의 확률을 0.0-1.0 사이로 제공해주세요.
+
+{diaries}
+
+응답은 모든 번호에 대해 다음 JSON 형식으로만 제공해주세요:
+{{
+    "results": [
+        {{
+            "index": 0,
+            "primary_emotion": "JOY",
+            "confidence": 0.85,
+            "emotions": {{"JOY": 0.85, "SADNESS": 0.05, "ANGER": 0.03, "FEAR": 0.02, "SURPRISE": 0.02, "DISGUST": 0.01, "NEUTRAL": 0.02}}
+        }}
+    ]
+}}
+"""
+        messages = [
+            {"role": "system", "content": "당신은 한국어 텍스트의 감정을 정확히 분석하는 전문가입니다."},
+            {"role": "user", "content": prompt}
+        ]
+        max_tokens = PACKED_TOKENS_PER_ITEM * len(texts) + 50
+        response = await llm_gateway.run(
+            lambda: asyncio.to_thread(
+                self.client.chat.completions.create,
+                model="gpt-3.5-turbo",
+                messages=messages,
+                temperature=0.3,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            ),
+            lane=LANE_BATCH,
+            estimated_tokens=estimate_chat_tokens(messages, max_tokens)
+        )
+        
+        response_content = response.choices[0].message.content
+        if response_content is None:
+            raise ValueError("OpenAI 응답이 비어있습니다.")
+        
+        items = {}
+        for item in json.loads(response_content).get("results", []):
+            if isinstance(item, dict) and isinstance(item.get("index"), int) and 0 <= item["index"] < len(texts):
+                items[item["index"]] = item
+        return items
+    
+    def _build_result(self, text: str, result_json: dict) -> EmotionAnalysisResult:
+        """OpenAI 응답 JSON을 분석 결과로 변환 (형식이 잘못되면 KeyError/ValueError)"""
+        primary_emotion_str = result_json["primary_emotion"]
+        confidence = float(result_json["confidence"])
+        emotion_scores = result_json["emotions"]
         
+        # 감정 라벨 매핑
+        emotion_label_map = {
+            "JOY": EmotionLabel.JOY,
+            "SADNESS": EmotionLabel.SADNESS,
+            "ANGER": EmotionLabel.ANGER,
+            "FEAR": EmotionLabel.FEAR,
+            "SURPRISE": EmotionLabel.SURPRISE,
+            "DISGUST": EmotionLabel.DISGUST,
+            "NEUTRAL": EmotionLabel.NEUTRAL
+        }
+        
+        primary_emotion = emotion_label_map[primary_emotion_str]
+        primary_emotion_score = float(emotion_scores[primary_emotion_str])
+        primary_emotion_emoji = self._get_emotion_emoji(primary_emotion)
+        
+        # 모든 감정 점수 생성
         all_emotions = []
-        for emotion in EmotionLabel:
-            score = primary_score if emotion == primary_emotion else 0.3 / 6
+        for emotion_str, score in emotion_scores.items():
+            emotion = emotion_label_map[emotion_str]
             emoji = self._get_emotion_emoji(emotion)
             all_emotions.append(EmotionScore(
                 emotion=emotion,
-                score=score,
+                score=float(score),
                 emoji=emoji
             ))
         
         return EmotionAnalysisResult(
             text=text,
             primary_emotion=primary_emotion,
-            primary_emotion_score=primary_score,
-            primary_emotion_emoji=self._get_emotion_emoji(primary_emotion),
+            primary_emotion_score=primary_emotion_score,
+            primary_emotion_emoji=primary_emotion_emoji,
             all_emotions=all_emotions,
-            model_used="fallback-keyword",
-            confidence=0.6
+            model_used="openai-gpt-3.5-turbo",
+            confidence=confidence
         )
     
+    def _fallback_analysis(self, text: str) -> EmotionAnalysisResult:
+        """OpenAI 실패 시 폴백 감정 분석"""
+        return self._fallback_analysis_batch([text])[0]
+    
+    def _fallback_analysis_batch(self, texts: List[str]) -> List[EmotionAnalysisResult]:
+        """간단한 키워드 기반 폴백 감정 분석 (여러 텍스트를 한 번에 채점)"""
+        matched = FALLBACK_LEXICON.score(texts) > 0
+        has_match = matched.any(axis=1)
+        first_match = matched.argmax(axis=1)
+        
+        results = []
+        for text, found, column in zip(texts, has_match, first_match):
+            if found:
+                primary_emotion = FALLBACK_LEXICON.labels[column]
+                primary_score = 0.7
+            else:
+                primary_emotion = EmotionLabel.NEUTRAL
+                primary_score = 0.6
+            
+            all_emotions = []
+            for emotion in EmotionLabel:
+                score = primary_score if emotion == primary_emotion else 0.3 / 6
+                emoji = self._get_emotion_emoji(emotion)
+                all_emotions.append(EmotionScore(
+                    emotion=emotion,
+                    score=score,
+                    emoji=emoji
+                ))
+            
+            results.append(EmotionAnalysisResult(
+                text=text,
+                primary_emotion=primary_emotion,
+                primary_emotion_score=primary_score,
+                primary_emotion_emoji=self._get_emotion_emoji(primary_emotion),
+                all_emotions=all_emotions,
+                model_used="fallback-keyword",
+                confidence=0.6
+            ))
+        return results
+    
     def _get_emotion_emoji(self, emotion: EmotionLabel) -> str:
         """감정에 해당하는 이모지 반환"""
         emotion_emoji_map = {
@@ -230,44 +541,40 @@ class OpenAIEmotionClassifier(EmotionClassifier):
 class KoELECTRAGeneralizedClassifier(EmotionClassifier):
     """일반화된 KoELECTRA 감정 분류기 (오프라인 대안)"""
     
+    model_used = "koelectra-generalized"
+    
     def __init__(self):
         super().__init__("Copycats/koelectra-base-v3-generalized-sentiment-analysis")
+        # 디바이스를 확인하려면 torch를 import해야 하므로 키에는 넣지 않음 (프로세스당 디바이스는 하나)
+        self._register_model(f"koelectra:{self.model_name}")
         
     async def load_model(self):
-        """KoELECTRA 일반화 모델 로드"""
+        """KoELECTRA 일반화 모델 로드 (레지스트리에 이미 있으면 공유 사본 사용)"""
         try:
-            logger.info(f"KoELECTRA 일반화 모델 로딩 시작: {self.model_name}")
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            self.model.eval()
-            logger.info("KoELECTRA 일반화 모델 로딩 완료")
+            await model_registry.preload(self.registry_key)
         except Exception as e:
             logger.error(f"KoELECTRA 일반화 모델 로딩 실패: {e}")
             raise
     
+    def _load_bundle(self) -> ModelBundle:
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+        model.to(self.device)
+        model.eval()
+        return ModelBundle(tokenizer, model)
+    
     async def predict(self, text: str) -> EmotionAnalysisResult:
         """KoELECTRA 일반화 모델을 사용한 감정 예측"""
-        if self.model is None or self.tokenizer is None:
-            await self.load_model()
-        
+        # 예측하는 동안 모델이 퇴출되지 않도록 사용 중으로 표시 (필요하면 로드)
+        async with model_registry.use(self.registry_key):
+            return self._predict_result(text)
+    
+    def _predict_result(self, text: str) -> EmotionAnalysisResult:
         try:
-            # 텍스트 토크나이징
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                max_length=512,
-                truncation=True,
-                padding=True
-            )
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
             # 예측 수행
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-                probabilities = torch.softmax(logits, dim=-1)
-                probabilities = probabilities.cpu().numpy()[0]
+            probabilities = self._predict_probabilities(text)
             
             # 이진 분류 결과를 7개 감정으로 매핑
             negative_score = float(probabilities[0])
@@ -302,7 +609,7 @@ class KoELECTRAGeneralizedClassifier(EmotionClassifier):
                 primary_emotion_score=primary_emotion_score,
                 primary_emotion_emoji=primary_emotion_emoji,
                 all_emotions=all_emotions,
-                model_used="koelectra-generalized",
+                model_used=self.model_used,
                 confidence=confidence
             )
             
@@ -310,149 +617,124 @@ class KoELECTRAGeneralizedClassifier(EmotionClassifier):
             logger.error(f"KoELECTRA 일반화 감정 예측 실패: {e}")
             raise
     
+    async def predict_timeline(self, text: str) -> Dict[str, Any]:
+        """
+        문장별 감정 흐름 예측
+        
+        문장마다 predict()를 호출하지 않고, 모든 문장을 한 번의 패딩 배치로 분류한 뒤
+        세부 감정 키워드 채점도 한 번에 계산합니다. 반환 형식은 emotion_timeline.build_timeline 참고.
+        """
+        spans = split_sentence_spans(text)
+        if not spans:
+            return build_timeline([], [])
+        
+        sentences = [text[start:end] for start, end in spans]
+        async with model_registry.use(self.registry_key):
+            probabilities = self._predict_batch(sentences)
+        sentence_scores = self._analyze_detailed_emotion_batch(
+            sentences, probabilities[:, 0].tolist(), probabilities[:, 1].tolist()
+        )
+        return build_timeline(spans, sentence_scores)
+    
+    def _predict_probabilities(self, text: str) -> np.ndarray:
+        """
+        [부정, 긍정] 확률 계산
+        
+        512 토큰을 넘는 긴 일기는 문장 단위 구간으로 나눠 한 번의 배치로 추론하고,
+        구간별 확률을 토큰 수로 가중 평균합니다.
+        """
+        chunks = chunk_text(text, self.tokenizer)
+        if len(chunks) <= 1:
+            return self._predict_batch([text])[0]
+        
+        probabilities = self._predict_batch([chunk.text for chunk in chunks])
+        logger.info(f"긴 텍스트를 {len(chunks)}개 구간으로 나눠 분석했습니다.")
+        return aggregate_probabilities(probabilities, chunks)
+    
+    def _predict_batch(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록의 [부정, 긍정] 확률을 한 번의 배치로 계산 (PyTorch)"""
+        # 텍스트 토크나이징
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            max_length=512,
+            truncation=True,
+            padding=True
+        )
+        import torch
+        
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            logits = outputs.logits
+            probabilities = torch.softmax(logits, dim=-1)
+            return probabilities.cpu().numpy()
+    
     def _analyze_detailed_emotion(self, text: str, negative_score: float, positive_score: float) -> Dict[EmotionLabel, float]:
         """텍스트 분석을 통한 세부 감정 분류 (개선된 버전)"""
-        text_lower = text.lower()
-        
-        # 개선된 감정별 키워드 - 더 정확하고 세밀한 분류
-        emotion_keywords = {
-            EmotionLabel.JOY: [
-                "기쁘", "행복", "즐거", "좋아", "사랑", "웃", "신나", "만족", "뿌듯", "설레", "감사",
-                "축하", "성공", "완벽", "최고", "멋져", "훌륭", "대단", "놀라운", "기대", "희망",
-                "고마워", "감동", "사랑해", "재미", "좋다", "최고다", "완전", "진짜 좋", "너무 좋",
-                "정말 좋", "마음에 들", "기분 좋", "행복해", "즐거워", "신이", "기뻐", "만족해",
-                "뿌듯해", "감사해", "고마워", "사랑스러", "예쁘", "멋있", "대박", "짱"
-            ],
-            EmotionLabel.SADNESS: [
-                "슬프", "우울", "눈물", "울", "힘들", "괴로", "아프", "서러", "막막", "절망", "실망",
-                "후회", "그리워", "외로", "쓸쓸", "비참", "허탈", "안타까", "가슴", "마음이 아프",
-                "그만두", "포기", "못하겠", "지쳐", "피곤", "스트레스", "안 좋", "최악", "망했",
-                "혼났", "꾸중", "야단", "책망", "서글", "애처로", "처량", "쓸쓸", "적적", "무력",
-                "의기소침", "낙담", "좌절", "침울", "우울해", "슬퍼", "아파", "힘들어", "어려워"
-            ],
-            EmotionLabel.ANGER: [
-                "화", "짜증", "분노", "열받", "빡쳐", "미쳐", "싫어", "증오", "혐오", "빡치", "욕",
-                "정말", "진짜", "완전", "너무", "욕먹", "비난", "문제", "잘못", "못해", "어이없",
-                "한심", "멍청", "바보", "화나", "짜증나", "열받아", "빡쳐", "미쳐", "싫어죽겠",
-                "화딱지", "약오르", "분통", "격분", "격노", "분개", "울분", "분함", "성나", "노여워"
-            ],
-            EmotionLabel.FEAR: [
-                "무서", "두려", "걱정", "불안", "염려", "떨려", "긴장", "조심", "위험", "겁", "공포",
-                "무서워", "두려워", "떨어", "심장", "조마조마", "불안해", "걱정돼", "염려돼", "떨려",
-                "긴장돼", "조심스러", "위험해", "겁나", "공포스러", "무시무시", "소름", "떨림", "전율"
-            ],
-            EmotionLabel.SURPRISE: [
-                "놀라", "신기", "와", "헉", "어", "대박", "세상", "믿을 수 없", "어떻게", "갑자기",
-                "예상", "뜻밖", "의외", "깜짝", "놀랍", "신기해", "와우", "우와", "어머", "이런",
-                "세상에", "대단해", "놀래", "깜짝", "엄청", "정말", "진짜", "허걱", "까무러칠"
-            ],
-            EmotionLabel.DISGUST: [
-                "더러", "역겨", "싫", "혐오", "구역", "토할", "지겨", "못 견디", "참을 수 없",
-                "끔찍", "불쾌", "짜증나", "지긋지긋", "더러워", "역겨워", "싫어", "혐오스러",
-                "구역질", "토할 것 같", "지겨워", "못 견디겠", "참을 수 없어", "끔찍해", "불쾌해"
-            ],
-            EmotionLabel.NEUTRAL: [
-                "그냥", "보통", "평범", "일반적", "그럭저럭", "그저", "별로", "음", "글쎄", "모르겠",
-                "그런가", "아무래도", "그런 것 같", "그런지", "그런데", "하지만", "그런데도"
-            ]
-        }
+        return self._analyze_detailed_emotion_batch([text], [negative_score], [positive_score])[0]
+    
+    def _analyze_detailed_emotion_batch(
+        self,
+        texts: List[str],
+        negative_scores: List[float],
+        positive_scores: List[float]
+    ) -> List[Dict[EmotionLabel, float]]:
+        """
+        여러 텍스트의 세부 감정 분류를 행렬 연산으로 한 번에 계산
         
-        # 감정 강도 키워드 (감정을 강화하는 부사)
-        intensity_keywords = {
-            "high": ["너무", "정말", "진짜", "완전", "엄청", "매우", "극도로", "정말로", "진짜로", "완전히"],
-            "medium": ["좀", "조금", "약간", "다소", "어느 정도", "그런대로", "그럭저럭"],
-            "low": ["살짝", "조금씩", "약간씩", "가볍게", "조금만"]
-        }
+        키워드 적중마다 강도 부사 배율을 곱하고, 앞 10자 이내에 부정어가 있으면 -0.5배로 뒤집은 뒤
+        감정별로 합산합니다. 이후 이진 분류 결과와 결합해서 정규화합니다.
+        """
+        hits = DETAILED_LEXICON.find_hits(texts)
         
-        # 부정 키워드 (감정을 뒤집는 단어들)
-        negation_keywords = ["안", "않", "못", "아니", "없", "말고", "아님", "절대", "전혀", "결코"]
-        
-        # 키워드 매칭 및 강도 계산
-        emotion_scores = {}
-        for emotion, keywords in emotion_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    base_score = 1
-                    
-                    # 강도 수정자 적용
-                    for intensity_type, intensity_words in intensity_keywords.items():
-                        for intensity_word in intensity_words:
-                            if intensity_word in text_lower:
-                                if intensity_type == "high":
-                                    base_score *= 1.5
-                                elif intensity_type == "medium":
-                                    base_score *= 1.2
-                                elif intensity_type == "low":
-                                    base_score *= 0.8
-                    
-                    # 부정 키워드 확인
-                    negated = False
-                    for neg_keyword in negation_keywords:
-                        if neg_keyword in text_lower:
-                            # 부정 키워드가 감정 키워드 앞에 있는지 확인
-                            neg_pos = text_lower.find(neg_keyword)
-                            keyword_pos = text_lower.find(keyword)
-                            if neg_pos < keyword_pos and keyword_pos - neg_pos < 10:  # 10자 이내
-                                negated = True
-                                break
-                    
-                    if negated:
-                        base_score *= -0.5  # 부정된 감정은 반대 감정으로 약간 이동
-                    
-                    score += base_score
-            
-            emotion_scores[emotion] = max(0, score)  # 음수 점수는 0으로 처리
+        # 강도 수정자: 텍스트에 있는 강도 부사마다 배율을 곱함
+        intensity_counts = INTENSITY_LEXICON.score(texts)
+        factors = np.array([INTENSITY_FACTORS[label] for label in INTENSITY_LEXICON.labels])
+        intensity = np.prod(factors ** intensity_counts, axis=1)
         
-        # 전체 키워드 매칭 수
-        total_keyword_matches = sum(emotion_scores.values())
+        # 부정 키워드가 감정 키워드 앞 10자 이내에 있는지 확인
+        negation_positions = first_positions(find_keyword_hits(texts, NEGATION_KEYWORDS), len(NEGATION_KEYWORDS))
+        negated = np.zeros(hits.docs.size, dtype=bool)
+        for column in range(len(NEGATION_KEYWORDS)):
+            negation_position = negation_positions[hits.docs, column]
+            negated |= (
+                (negation_position >= 0)
+                & (negation_position < hits.positions)
+                & (hits.positions - negation_position < NEGATION_WINDOW)
+            )
         
-        # 최종 감정 점수 계산
-        final_scores = {}
+        # 부정된 감정은 반대 감정으로 약간 이동, 음수 점수는 0으로 처리
+        values = intensity[hits.docs] * np.where(negated, -0.5, 1.0)
+        keyword_scores = np.maximum(sparse_scores(hits, DETAILED_LEXICON.weights, values), 0)
         
-        if total_keyword_matches > 0:
-            # 키워드 매칭이 있는 경우
-            for emotion in EmotionLabel:
-                keyword_score = emotion_scores.get(emotion, 0) / total_keyword_matches
-                
-                # 이진 분류 결과와 결합 (가중치 조정)
-                if emotion in [EmotionLabel.SADNESS, EmotionLabel.ANGER, EmotionLabel.FEAR, EmotionLabel.DISGUST]:
-                    final_scores[emotion] = keyword_score * 0.7 + negative_score * 0.3
-                elif emotion == EmotionLabel.JOY:
-                    final_scores[emotion] = keyword_score * 0.7 + positive_score * 0.3
-                elif emotion == EmotionLabel.SURPRISE:
-                    final_scores[emotion] = keyword_score * 0.8 + (positive_score + negative_score) * 0.1
-                else:  # NEUTRAL
-                    final_scores[emotion] = keyword_score * 0.6 + 0.2
-        else:
-            # 키워드 매칭이 없는 경우 이진 분류 결과만 사용
-            if positive_score > negative_score:
-                final_scores[EmotionLabel.JOY] = positive_score * 0.7
-                final_scores[EmotionLabel.SURPRISE] = positive_score * 0.2
-                final_scores[EmotionLabel.NEUTRAL] = 0.3
-                final_scores[EmotionLabel.SADNESS] = negative_score * 0.3
-                final_scores[EmotionLabel.ANGER] = negative_score * 0.2
-                final_scores[EmotionLabel.FEAR] = negative_score * 0.2
-                final_scores[EmotionLabel.DISGUST] = negative_score * 0.2
-            else:
-                final_scores[EmotionLabel.SADNESS] = negative_score * 0.4
-                final_scores[EmotionLabel.ANGER] = negative_score * 0.2
-                final_scores[EmotionLabel.FEAR] = negative_score * 0.2
-                final_scores[EmotionLabel.DISGUST] = negative_score * 0.2
-                final_scores[EmotionLabel.JOY] = positive_score * 0.4
-                final_scores[EmotionLabel.SURPRISE] = positive_score * 0.2
-                final_scores[EmotionLabel.NEUTRAL] = 0.4
-        
-        # 점수 정규화
-        total_score = sum(final_scores.values())
-        if total_score > 0:
-            final_scores = {k: v / total_score for k, v in final_scores.items()}
-        else:
-            # 모든 점수가 0인 경우 중성으로 처리
-            final_scores = {emotion: 0.0 for emotion in EmotionLabel}
-            final_scores[EmotionLabel.NEUTRAL] = 1.0
+        # 이진 분류 결과와 결합 (키워드 매칭이 없으면 이진 분류 결과만 사용)
+        labels = DETAILED_LEXICON.labels
+        negative = np.asarray(negative_scores, dtype=np.float64)[:, None]
+        positive = np.asarray(positive_scores, dtype=np.float64)[:, None]
+        total_keyword_matches = keyword_scores.sum(axis=1, keepdims=True)
+        keyword_ratio = keyword_scores / np.where(total_keyword_matches > 0, total_keyword_matches, 1)
         
-        return final_scores
+        def mix(coefficients: Dict[EmotionLabel, Tuple[float, float, float, float]]) -> np.ndarray:
+            table = np.array([coefficients[label] for label in labels])
+            return keyword_ratio * table[:, 0] + positive * table[:, 1] + negative * table[:, 2] + table[:, 3]
+        
+        final_scores = np.where(
+            total_keyword_matches > 0,
+            mix(KEYWORD_MIX),
+            np.where(positive > negative, mix(POSITIVE_ONLY_MIX), mix(NEGATIVE_ONLY_MIX))
+        )
+        
+        # 점수 정규화 (모든 점수가 0인 경우 중성으로 처리)
+        totals = final_scores.sum(axis=1, keepdims=True)
+        neutral = np.array([label == EmotionLabel.NEUTRAL for label in labels], dtype=np.float64)
+        final_scores = np.where(totals > 0, final_scores / np.where(totals > 0, totals, 1), neutral)
+        
+        return [
+            {label: float(score) for label, score in zip(labels, row)}
+            for row in final_scores
+        ]
     
     def _get_emotion_emoji(self, emotion: EmotionLabel) -> str:
         """감정에 해당하는 이모지 반환"""
@@ -467,6 +749,123 @@ class KoELECTRAGeneralizedClassifier(EmotionClassifier):
         }
         return emotion_emoji_map.get(emotion, "❓")
 
+class ONNXKoELECTRAClassifier(KoELECTRAGeneralizedClassifier):
+    """
+    ONNX Runtime int8 KoELECTRA 감정 분류기 (CPU 전용)
+    
+    export_onnx_model.py로 내보내고 양자화한 모델을 사용하며,
+    토크나이저와 세부 감정 매핑은 PyTorch 버전과 동일합니다.
+    """
+    
+    model_used = "koelectra-generalized-onnx-int8"
+    
+    def __init__(self, model_dir: str = settings.onnx_model_dir):
+        super().__init__()
+        self.model_dir = model_dir
+        self._device_name = "cpu"
+        self._register_model(f"koelectra-onnx:{model_dir}")
+    
+    def _load_bundle(self) -> ModelBundle:
+        """양자화된 ONNX 모델과 토크나이저 로드"""
+        model_path = os.path.join(self.model_dir, QUANTIZED_MODEL_FILENAME)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX 모델이 없습니다: {model_path} (python export_onnx_model.py로 생성)"
+            )
+        from transformers import AutoTokenizer
+        
+        tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+        return ModelBundle(tokenizer, create_inference_session(model_path, settings.onnx_intra_op_threads))
+    
+    def _predict_batch(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록의 [부정, 긍정] 확률을 한 번의 배치로 계산 (ONNX Runtime)"""
+        return predict_probabilities(self.model, self.tokenizer, texts)
+
+
+class DistilledEmotionClassifier(EmotionClassifier):
+    """
+    OpenAI 분석 결과로 증류한 글자 n-gram 선형 감정 분류기 (CPU 전용, torch 불필요)
+    
+    distill_emotion_model.py로 저장된 분석 결과를 내보내고 학습한 모델을 사용합니다.
+    7가지 감정 확률을 직접 예측하므로 세부 감정 키워드 매핑 없이 OpenAI와 같은 형식으로 반환합니다.
+    """
+    
+    model_used = "distilled-char-ngram"
+    
+    def __init__(self, model_path: str = settings.distilled_model_path):
+        super().__init__(model_path)
+        self.model_path = model_path
+        self._register_model(f"distilled:{model_path}")
+        
+    async def load_model(self):
+        """증류 모델 가중치 로드"""
+        try:
+            await model_registry.preload(self.registry_key)
+        except Exception as e:
+            logger.error(f"증류 감정 모델 로딩 실패: {e}")
+            raise
+    
+    def _load_bundle(self) -> ModelBundle:
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(
+                f"증류 모델이 없습니다: {self.model_path} (python distill_emotion_model.py로 생성)"
+            )
+        return ModelBundle(None, LinearEmotionModel.load(self.model_path))
+    
+    async def predict(self, text: str) -> EmotionAnalysisResult:
+        """증류 모델을 사용한 감정 예측"""
+        async with model_registry.use(self.registry_key) as bundle:
+            probabilities = bundle.model.predict_proba([text])[0]
+            return self._build_result(text, probabilities, bundle.model.labels)
+    
+    async def predict_timeline(self, text: str) -> Dict[str, Any]:
+        """문장별 감정 흐름 예측 (모든 문장을 한 번에 채점)"""
+        spans = split_sentence_spans(text)
+        if not spans:
+            return build_timeline([], [])
+        
+        async with model_registry.use(self.registry_key) as bundle:
+            probabilities = bundle.model.predict_proba([text[start:end] for start, end in spans])
+            labels = bundle.model.labels
+        sentence_scores = [dict(zip(labels, row.tolist())) for row in probabilities]
+        return build_timeline(spans, sentence_scores)
+    
+    def _build_result(self, text: str, probabilities: np.ndarray, labels: List[str]) -> EmotionAnalysisResult:
+        """감정 확률을 분석 결과로 변환"""
+        all_emotions = [
+            EmotionScore(
+                emotion=EmotionLabel[name],
+                score=float(score),
+                emoji=self._get_emotion_emoji(EmotionLabel[name])
+            )
+            for name, score in zip(labels, probabilities)
+        ]
+        all_emotions.sort(key=lambda x: x.score, reverse=True)
+        primary = all_emotions[0]
+        
+        return EmotionAnalysisResult(
+            text=text,
+            primary_emotion=primary.emotion,
+            primary_emotion_score=primary.score,
+            primary_emotion_emoji=primary.emoji,
+            all_emotions=all_emotions,
+            model_used=self.model_used,
+            confidence=primary.score
+        )
+    
+    # 일반화 모델과 같은 감정-이모지 매핑 사용
+    _get_emotion_emoji = KoELECTRAGeneralizedClassifier._get_emotion_emoji
+
+
 # 분류기 인스턴스 생성 - OpenAI와 일반화 모델만 사용
 openai_classifier = OpenAIEmotionClassifier()
-koelectra_generalized_classifier = KoELECTRAGeneralizedClassifier()
\ No newline at end of file
+koelectra_generalized_classifier = KoELECTRAGeneralizedClassifier()
+onnx_koelectra_classifier = ONNXKoELECTRAClassifier()
+distilled_classifier = DistilledEmotionClassifier()
+
+# 로컬 분류기 (캐스케이드 1단계, 문장별 타임라인, OpenAI 마감 초과 헤지에 사용)
+local_classifiers = {
+    "generalized": koelectra_generalized_classifier,
+    "onnx": onnx_koelectra_classifier,
+    "distilled": distilled_classifier,
+}
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""
+프로세스 공용 OpenAI 호출 게이트웨이
+
+감정 분류, 피드백 생성, 일기 정리, 만화 생성이 각자 재시도하면 부하가 몰릴 때 동시에 429를 받고
+같이 물러났다가 다시 몰리는 현상이 반복됩니다. 모든 OpenAI 호출을 이 게이트웨이로 보내서
+분당 요청 수(RPM)와 분당 토큰 수(TPM)를 토큰 버킷으로 미리 나눠 주고, 429 응답의 Retry-After 동안은
+전체 호출을 멈춘 뒤 같은 순서로 재시도합니다. 대기열은 우선순위 레인으로 나뉘어
+사용자 요청(interactive)이 일괄 처리(batch)와 만화 생성(comic)보다 먼저 처리됩니다.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 우선순위 레인 (값이 작을수록 먼저 처리)
+LANE_INTERACTIVE = "interactive"
+LANE_BATCH = "batch"
+LANE_COMIC = "comic"
+LANE_PRIORITIES = {LANE_INTERACTIVE: 0, LANE_BATCH: 1, LANE_COMIC: 2}
+
+# Retry-After 헤더가 없는 429 응답의 기본 대기 시간 (재시도마다 2배)
+DEFAULT_RETRY_SECONDS = 1.0
+MAX_RETRY_SECONDS = 60.0
+
+
+class TokenBucket:
+    """초당 rate만큼 연속으로 채워지는 토큰 버킷 (capacity까지 순간 사용 가능)"""
+
+    def __init__(self, rate_per_minute: float, burst_seconds: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """amount만큼 사용할 수 있을 때까지 남은 시간 (capacity보다 큰 요청은 가득 찼을 때 허용)"""
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.tokens
+        return max(0.0, needed / self.rate) if self.rate > 0 else 0.0
+
+    def consume(self, amount: float, now: float) -> None:
+        """사용량 차감 (실제 사용량 보정 시 음수 잔량과 환급도 허용)"""
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class _Waiter:
+    def __init__(self, priority: int, sequence: int, tokens: int):
+        self.priority = priority
+        self.sequence = sequence
+        self.tokens = tokens
+        self.wake: Optional[asyncio.Future] = None
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+def estimate_chat_tokens(messages: Iterable[Dict[str, Any]], max_tokens: int) -> int:
+    """채팅 요청 토큰 수 추정 (한국어는 대략 글자당 1토큰, 응답은 max_tokens 전체로 예약하고 완료 후 보정)"""
+    prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return prompt_chars + max_tokens
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """OpenAI 오류 응답의 Retry-After(-ms) 헤더 값"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """재시도할 수 있는 429 응답 여부 (할당량 소진은 기다려도 풀리지 않으므로 제외)"""
+    status = getattr(error, "status_code", None)
+    message = str(error).lower()
+    if "insufficient_quota" in message:
+        return False
+    return status == 429 or "rate_limit" in message or "rate limit" in message
+
+
+class LLMGateway:
+    """RPM/TPM 토큰 버킷과 우선순위 레인을 가진 OpenAI 호출 스케줄러"""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        burst_seconds: float = 10.0,
+        max_retries: int = 3
+    ):
+        self.requests = TokenBucket(requests_per_minute, burst_seconds)
+        self.tokens = TokenBucket(tokens_per_minute, burst_seconds)
+        self.max_retries = max_retries
+
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._cooldown_until = 0.0
+
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._wait_seconds: Dict[str, float] = defaultdict(float)
+        self.rate_limited = 0
+        self.retries = 0
+
+    async def run(
+        self,
+        request: Callable[[], Awaitable[T]],
+        lane: str = LANE_INTERACTIVE,
+        estimated_tokens: int = 0
+    ) -> T:
+        """
+        호출 순서와 속도를 조절해서 request 실행
+
+        Args:
+            request: OpenAI 호출 코루틴을 만드는 함수 (재시도 시 다시 호출됨)
+            lane: 우선순위 레인 (interactive, batch, comic)
+            estimated_tokens: 예상 토큰 수 (응답의 usage로 실제 사용량을 보정)
+        """
+        priority = LANE_PRIORITIES.get(lane, LANE_PRIORITIES[LANE_BATCH])
+        # 재시도도 처음 들어온 순서를 유지해서 같은 레인의 뒤 요청에 밀리지 않도록 함
+        sequence = next(self._sequence)
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(_Waiter(priority, sequence, estimated_tokens), lane)
+
+            try:
+                response = await request()
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_rate_limited(e):
+                    raise
+                self.rate_limited += 1
+                self.retries += 1
+                retry_after = _retry_after_seconds(e)
+                if retry_after is None:
+                    retry_after = min(MAX_RETRY_SECONDS, DEFAULT_RETRY_SECONDS * (2 ** attempt))
+                # 모든 레인이 같이 쉬어야 다시 한꺼번에 몰리지 않음
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+                logger.warning(f"OpenAI 속도 제한 ({lane}), {retry_after:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                continue
+
+            self._reconcile(response, estimated_tokens)
+            return response
+
+        raise RuntimeError("OpenAI 호출 재시도 횟수를 초과했습니다.")
+
+    async def _acquire(self, waiter: _Waiter, lane: str) -> None:
+        """대기열 맨 앞이 되고 버킷에 여유가 생길 때까지 대기"""
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        heapq.heappush(self._waiters, waiter)
+        try:
+            while True:
+                now = time.monotonic()
+                if self._waiters[0] is waiter:
+                    delay = max(
+                        self._cooldown_until - now,
+                        self.requests.delay(1, now),
+                        self.tokens.delay(waiter.tokens, now)
+                    )
+                    if delay <= 0:
+                        heapq.heappop(self._waiters)
+                        self.requests.consume(1, now)
+                        self.tokens.consume(waiter.tokens, now)
+                        self._wake_head()
+                        break
+                else:
+                    delay = None
+
+                # 맨 앞 요청만 버킷이 찰 때까지 잠들고, 나머지는 맨 앞이 될 때 깨어남
+                waiter.wake = loop.create_future()
+                await asyncio.wait({waiter.wake}, timeout=delay)
+        except BaseException:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._wake_head()
+            raise
+        finally:
+            waiter.wake = None
+
+        self._calls[lane] += 1
+        self._wait_seconds[lane] += time.monotonic() - started
+
+    def _wake_head(self) -> None:
+        if self._waiters:
+            wake = self._waiters[0].wake
+            if wake is not None and not wake.done():
+                wake.set_result(None)
+
+    def _reconcile(self, response: Any, estimated_tokens: int) -> None:
+        """예약한 토큰 수를 응답의 실제 사용량으로 보정"""
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if isinstance(total, int):
+            self.tokens.consume(total - estimated_tokens, time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        """레인별 호출 수와 평균 대기 시간, 속도 제한 횟수"""
+        now = time.monotonic()
+        return {
+            'queued': len(self._waiters),
+            'cooldown_seconds': round(max(0.0, self._cooldown_until - now), 2),
+            'rate_limited': self.rate_limited,
+            'retries': self.retries,
+            'lanes': {
+                lane: {
+                    'calls': calls,
+                    'avg_wait_ms': round(self._wait_seconds[lane] / calls * 1000, 2),
+                }
+                for lane, calls in self._calls.items()
+            },
+        }
+
+
+# 싱글톤 인스턴스 생성
+llm_gateway = LLMGateway(
+    requests_per_minute=settings.llm_requests_per_minute,
+    tokens_per_minute=settings.llm_tokens_per_minute,
+    burst_seconds=settings.llm_burst_seconds,
+    max_retries=settings.llm_max_retries
+)
@@ -0,0 +1,276 @@
+"""
+프로세스 공용 모델 레지스트리 (지연 로딩 + 메모리 예산 기반 퇴출)
+
+분류기와 분석기가 각자 모델을 들고 있으면 같은 모델이 여러 벌 로드되고, 로딩 시점도 제각각이라
+한 워커에 여러 분석기를 올리면 메모리가 부족해집니다. 모델은 이름으로 등록만 해 두고
+처음 사용할 때 한 번 로드해서 프로세스 안에서 한 벌을 공유합니다.
+로드할 때 늘어난 RSS를 모델 크기로 기록하고, 합계가 예산을 넘으면 사용 중이 아닌 모델을
+가장 오래 안 쓴 순서로 내립니다. 내려간 모델은 다음 사용 시 다시 로드됩니다.
+"""
+import asyncio
+import gc
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss_mb() -> float:
+    """현재 프로세스 RSS (MB, /proc가 없으면 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak / divisor
+
+
+def memory_breakdown_mb() -> Dict[str, float]:
+    """RSS 중 다른 프로세스와 공유 중인 부분과 이 프로세스 전용 부분 (Linux, fork 후 copy-on-write 확인용)"""
+    fields = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared_clean", "Shared_Dirty": "shared_dirty",
+              "Private_Clean": "private_clean", "Private_Dirty": "private_dirty"}
+    breakdown: Dict[str, float] = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in fields:
+                    breakdown[fields[key]] = round(int(rest.split()[0]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return {'rss': round(current_rss_mb(), 1)}
+    return breakdown
+
+
+def _parameter_mb(obj: Any) -> float:
+    """torch 모델 파라미터 크기 (MB, RSS 변화량을 잴 수 없을 때 사용)"""
+    parameters = getattr(obj, "parameters", None)
+    if parameters is None:
+        parameters = getattr(getattr(obj, "model", None), "parameters", None)
+    if not callable(parameters):
+        return 0.0
+    try:
+        return sum(p.numel() * p.element_size() for p in parameters()) / 1024 / 1024
+    except Exception:
+        return 0.0
+
+
+class _Entry:
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.value: Any = None
+        self.size_mb = 0.0
+        self.pinned = False
+        self.in_use = 0
+        self.last_used = 0.0
+        self.loads = 0
+        self.load_seconds = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self.value is not None
+
+
+class ModelRegistry:
+    """이름별 모델 로더 등록, 첫 사용 시 로드, 메모리 예산 초과 시 유휴 모델 퇴출"""
+
+    def __init__(self, memory_budget_mb: float = 0, idle_ttl_seconds: float = 0):
+        self.memory_budget_mb = memory_budget_mb  # 0이면 제한 없음
+        self.idle_ttl_seconds = idle_ttl_seconds  # 0이면 유휴 시간으로는 퇴출하지 않음
+
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()  # 로딩은 한 번에 하나씩 (RSS 측정과 순간 메모리 급증 방지)
+        self._entries: Dict[str, _Entry] = {}
+        self.evictions = 0
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """모델 로더 등록 (같은 이름이 이미 있으면 기존 항목을 공유)"""
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _Entry(name, loader)
+
+    def peek(self, name: Optional[str]) -> Any:
+        """로드된 모델 반환 (로드하지 않음, 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(name) if name else None
+            return entry.value if entry is not None else None
+
+    def _acquire(self, name: str) -> Any:
+        """모델을 사용 중으로 표시하고 반환 (필요하면 로드)"""
+        with self._lock:
+            entry = self._entries[name]
+            entry.in_use += 1
+            entry.last_used = time.monotonic()
+            if entry.loaded:
+                return entry.value
+
+        try:
+            with self._load_lock:
+                if not entry.loaded:
+                    self._load(entry)
+            return entry.value
+        except BaseException:
+            with self._lock:
+                entry.in_use -= 1
+            raise
+
+    def _load(self, entry: _Entry) -> None:
+        # 이전에 잰 크기를 알면 로드 전에 미리 자리를 비움
+        if entry.size_mb:
+            self._enforce_budget(reserve_mb=entry.size_mb)
+
+        logger.info(f"모델 로딩 시작: {entry.name}")
+        started = time.perf_counter()
+        rss_before = current_rss_mb()
+        value = entry.loader()
+        rss_delta = current_rss_mb() - rss_before
+
+        with self._lock:
+            entry.value = value
+            entry.size_mb = round(max(rss_delta, _parameter_mb(value), entry.size_mb), 1)
+            entry.loads += 1
+            entry.load_seconds = round(time.perf_counter() - started, 2)
+        logger.info(f"모델 로딩 완료: {entry.name} ({entry.size_mb}MB, {entry.load_seconds}초)")
+
+        self._enforce_budget()
+
+    def _release(self, name: str) -> None:
+        with self._lock:
+            entry = self._entries[name]
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+        self.evict_idle()
+
+    @contextmanager
+    def use_sync(self, name: str) -> Iterator[Any]:
+        """동기 코드용: 블록 안에서는 모델이 퇴출되지 않음"""
+        value = self._acquire(name)
+        try:
+            yield value
+        finally:
+            self._release(name)
+
+    @asynccontextmanager
+    async def use(self, name: str) -> AsyncIterator[Any]:
+        """비동기 코드용: 로딩은 스레드에서 실행하고, 블록 안에서는 모델이 퇴출되지 않음"""
+        value = await asyncio.to_thread(self._acquire, name)
+        try:
+            yield value
+        finally:
+            self._release(name)
+
+    async def preload(self, name: str) -> Any:
+        """모델을 미리 로드 (사용 중 표시는 남기지 않음)"""
+        async with self.use(name) as value:
+            return value
+
+    def pin(self, name: str) -> Any:
+        """모델을 로드하고 퇴출 대상에서 제외 (fork 전에 마스터에서 로드한 공유 모델용)"""
+        with self.use_sync(name) as value:
+            with self._lock:
+                self._entries[name].pinned = True
+            return value
+
+    def evict(self, name: str) -> bool:
+        """사용 중이 아니면 모델을 내리고 메모리 반환"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or not entry.loaded or entry.in_use > 0 or entry.pinned:
+                return False
+            entry.value = None
+            self.evictions += 1
+
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info(f"모델 퇴출: {name} ({entry.size_mb}MB)")
+        return True
+
+    def evict_idle(self) -> None:
+        """유휴 시간이 지난 모델 퇴출"""
+        if self.idle_ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                entry.name for entry in self._entries.values()
+                if entry.loaded and entry.in_use == 0 and not entry.pinned
+                and now - entry.last_used >= self.idle_ttl_seconds
+            ]
+        for name in expired:
+            self.evict(name)
+
+    def _enforce_budget(self, reserve_mb: float = 0.0) -> None:
+        """로드된 모델 크기 합계 + reserve_mb가 예산 이하가 될 때까지 오래 안 쓴 순서로 퇴출"""
+        if self.memory_budget_mb <= 0:
+            return
+        with self._lock:
+            loaded = [entry for entry in self._entries.values() if entry.loaded]
+            total = sum(entry.size_mb for entry in loaded) + reserve_mb
+            candidates = sorted(
+                (entry for entry in loaded if entry.in_use == 0 and not entry.pinned),
+                key=lambda entry: entry.last_used
+            )
+
+        for entry in candidates:
+            if total <= self.memory_budget_mb:
+                break
+            if self.evict(entry.name):
+                total -= entry.size_mb
+
+        if total > self.memory_budget_mb:
+            logger.warning(f"모델 메모리 예산 초과: {total:.1f}MB > {self.memory_budget_mb}MB (사용 중인 모델은 퇴출 불가)")
+
+    def stats(self) -> Dict[str, Any]:
+        """모델별 로드 상태, 크기, 사용 중 여부와 전체 메모리 사용량"""
+        now = time.monotonic()
+        with self._lock:
+            models = {
+                entry.name: {
+                    'loaded': entry.loaded,
+                    'size_mb': entry.size_mb,
+                    'pinned': entry.pinned,
+                    'in_use': entry.in_use,
+                    'loads': entry.loads,
+                    'load_seconds': entry.load_seconds,
+                    'idle_seconds': round(now - entry.last_used, 1) if entry.last_used else None,
+                }
+                for entry in self._entries.values()
+            }
+            return {
+                'memory_budget_mb': self.memory_budget_mb,
+                'loaded_mb': round(sum(entry.size_mb for entry in self._entries.values() if entry.loaded), 1),
+                'process_memory_mb': memory_breakdown_mb(),
+                'evictions': self.evictions,
+                'models': models,
+            }
+
+
+def register_pipeline(task: str, model: str, device: int = -1, **kwargs: Any) -> str:
+    """Hugging Face pipeline을 레지스트리에 등록하고 키 반환 (같은 작업/모델/디바이스는 한 벌 공유)"""
+    name = f"pipeline:{task}:{model}:{device}"
+
+    def load() -> Any:
+        from transformers import pipeline
+        return pipeline(task, model=model, device=device, **kwargs)
+
+    model_registry.register(name, load)
+    return name
+
+
+# 싱글톤 인스턴스 생성
+model_registry = ModelRegistry(
+    memory_budget_mb=settings.model_memory_budget_mb,
+    idle_ttl_seconds=settings.model_idle_ttl_seconds
+)
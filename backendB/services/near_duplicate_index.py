@@ -0,0 +1,132 @@
+"""
+거의 같은 일기 탐지용 MinHash LSH 인덱스
+
+템플릿, 반복되는 일과, 조금 고친 초안처럼 같은 사용자의 거의 같은 일기는
+정확한 해시 캐시로는 잡히지 않습니다. 글자 n-gram MinHash 서명을 밴드로 나눠
+LSH 버킷에 넣고, 후보의 추정 자카드 유사도가 기준 이상이면 이전 분석 결과를 재사용합니다.
+"""
+import logging
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 서명 길이 = 밴드 수 × 밴드당 행 수 (후보 탐색 기준 유사도 ≈ (1/밴드 수)^(1/행 수) ≈ 0.5)
+NUM_PERMUTATIONS = 64
+NUM_BANDS = 16
+SHINGLE_SIZE = 3
+
+# 해시 순열용 메르센 소수 (2^31 - 1, 곱셈 결과가 uint64 범위를 넘지 않음)
+_PRIME = (1 << 31) - 1
+
+
+class DuplicateMatch(NamedTuple):
+    """유사 일기 검색 결과"""
+    key: str
+    similarity: float
+    payload: Any
+
+
+class NearDuplicateIndex:
+    """사용자(scope)별로 분리된 MinHash LSH 인덱스"""
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 10000, seed: int = 42):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.rows_per_band = NUM_PERMUTATIONS // NUM_BANDS
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=NUM_PERMUTATIONS).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=NUM_PERMUTATIONS).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, np.ndarray, Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, int, bytes], Set[str]] = defaultdict(set)
+
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def signature(self, text: str) -> List[int]:
+        """텍스트의 MinHash 서명 (저장용 정수 목록)"""
+        normalized = " ".join(text.split())
+        if len(normalized) <= SHINGLE_SIZE:
+            shingles = {normalized}
+        else:
+            shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+        hashes = np.array(
+            [zlib.crc32(shingle.encode("utf-8")) & _PRIME for shingle in shingles],
+            dtype=np.uint64
+        )
+        # (a·x + b) mod p 순열을 모든 shingle에 한 번에 적용하고 열별 최솟값을 서명으로 사용
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0).astype(np.int64).tolist()
+
+    def _band_keys(self, scope: str, signature: np.ndarray) -> List[Tuple[str, int, bytes]]:
+        return [
+            (scope, band, signature[band * self.rows_per_band:(band + 1) * self.rows_per_band].tobytes())
+            for band in range(NUM_BANDS)
+        ]
+
+    def add(self, key: str, signature: List[int], scope: str, payload: Any) -> None:
+        """분석 결과 등록 (오래된 항목부터 제거)"""
+        array = np.asarray(signature, dtype=np.int64)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (scope, array, payload)
+            for band_key in self._band_keys(scope, array):
+                self._buckets[band_key].add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        scope, array, _ = self._entries.pop(key)
+        for band_key in self._band_keys(scope, array):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def query(self, signature: List[int], scope: str) -> Optional[DuplicateMatch]:
+        """같은 scope에서 유사도가 기준 이상인 가장 비슷한 항목 검색"""
+        array = np.asarray(signature, dtype=np.int64)
+        with self._lock:
+            self.lookups += 1
+            candidates: Set[str] = set()
+            for band_key in self._band_keys(scope, array):
+                candidates |= self._buckets.get(band_key, set())
+
+            best: Optional[DuplicateMatch] = None
+            for key in candidates:
+                _, candidate, payload = self._entries[key]
+                similarity = float(np.mean(candidate == array))
+                if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                    best = DuplicateMatch(key, similarity, payload)
+
+            if best is not None:
+                self.hits += 1
+                self._entries.move_to_end(best.key)
+            return best
+
+    def stats(self) -> Dict[str, Any]:
+        """상태 확인용 인덱스 통계"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'threshold': self.threshold,
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            }
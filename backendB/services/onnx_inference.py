@@ -0,0 +1,76 @@
+"""
+ONNX Runtime 추론 유틸리티
+
+KoELECTRA를 ONNX로 내보내고 int8 동적 양자화한 모델을 CPU에서 실행합니다.
+운영 서버에는 GPU가 없으므로 PyTorch eager fp32 대신 이 경로를 사용할 수 있습니다.
+(pip install onnxruntime)
+"""
+import logging
+import os
+from typing import Any, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 양자화 모델 파일명 (export_onnx_model.py가 생성)
+QUANTIZED_MODEL_FILENAME = "model.int8.onnx"
+
+
+def create_inference_session(model_path: str, intra_op_threads: int = 0) -> Any:
+    """
+    CPU 추론용 ONNX Runtime 세션 생성
+
+    Args:
+        model_path: .onnx 모델 경로
+        intra_op_threads: 연산 내부 스레드 수 (0이면 물리 코어 수에 맞춰 자동 설정)
+    """
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        raise RuntimeError("onnxruntime이 설치되지 않았습니다. pip install onnxruntime")
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # 요청 하나를 여러 코어로 나눠 처리하고, 연산 간 병렬화는 끔 (단일 분류 모델에서는 이득이 없음)
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = intra_op_threads or (os.cpu_count() or 1)
+    options.inter_op_num_threads = 1
+
+    session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+    logger.info(f"ONNX Runtime 세션 생성 완료: {model_path} (intra-op 스레드 {options.intra_op_num_threads})")
+    return session
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """마지막 축 기준 softmax"""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def predict_probabilities(session: Any, tokenizer: Any, texts: List[str], max_length: int = 512) -> np.ndarray:
+    """
+    텍스트 목록을 한 번의 배치로 분류
+
+    Returns:
+        (텍스트 수, 라벨 수) 확률 배열
+    """
+    encoded = tokenizer(
+        texts,
+        return_tensors="np",
+        max_length=max_length,
+        truncation=True,
+        padding=True
+    )
+
+    # 내보낸 그래프에 있는 입력만 전달 (token_type_ids가 없는 모델도 있음)
+    input_names = {model_input.name for model_input in session.get_inputs()}
+    feeds = {
+        name: np.asarray(value, dtype=np.int64)
+        for name, value in encoded.items()
+        if name in input_names
+    }
+
+    logits = session.run(None, feeds)[0]
+    return softmax(logits.astype(np.float32))
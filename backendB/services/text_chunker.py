@@ -0,0 +1,90 @@
+"""
+긴 일기 텍스트 분할 및 감정 확률 집계
+
+모델 입력 한도(512 토큰)를 넘는 일기를 문장 경계 기준으로 토큰 수 이내의 구간으로 나누고,
+구간별 확률을 토큰 수로 가중 평균해서 일기 전체의 확률을 만듭니다.
+구간들은 한 번의 패딩 배치로 추론하므로 비용은 배치 forward 한 번 수준입니다.
+"""
+import re
+from typing import Any, List, NamedTuple, Tuple
+
+import numpy as np
+
+# [CLS], [SEP]를 제외한 구간당 최대 토큰 수
+MAX_CHUNK_TOKENS = 510
+
+# 문장 종결 부호 또는 줄바꿈 뒤에서 분리
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。…~])\s+|\n+")
+
+
+class TextChunk(NamedTuple):
+    """분할된 텍스트 구간"""
+    text: str
+    token_count: int
+
+
+def split_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """문장 단위 분리 결과를 원문 기준 (시작, 끝) 위치로 반환 (앞뒤 공백 제외, 빈 문장 제외)"""
+    spans = []
+    start = 0
+    for boundary in list(SENTENCE_BOUNDARY.finditer(text)) + [None]:
+        end = boundary.start() if boundary else len(text)
+        segment = text[start:end]
+        stripped = segment.strip()
+        if stripped:
+            offset = start + (len(segment) - len(segment.lstrip()))
+            spans.append((offset, offset + len(stripped)))
+        if boundary:
+            start = boundary.end()
+    return spans
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 단위 분리 (빈 문장 제외)"""
+    return [text[start:end] for start, end in split_sentence_spans(text)]
+
+
+def chunk_text(text: str, tokenizer: Any, max_tokens: int = MAX_CHUNK_TOKENS) -> List[TextChunk]:
+    """
+    문장 경계를 유지하면서 토큰 수 이내의 구간으로 분할
+
+    문장들을 앞에서부터 채워 넣고, 한 문장이 한도를 넘으면 그 문장만 토큰 단위로 자릅니다.
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        return []
+
+    # 문장별 토큰 수를 한 번에 계산
+    sentence_ids = tokenizer(sentences, add_special_tokens=False)["input_ids"]
+
+    chunks: List[TextChunk] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        nonlocal current, current_tokens
+        if current:
+            chunks.append(TextChunk(" ".join(current), current_tokens))
+        current, current_tokens = [], 0
+
+    for sentence, ids in zip(sentences, sentence_ids):
+        if len(ids) > max_tokens:
+            flush()
+            for start in range(0, len(ids), max_tokens):
+                window = ids[start:start + max_tokens]
+                chunks.append(TextChunk(tokenizer.decode(window), len(window)))
+            continue
+
+        if current_tokens + len(ids) > max_tokens:
+            flush()
+        current.append(sentence)
+        current_tokens += len(ids)
+
+    flush()
+    return chunks
+
+
+def aggregate_probabilities(probabilities: np.ndarray, chunks: List[TextChunk]) -> np.ndarray:
+    """구간별 확률을 토큰 수로 가중 평균"""
+    weights = np.array([max(chunk.token_count, 1) for chunk in chunks], dtype=np.float64)
+    return (probabilities * weights[:, None]).sum(axis=0) / weights.sum()
@@ -9,6 +9,8 @@ import logging
 import uvicorn
 import random
 
+from services.keyword_scoring import KeywordLexicon
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -143,20 +145,23 @@ class EmotionAnalyzer:
             "혐오": ["역겨", "더러", "지겨", "징그", "끔찍", "싫어", "혐오", "구역"],
             "중성": ["그냥", "보통", "일반", "평범", "그저", "단순", "그런", "이런"]
         }
+        self.lexicon = KeywordLexicon(self.keyword_mapping)
     
     def analyze(self, text: str) -> EmotionAnalysisResponse:
         """실제 텍스트 분석 기반 감정 분석"""
-        emotion_scores = {}
-        text_lower = text.lower()
-        
+        return self.analyze_batch([text])[0]
+    
+    def analyze_batch(self, texts: List[str]) -> List[EmotionAnalysisResponse]:
+        """여러 텍스트 감정 분석 (키워드 점수는 적중 행렬 × 가중치 행렬로 한 번에 계산)"""
         # 키워드 기반 점수 계산
-        for emotion, keywords in self.keyword_mapping.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
-            emotion_scores[emotion] = score
-        
+        score_matrix = self.lexicon.score(texts)
+        return [
+            self._build_response(dict(zip(self.lexicon.labels, row.tolist())))
+            for row in score_matrix
+        ]
+    
+    def _build_response(self, emotion_scores: Dict[str, float]) -> EmotionAnalysisResponse:
+        """감정별 키워드 점수로 응답 생성"""
         # 가장 높은 점수의 감정 찾기
         primary_emotion_name = max(emotion_scores, key=emotion_scores.get)
         
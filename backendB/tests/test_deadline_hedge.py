@@ -0,0 +1,123 @@
+"""
+마감 시간 헤지 호출 및 회로 차단기 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from services.deadline_hedge import CircuitBreaker, hedged_call
+
+
+def _delayed(value, seconds):
+    async def call():
+        await asyncio.sleep(seconds)
+        return value
+    return call
+
+
+def test_primary_within_deadline_is_used():
+    """마감 안에 끝난 원격 결과를 사용하고 헤지는 실행하지 않는지 확인"""
+    hedge_calls = []
+
+    async def hedge():
+        hedge_calls.append(1)
+        return "local"
+
+    outcome = asyncio.run(hedged_call(_delayed("remote", 0.01), hedge, deadline=0.5))
+    assert outcome == ("remote", "primary", True)
+    assert hedge_calls == []
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    """마감을 넘긴 원격 호출 대신 로컬 결과를 반환하고 원격 작업은 취소되는지 확인"""
+    cancelled = []
+
+    async def slow_primary():
+        try:
+            await asyncio.sleep(5)
+            return "remote"
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def run():
+        outcome = await hedged_call(slow_primary, _delayed("local", 0.01), deadline=0.05)
+        await asyncio.sleep(0)
+        return outcome
+
+    started = time.perf_counter()
+    outcome = asyncio.run(run())
+    assert outcome == ("local", "hedge", False)
+    assert time.perf_counter() - started < 1
+    assert cancelled == [1]
+
+
+def test_rejected_primary_result_falls_back_to_hedge():
+    """정책을 만족하지 않는 원격 결과는 로컬 결과로 대체되는지 확인"""
+    outcome = asyncio.run(hedged_call(
+        _delayed("fallback", 0), _delayed("local", 0), deadline=0.5,
+        accept=lambda result: result != "fallback"
+    ))
+    assert outcome == ("local", "hedge", False)
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """연속 실패 후 회로가 열리고, 대기 후 시험 호출 하나만 허용되는지 확인"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.stats()['opens'] == 1
+
+
+def test_circuit_breaker_cancelled_trial_allows_next_trial():
+    """half-open 시험 호출이 결과 없이 끝나면 다음 시험 호출이 허용되는지 확인"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_cancel()
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+
+
+def test_hedging_is_disabled_by_default(monkeypatch):
+    """기본 설정에서는 느린 OpenAI 호출도 헤지 없이 OpenAI 결과를 반환하는지 확인"""
+    from config.settings import Settings
+
+    assert Settings().openai_hedge_deadline_seconds == 0
+
+    pytest.importorskip("models.emotion", reason="models 패키지가 없어 감정 분류 모듈을 import할 수 없습니다.")
+    from services.emotion_classifier import OpenAIEmotionClassifier
+
+    classifier = OpenAIEmotionClassifier()
+    remote_result = object()
+    local_calls = []
+
+    async def slow_remote(text):
+        await asyncio.sleep(0.05)
+        return remote_result
+
+    async def local(text):
+        local_calls.append(text)
+        return "local"
+
+    monkeypatch.setattr(classifier, "_predict_remote", slow_remote)
+    monkeypatch.setattr(classifier, "_predict_local", local)
+
+    assert asyncio.run(classifier.predict("오늘은 길고 느린 하루")) is remote_result
+    assert local_calls == []
+    assert classifier.breaker.state == "closed"
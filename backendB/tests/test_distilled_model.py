@@ -0,0 +1,53 @@
+"""
+증류 감정 분류기(글자 n-gram 선형 모델) 테스트
+"""
+import numpy as np
+
+from services.distilled_model import EMOTION_NAMES, CharNgramHasher, LinearEmotionModel, agreement_report
+
+JOY_TEXTS = ["오늘은 정말 행복했다", "친구와 놀아서 즐거웠다", "선물을 받아서 기뻤다"]
+SAD_TEXTS = ["시험을 망쳐서 슬펐다", "혼자 있어서 외로웠다", "하루 종일 우울했다"]
+
+
+def _teacher(label: str) -> list:
+    scores = [0.02] * len(EMOTION_NAMES)
+    scores[EMOTION_NAMES.index(label)] = 0.88
+    return scores
+
+
+def _train_model() -> LinearEmotionModel:
+    texts = JOY_TEXTS * 5 + SAD_TEXTS * 5
+    targets = np.array([_teacher("JOY")] * 15 + [_teacher("SADNESS")] * 15)
+    model = LinearEmotionModel(CharNgramHasher(num_features=1 << 12))
+    model.fit(texts, targets, epochs=5)
+    return model
+
+
+def test_hasher_rows_are_l2_normalized():
+    """텍스트별 특징 벡터가 L2 정규화되는지 확인"""
+    features = CharNgramHasher(num_features=1 << 10).transform(["좋은 하루", "나쁜 하루"])
+    for row in range(2):
+        values = features.values[features.rows == row]
+        assert np.isclose(np.linalg.norm(values), 1.0)
+
+
+def test_model_learns_teacher_labels():
+    """학습한 문장에서 교사와 같은 1등 감정을 예측하는지 확인"""
+    model = _train_model()
+    probabilities = model.predict_proba(JOY_TEXTS + SAD_TEXTS)
+    teacher = np.array([_teacher("JOY")] * 3 + [_teacher("SADNESS")] * 3)
+
+    report = agreement_report(probabilities, teacher)
+    assert report['top1_agreement'] == 1.0
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """저장한 모델을 다시 불러와도 같은 확률을 내는지 확인"""
+    model = _train_model()
+    path = str(tmp_path / "model.npz")
+    model.save(path)
+
+    loaded = LinearEmotionModel.load(path)
+    assert loaded.labels == EMOTION_NAMES
+    assert np.allclose(loaded.predict_proba(JOY_TEXTS), model.predict_proba(JOY_TEXTS))
@@ -0,0 +1,44 @@
+"""
+문장별 감정 타임라인 테스트
+"""
+from services.emotion_timeline import TIMELINE_VERSION, build_timeline, expand_timeline
+from services.text_chunker import split_sentence_spans
+
+
+def test_split_sentence_spans_point_into_original_text():
+    """문장 위치가 원문 기준으로 잘리는지 확인 (앞뒤 공백 제외)"""
+    text = "  아침엔 좋았다.  점심은 별로였다!\n\n저녁엔 슬펐다 "
+    spans = split_sentence_spans(text)
+
+    assert [text[start:end] for start, end in spans] == ["아침엔 좋았다.", "점심은 별로였다!", "저녁엔 슬펐다"]
+
+
+def test_build_timeline_records_transitions():
+    """주요 감정이 바뀐 문장만 전환 지점으로 기록되는지 확인"""
+    spans = [(0, 5), (6, 10), (11, 15), (16, 20)]
+    scores = [
+        {"JOY": 0.8, "SADNESS": 0.1},
+        {"JOY": 0.6, "SADNESS": 0.3},
+        {"JOY": 0.2, "SADNESS": 0.7},
+        {"JOY": 0.9, "SADNESS": 0.05},
+    ]
+    timeline = build_timeline(spans, scores)
+
+    assert timeline["v"] == TIMELINE_VERSION
+    assert [segment[2] for segment in timeline["segments"]] == ["JOY", "JOY", "SADNESS", "JOY"]
+    assert timeline["transitions"] == [[2, "JOY", "SADNESS"], [3, "SADNESS", "JOY"]]
+
+
+def test_expand_timeline_restores_sentences():
+    """저장된 위치로 문장 원문을 복원하는지 확인"""
+    text = "좋았다. 슬펐다."
+    timeline = build_timeline(split_sentence_spans(text), [{"JOY": 0.9}, {"SADNESS": 0.8}])
+
+    expanded = expand_timeline(timeline, text)
+    assert [item["text"] for item in expanded] == ["좋았다.", "슬펐다."]
+    assert [item["emotion"] for item in expanded] == ["JOY", "SADNESS"]
+
+
+def test_build_timeline_empty_text():
+    """문장이 없으면 빈 타임라인"""
+    assert build_timeline([], []) == {"v": TIMELINE_VERSION, "segments": [], "transitions": []}
@@ -0,0 +1,87 @@
+"""
+감정 분석 모듈 import 비용 테스트 (python -X importtime)
+
+OpenAI만 사용하는 배포에서 서버가 빨리 뜨도록 감정 분류 모듈을 import해도
+torch/transformers가 로드되지 않는지 확인합니다.
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 로컬 모델을 사용할 때만 import되어야 하는 패키지
+HEAVY_PACKAGES = ("torch", "transformers", "onnxruntime")
+
+# 감정 분류 모듈 import 누적 시간 상한 (초)
+# openai만으로 0.7초 정도 걸리므로 작은 변동이 아니라 torch급(수 초) 회귀만 잡도록 여유를 둠
+IMPORT_BUDGET_SECONDS = 3.0
+
+_PROBE = (
+    "import json, sys\n"
+    "import services.emotion_classifier\n"
+    "print(json.dumps(sorted(name for name in sys.modules if name.split('.')[0] in {heavy!r})))\n"
+)
+
+
+def _require_models_package() -> None:
+    """models 패키지(데이터 모델)가 없는 체크아웃에서는 감정 분류 모듈을 import할 수 없음"""
+    sys.path.insert(0, str(BACKEND_DIR))
+    try:
+        if importlib.util.find_spec("models.emotion") is None:
+            pytest.skip("models.emotion 패키지가 없어 감정 분류 모듈을 import할 수 없습니다.")
+    except ModuleNotFoundError:
+        pytest.skip("models 패키지가 없어 감정 분류 모듈을 import할 수 없습니다.")
+    finally:
+        sys.path.remove(str(BACKEND_DIR))
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    """backendB를 sys.path에 두고 새 인터프리터 실행"""
+    pythonpath = os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")]))
+    env = dict(
+        os.environ,
+        PYTHONPATH=pythonpath,
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY") or "sk-import-time-test",
+    )
+    completed = subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    return completed
+
+
+def _import_times(module: str) -> dict:
+    """모듈을 새 인터프리터에서 import하고 {모듈 이름: 누적 import 시간(초)} 반환"""
+    completed = _run("-X", "importtime", "-c", f"import {module}")
+    times = {}
+    for line in completed.stderr.splitlines():
+        # "import time:   self [us] |   cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def test_emotion_classifier_does_not_import_heavy_ml_packages():
+    """감정 분류 모듈을 import한 뒤 sys.modules에 torch/transformers가 없는지 확인"""
+    _require_models_package()
+    completed = _run("-c", _PROBE.format(heavy=set(HEAVY_PACKAGES)))
+
+    loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert loaded == []
+
+
+def test_emotion_classifier_import_time_budget():
+    """감정 분류 모듈 import 누적 시간이 상한 이내인지 확인 (-X importtime)"""
+    _require_models_package()
+    times = _import_times("services.emotion_classifier")
+
+    assert times["services.emotion_classifier"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,48 @@
+"""
+일괄 키워드 채점 엔진 테스트 (텍스트별 `in` 루프와 같은 결과인지 확인)
+"""
+import numpy as np
+
+from services.keyword_scoring import KeywordLexicon, find_keyword_hits, first_positions
+
+LEXICON = {
+    "기쁨": ["행복", "좋", "웃", "좋"],  # 중복 키워드는 두 번 계산
+    "분노": ["화", "짜증", "싫"],
+    "혐오": ["싫", "더러"],
+}
+
+TEXTS = [
+    "오늘은 행복하고 좋은 하루였다.",
+    "",
+    "짜증나고 화가 났다. 정말 싫다.",
+    "그냥 그랬다",
+    "더러운 기분. 웃을 일이 없다",
+]
+
+
+def loop_scores(texts):
+    """기존 방식 (텍스트 × 키워드 루프)"""
+    return np.array([
+        [sum(1 for keyword in keywords if keyword in text.lower()) for keywords in LEXICON.values()]
+        for text in texts
+    ])
+
+
+def test_batch_scores_match_per_text_loop():
+    """적중 행렬 × 가중치 행렬 결과가 기존 루프와 같은지 확인"""
+    lexicon = KeywordLexicon(LEXICON)
+    assert np.array_equal(lexicon.score(TEXTS), loop_scores(TEXTS))
+
+
+def test_first_positions_match_str_find():
+    """텍스트별 첫 등장 위치가 str.find와 같은지 확인"""
+    keywords = ["다", "화", "없"]
+    positions = first_positions(find_keyword_hits(TEXTS, keywords), len(keywords))
+    expected = np.array([[text.find(keyword) for keyword in keywords] for text in TEXTS])
+    assert np.array_equal(positions, expected)
+
+
+def test_keywords_do_not_match_across_texts():
+    """이어 붙인 텍스트 경계를 넘는 적중이 없는지 확인"""
+    lexicon = KeywordLexicon({"기쁨": ["행복"]})
+    assert lexicon.score(["행", "복"]).sum() == 0
@@ -0,0 +1,79 @@
+"""
+공용 OpenAI 호출 게이트웨이 테스트 (속도 제한, 우선순위 레인, Retry-After)
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from services.llm_gateway import LANE_BATCH, LANE_INTERACTIVE, LLMGateway, TokenBucket
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after_ms: str):
+        super().__init__("rate limit exceeded")
+        self.response = SimpleNamespace(headers={"retry-after-ms": retry_after_ms})
+
+
+def test_token_bucket_delay_until_refill():
+    """버킷이 비면 분당 속도에 맞춰 대기 시간이 계산되는지 확인"""
+    bucket = TokenBucket(rate_per_minute=60, burst_seconds=1)  # 초당 1개, 최대 1개
+    bucket.consume(1, now=bucket._updated)
+    bucket._updated = 0.0
+
+    assert bucket.delay(1, now=0.5) == pytest.approx(0.5)
+    assert bucket.delay(1, now=1.0) == 0
+
+
+def test_interactive_lane_goes_before_batch():
+    """대기 중인 일괄 처리 요청보다 사용자 요청이 먼저 실행되는지 확인"""
+    gateway = LLMGateway(requests_per_minute=600, tokens_per_minute=1e6, burst_seconds=0.1)
+    order = []
+
+    async def request(name):
+        order.append(name)
+        return name
+
+    async def run():
+        tasks = [asyncio.create_task(gateway.run(lambda n=f"batch{i}": request(n), lane=LANE_BATCH)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(gateway.run(lambda n=f"user{i}": request(n), lane=LANE_INTERACTIVE)) for i in range(2)]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == ["batch0", "user0", "user1", "batch1", "batch2"]
+
+
+def test_rate_limited_request_waits_retry_after():
+    """429 응답의 Retry-After만큼 기다렸다가 재시도하는지 확인"""
+    gateway = LLMGateway(requests_per_minute=6000, tokens_per_minute=1e6)
+    calls = []
+
+    async def flaky():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise RateLimitError("200")
+        return "ok"
+
+    assert asyncio.run(gateway.run(flaky)) == "ok"
+    assert calls[1] - calls[0] >= 0.19
+    assert gateway.stats()['rate_limited'] == 1
+
+
+def test_quota_errors_are_not_retried():
+    """할당량 소진은 재시도하지 않고 바로 실패하는지 확인"""
+    gateway = LLMGateway(requests_per_minute=6000, tokens_per_minute=1e6)
+    calls = []
+
+    async def no_quota():
+        calls.append(1)
+        error = RateLimitError("0")
+        error.args = ("Error code: 429 - insufficient_quota",)
+        raise error
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(gateway.run(no_quota))
+    assert calls == [1]
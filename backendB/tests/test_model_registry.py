@@ -0,0 +1,90 @@
+"""
+공용 모델 레지스트리 테스트 (지연 로딩, 공유, 메모리 예산 퇴출)
+"""
+import asyncio
+
+from services.model_registry import ModelRegistry
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+
+def _counting_loader(name, counter):
+    def load():
+        counter.append(name)
+        return FakeModel(name)
+    return load
+
+
+def test_models_load_once_on_first_use():
+    """등록만으로는 로드하지 않고, 여러 번 사용해도 한 번만 로드하는지 확인"""
+    registry = ModelRegistry()
+    loads = []
+    registry.register("a", _counting_loader("a", loads))
+    # 같은 이름으로 다시 등록하면 기존 항목 공유
+    registry.register("a", _counting_loader("a-copy", loads))
+    assert loads == []
+
+    with registry.use_sync("a") as first:
+        pass
+    with registry.use_sync("a") as second:
+        pass
+
+    assert first is second
+    assert loads == ["a"]
+
+
+def test_budget_evicts_least_recently_used_idle_model():
+    """예산을 넘으면 가장 오래 안 쓴 유휴 모델부터 내리는지 확인"""
+    registry = ModelRegistry(memory_budget_mb=150)
+    loads = []
+    for name in ("a", "b", "c"):
+        registry.register(name, _counting_loader(name, loads))
+        registry._entries[name].size_mb = 60  # 이전 로드에서 잰 크기
+
+    for name in ("a", "b", "c"):
+        with registry.use_sync(name):
+            pass
+
+    assert registry.peek("a") is None
+    assert registry.peek("b") is not None and registry.peek("c") is not None
+    assert registry.stats()['evictions'] == 1
+
+    # 퇴출된 모델은 다음 사용 시 다시 로드
+    asyncio.run(registry.preload("a"))
+    assert loads == ["a", "b", "c", "a"]
+
+
+def test_models_in_use_are_not_evicted():
+    """사용 중인 모델은 예산을 넘어도 퇴출되지 않는지 확인"""
+    registry = ModelRegistry(memory_budget_mb=50)
+    registry.register("a", _counting_loader("a", []))
+    registry.register("b", _counting_loader("b", []))
+    registry._entries["a"].size_mb = registry._entries["b"].size_mb = 40
+
+    with registry.use_sync("a"):
+        with registry.use_sync("b"):
+            assert registry.peek("a") is not None
+        assert registry.peek("b") is not None
+        assert not registry.evict("a")
+
+
+def test_pinned_models_survive_budget_and_idle_eviction():
+    """fork 전에 고정한 공유 모델은 예산 초과나 유휴 시간으로 퇴출되지 않는지 확인"""
+    registry = ModelRegistry(memory_budget_mb=1, idle_ttl_seconds=0.001)
+    loads = []
+    registry.register("shared", _counting_loader("shared", loads))
+    registry.register("other", _counting_loader("other", loads))
+
+    shared = registry.pin("shared")
+    registry._entries["shared"].size_mb = 10
+    with registry.use_sync("other"):
+        pass
+
+    assert registry.evict("shared") is False
+    registry.evict_idle()
+    assert registry.peek("shared") is shared
+    assert registry.stats()['models']['shared']['pinned'] is True
+    assert loads == ["shared", "other"]
@@ -0,0 +1,41 @@
+"""
+유사 일기 MinHash LSH 인덱스 테스트
+"""
+from services.near_duplicate_index import NearDuplicateIndex
+
+DIARY = "오늘은 아침에 일어나서 회사에 출근했다. 점심은 김치찌개를 먹었고 저녁에는 헬스장에 갔다. 피곤했지만 뿌듯한 하루였다."
+
+
+def test_near_copy_is_found_in_same_scope():
+    """조금 고친 일기는 같은 사용자 안에서 재사용 대상으로 찾아지는지 확인"""
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add("a1", index.signature(DIARY), scope="user1", payload="결과")
+
+    edited = DIARY.replace("김치찌개", "된장찌개")
+    match = index.query(index.signature(edited), scope="user1")
+
+    assert match is not None
+    assert match.key == "a1"
+    assert match.payload == "결과"
+    assert index.stats()["hits"] == 1
+
+
+def test_other_scope_and_different_text_miss():
+    """다른 사용자이거나 내용이 다른 일기는 재사용하지 않는지 확인"""
+    index = NearDuplicateIndex(threshold=0.7)
+    index.add("a1", index.signature(DIARY), scope="user1", payload="결과")
+
+    assert index.query(index.signature(DIARY), scope="user2") is None
+    different = "친구와 영화를 보러 갔는데 너무 무서워서 중간에 나왔다."
+    assert index.query(index.signature(different), scope="user1") is None
+    assert index.stats()["hit_rate"] == 0.0
+
+
+def test_oldest_entries_are_evicted():
+    """최대 항목 수를 넘으면 오래된 항목이 버킷에서도 제거되는지 확인"""
+    index = NearDuplicateIndex(max_entries=1)
+    index.add("a1", index.signature(DIARY), scope="user1", payload=1)
+    index.add("a2", index.signature("전혀 다른 내용의 일기입니다."), scope="user1", payload=2)
+
+    assert index.query(index.signature(DIARY), scope="user1") is None
+    assert index.stats()["evictions"] == 1
@@ -0,0 +1,54 @@
+"""
+ONNX Runtime 추론 유틸리티 테스트 (onnxruntime 없이 가짜 세션으로 실행)
+"""
+import numpy as np
+
+from services.onnx_inference import predict_probabilities, softmax
+
+
+class FakeInput:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeSession:
+    """token_type_ids 입력이 없는 그래프를 흉내 내는 세션"""
+
+    def __init__(self):
+        self.feeds = None
+
+    def get_inputs(self):
+        return [FakeInput("input_ids"), FakeInput("attention_mask")]
+
+    def run(self, output_names, feeds):
+        self.feeds = feeds
+        batch = feeds["input_ids"].shape[0]
+        return [np.tile(np.array([[0.0, 2.0]], dtype=np.float32), (batch, 1))]
+
+
+def fake_tokenizer(texts, **kwargs):
+    length = max(len(text) for text in texts)
+    ids = np.array([[1] * len(text) + [0] * (length - len(text)) for text in texts], dtype=np.int32)
+    return {
+        "input_ids": ids,
+        "attention_mask": (ids > 0).astype(np.int32),
+        "token_type_ids": np.zeros_like(ids),
+    }
+
+
+def test_softmax_rows_sum_to_one():
+    """softmax 결과가 행마다 합이 1이고 큰 값에서도 안정적인지 확인"""
+    probs = softmax(np.array([[1000.0, 1001.0], [0.0, 0.0]]))
+    assert np.allclose(probs.sum(axis=1), 1.0)
+    assert np.allclose(probs[1], [0.5, 0.5])
+
+
+def test_predict_probabilities_feeds_only_graph_inputs():
+    """그래프에 없는 입력은 빼고 int64로 전달하는지 확인"""
+    session = FakeSession()
+    probs = predict_probabilities(session, fake_tokenizer, ["좋다", "오늘은 슬펐다"])
+
+    assert probs.shape == (2, 2)
+    assert set(session.feeds) == {"input_ids", "attention_mask"}
+    assert session.feeds["input_ids"].dtype == np.int64
+    assert probs[0, 1] > probs[0, 0]
@@ -0,0 +1,48 @@
+"""
+긴 일기 분할/집계 테스트 (글자 단위 가짜 토크나이저 사용)
+"""
+import numpy as np
+
+from services.text_chunker import TextChunk, aggregate_probabilities, chunk_text, split_sentences
+
+
+class CharTokenizer:
+    """공백을 제외한 글자 하나를 토큰 하나로 취급"""
+
+    def __call__(self, texts, add_special_tokens=False):
+        return {"input_ids": [[ord(c) for c in text if not c.isspace()] for text in texts]}
+
+    def decode(self, ids):
+        return "".join(chr(i) for i in ids)
+
+
+def test_split_sentences_on_punctuation_and_newlines():
+    """문장 부호와 줄바꿈 기준으로 나뉘는지 확인"""
+    text = "오늘은 좋았다. 내일은 어떨까?\n모르겠다"
+    assert split_sentences(text) == ["오늘은 좋았다.", "내일은 어떨까?", "모르겠다"]
+
+
+def test_chunk_text_keeps_sentences_within_token_limit():
+    """문장을 쪼개지 않고 토큰 한도 안에서 묶는지 확인"""
+    text = "가나다라. 마바사아. 자차카타. 파하."
+    chunks = chunk_text(text, CharTokenizer(), max_tokens=10)
+
+    assert [chunk.text for chunk in chunks] == ["가나다라. 마바사아.", "자차카타. 파하."]
+    assert all(chunk.token_count <= 10 for chunk in chunks)
+    # 원문 끝까지 모두 포함
+    assert chunks[-1].text.endswith("파하.")
+
+
+def test_chunk_text_splits_overlong_sentence():
+    """한도를 넘는 한 문장은 토큰 단위로 잘리는지 확인"""
+    chunks = chunk_text("가" * 25, CharTokenizer(), max_tokens=10)
+    assert [chunk.token_count for chunk in chunks] == [10, 10, 5]
+
+
+def test_aggregate_probabilities_is_length_weighted():
+    """긴 구간의 확률이 더 크게 반영되는지 확인"""
+    probabilities = np.array([[0.9, 0.1], [0.1, 0.9]])
+    chunks = [TextChunk("a", 30), TextChunk("b", 10)]
+    aggregated = aggregate_probabilities(probabilities, chunks)
+
+    assert np.allclose(aggregated, [0.7, 0.3])
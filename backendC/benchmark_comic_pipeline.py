@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+만화 생성 파이프라인 부하 테스트 (네트워크 없이 실행)
+
+LLM 스크립트 단계는 고정 장면으로 대신하고, 이후 단계는 ComicGenerator 코드를 그대로 실행합니다.
+이미지 생성은 로컬 절차적 생성기와 가짜 지연을 쓰고, 텍스트 합성과 저장까지 거칩니다.
+처리량, 만화별 소요 시간 분포, 최대 RSS를 출력합니다.
+
+사용법:
+    python benchmark_comic_pipeline.py --comics 20 --concurrency 4
+    python benchmark_comic_pipeline.py --comics 50 --concurrency 8 --latency 12 --jitter 6
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import List
+
+# 로컬 생성기는 OpenAI를 호출하지 않지만 모듈 로드 시 클라이언트를 만들므로 빈 키를 채워 둠
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+from services.comic_generator import ComicGenerator
+from services.image_providers import LocalImageProvider
+
+SAMPLE_SCENES = [
+    {"scene": "A person wakes up late and rushes out with toast", "dialogue_ko": "오늘도 늦잠이라니!"},
+    {"scene": "Crowded subway ride, holding a coffee carefully", "dialogue_ko": "커피만은 지켜야 해..."},
+    {"scene": "A small win at work, colleagues clapping", "dialogue_ko": "드디어 끝냈다!"},
+    {"scene": "Evening walk by the river under the sunset", "dialogue_ko": "그래도 괜찮은 하루였어."},
+]
+
+
+def _scenes(index: int) -> List[dict]:
+    """만화마다 프롬프트가 달라지도록 장면에 번호를 붙임"""
+    return [
+        {"scene": f"{scene['scene']} (day {index})", "dialogue": scene["scene"], "dialogue_ko": scene["dialogue_ko"]}
+        for scene in SAMPLE_SCENES
+    ]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def _make_comic(generator: ComicGenerator, index: int, output_dir: str, gender: str) -> float:
+    started = time.perf_counter()
+    scenes = _scenes(index)
+    prompt = await generator.build_combined_prompt(scenes, gender)
+    img = await generator.generate_combined_image(prompt)
+    img = await generator.add_text_boxes_to_combined_image(img, scenes)
+    await asyncio.to_thread(img.save, os.path.join(output_dir, f"comic_{index:04d}.png"))
+    return time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> dict:
+    generator = ComicGenerator(image_provider=LocalImageProvider(args.latency, args.jitter))
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int, output_dir: str) -> float:
+        async with semaphore:
+            return await _make_comic(generator, index, output_dir, args.gender)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        started = time.perf_counter()
+        durations = sorted(await asyncio.gather(*(bounded(i, output_dir) for i in range(args.comics))))
+        elapsed = time.perf_counter() - started
+
+    def percentile(p: float) -> float:
+        return round(durations[min(len(durations) - 1, int(len(durations) * p))], 3)
+
+    return {
+        'comics': args.comics,
+        'concurrency': args.concurrency,
+        'latency_seconds': args.latency,
+        'elapsed_seconds': round(elapsed, 2),
+        'comics_per_minute': round(args.comics / elapsed * 60, 1),
+        'p50_seconds': percentile(0.5),
+        'p95_seconds': percentile(0.95),
+        'max_seconds': round(durations[-1], 3),
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="만화 생성 파이프라인 오프라인 부하 테스트")
+    parser.add_argument("--comics", type=int, default=20, help="생성할 만화 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 생성할 만화 수 (작업 큐 워커 수)")
+    parser.add_argument("--latency", type=float, default=0.0, help="이미지 생성 가짜 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="가짜 지연에 더할 0~N초 난수")
+    parser.add_argument("--gender", default="female", choices=["male", "female"])
+    args = parser.parse_args()
+
+    print(f"🏃 만화 {args.comics}개 생성 중 (동시 {args.concurrency}개, 이미지 지연 {args.latency}초)")
+    report = asyncio.run(run(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"✅ 처리량: 분당 {report['comics_per_minute']}개, 최대 RSS {report['peak_rss_mb']}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
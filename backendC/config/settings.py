@@ -30,14 +30,75 @@ class Settings(BaseSettings):
     # AI 모델 설정
     kogpt_model_name: str = "skt/kogpt2-base-v2"
     
+    # 모델 레지스트리 (로컬 모델은 첫 사용 시 로드해서 프로세스당 한 벌만 유지)
+    model_memory_budget_mb: float = 0  # 로드된 모델 합계가 넘으면 오래 안 쓴 모델부터 퇴출 (0이면 제한 없음)
+    model_idle_ttl_seconds: float = 0  # 이 시간 동안 안 쓴 모델 퇴출 (0이면 사용 안 함)
+    
+    # ONNX Runtime 설정 (export_onnx_model.py로 생성한 int8 모델)
+    onnx_model_dir: str = "onnx_models/koelectra-generalized"
+    onnx_intra_op_threads: int = 0  # 0이면 CPU 코어 수
+    
+    # 증류 모델 설정 (distill_emotion_model.py로 생성한 글자 n-gram 선형 모델)
+    distilled_model_path: str = "distilled_models/emotion_char_ngram.npz"
+    
+    # 감정 분류 설정
+    emotion_model_type: str = "openai"  # openai, generalized, onnx, distilled, cascade
+    cascade_local_model: str = "generalized"  # 캐스케이드 1단계 로컬 모델 (generalized, onnx, distilled)
+    cascade_confidence_threshold: float = 0.3  # 로컬 결과 신뢰도가 이 값 미만이면 OpenAI로 에스컬레이션
+    service_stats_log_interval: int = 100  # 감정 분석 N건마다 캐스케이드/유사 일기 통계 로그 (0이면 끔)
+    
+    # 유사 일기 분석 재사용 설정 (MinHash LSH, 새 사용자마다 Firestore 조회가 한 번 추가되므로 기본값은 끔)
+    near_duplicate_enabled: bool = False
+    near_duplicate_threshold: float = 0.85  # 추정 자카드 유사도 (글자 3-gram)
+    near_duplicate_max_entries: int = 10000  # 프로세스당 인덱스 최대 항목 수
+    near_duplicate_warm_limit: int = 50  # 사용자별로 불러올 최근 분석 수
+    
+    # 문장별 감정 타임라인 (로컬 모델 배치 1회로 계산해서 분석 결과와 함께 저장)
+    emotion_timeline_enabled: bool = False
+    
     # OpenAI API 설정
     openai_api_key: Optional[str] = None
+    openai_request_timeout_seconds: float = 30.0  # 클라이언트 요청 타임아웃 (취소된 헤지 호출도 이 시간 안에 정리됨)
+    
+    # OpenAI 감정 분석 응답 시간 제한 (마감 초과 시 로컬 분류기로 헤지, 0이면 사용 안 함)
+    # 켜면 느린 요청이 로컬 결과로 바뀌므로 기본값은 끔 (운영에서 4초 정도로 설정)
+    openai_hedge_deadline_seconds: float = 0.0
+    openai_hedge_local_model: str = "keyword"  # keyword, generalized, onnx, distilled
+    openai_breaker_failure_threshold: int = 5  # 연속 마감 초과/실패 횟수가 이 값 이상이면 회로 열림
+    openai_breaker_reset_seconds: float = 30.0  # 회로가 열린 뒤 OpenAI 재시도까지 대기 시간
+    
+    # OpenAI 호출 게이트웨이 (모든 OpenAI 호출이 공유하는 속도 제한, 계정 한도에 맞춰 설정)
+    llm_requests_per_minute: float = 500
+    llm_tokens_per_minute: float = 200000
+    llm_burst_seconds: float = 10.0  # 한 번에 몰아 쓸 수 있는 한도 (N초 분량)
+    llm_max_retries: int = 3  # 429 응답 재시도 횟수 (Retry-After 만큼 전체 대기 후 재시도)
+    
+    # 만화 생성 작업 큐 (요청은 작업 ID만 받고, 정해진 수의 워커가 순서대로 생성)
+    comic_job_workers: int = 2  # 동시에 생성하는 만화 수
+    comic_job_max_pending: int = 100  # 대기 작업이 이 값 이상이면 새 작업 거절
+    comic_job_ttl_seconds: float = 3600  # 완료된 작업 결과 보관 시간 (같은 요청은 결과 재사용)
+    
+    # 만화 기본 이미지 캐시 (정리된 결합 프롬프트가 같으면 DALL-E 호출 없이 재사용)
+    comic_image_cache_dir: str = "cache/comic_images"  # 정적 파일로 제공되는 outputs/ 밖에 둠 (캐시 이미지가 공개되지 않도록)
+    comic_image_cache_max_mb: float = 1024  # 캐시 디렉터리 크기 한도, 넘으면 오래 안 쓴 이미지부터 삭제 (0이면 사용 안 함)
+    
+    # 만화 이미지 생성기 (dalle, local: 네트워크 없이 프롬프트 해시로 그리는 부하 테스트용 이미지)
+    comic_image_provider: str = "dalle"
+    comic_local_image_latency_seconds: float = 0.0  # local 생성기의 가짜 응답 지연 (DALL-E는 보통 10~20초)
+    comic_local_image_jitter_seconds: float = 0.0  # 가짜 지연에 더하는 0~N초 난수
+    
+    # 만화 파생본 (썸네일, 512px, 컷별 이미지를 원본 내용 해시 경로에 저장, 긴 캐시 헤더로 제공)
+    comic_derivatives_dir: str = "outputs/derived"
+    comic_derivatives_url: str = "/outputs/derived"
+    comic_derivative_formats: List[str] = ["webp", "avif"]  # 설치된 Pillow가 지원하지 않는 형식은 건너뜀
+    comic_derivative_workers: int = 2  # 프로세스 풀 크기 (0이면 스레드에서 실행)
     
     # Groq API 설정
     groq_api_key: Optional[str] = None
     
     # API 설정
     max_text_length: int = 1000
+    max_analysis_text_length: int = 10000  # 감정 분석 입력 상한 (512 토큰을 넘는 일기는 구간으로 나눠 분석)
     
     # 감정 라벨 설정
     emotion_labels: list = [
@@ -1,14 +1,18 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-import os, uuid, io, textwrap
+import os, uuid, io, textwrap, json
 from PIL import Image, ImageDraw, ImageFont
 from openai import OpenAI
 from dotenv import load_dotenv
 import firebase_admin
 from firebase_admin import credentials, storage
 from services.comic_generator import ComicGenerator
+from services.comic_derivatives import derivative_renderer
+from services.comic_jobs import QueueFullError, create_comic_job_queue
+from config.settings import settings
 # 환경설정 및 초기화
 load_dotenv()
 cred = credentials.Certificate("diaryemo-5e11e-firebase-adminsdk-fbsvc-3960bbf582.json")
@@ -19,6 +23,26 @@ client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 app = FastAPI()
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 comic_generator = ComicGenerator()
+comic_jobs = create_comic_job_queue(comic_generator.generate)
+class ImmutableStaticFiles(StaticFiles):
+    """내용 해시 경로의 파일 제공 (경로가 같으면 내용도 같으므로 1년간 재검증 없이 캐시)"""
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+# 생성된 만화 이미지 제공 (ComicGenerator.generate가 /outputs/{filename} 경로를 반환)
+# 파생본 경로를 먼저 등록해야 /outputs 마운트보다 우선 매칭됨
+os.makedirs(settings.comic_derivatives_dir, exist_ok=True)
+app.mount(settings.comic_derivatives_url, ImmutableStaticFiles(directory=settings.comic_derivatives_dir), name="comic-derivatives")
+os.makedirs("outputs", exist_ok=True)
+app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
+
+@app.on_event("shutdown")
+def shutdown_derivative_renderer():
+    derivative_renderer.shutdown()
+SSE_HEARTBEAT_SECONDS = 15
 font_path = os.path.join(os.path.dirname(__file__), "Danjo-bold-Regular.otf")
 
 class DiaryComicRequest(BaseModel):
@@ -26,6 +50,10 @@ class DiaryComicRequest(BaseModel):
     user_name: str = "나"
     gender: str = "female"
 
+class ComicJobRequest(BaseModel):
+    raw_text: str
+    gender: str = "female"
+
 def generate_diary_text(text: str) -> str:
     prompt = f"""
     사용자가 대충 음성으로 녹음해서 텍스트로 변환된 내용이에요. 일기로 만들면 되요. 더하거나 덜지 말고 자연스럽게 만드세요. 내용 전체를 표현하는 감정 이모지도 전달하세요.
@@ -55,6 +83,50 @@ async def diary_comic(req: DiaryComicRequest):
         "diary_text": dummy_diary_text,
         "comic_image_url": dummy_image_url
     }
+@app.post("/api/comic-jobs", status_code=202)
+async def create_comic_job(req: ComicJobRequest):
+    """만화 생성 작업 등록 후 바로 작업 ID 반환 (같은 텍스트/성별은 기존 작업 재사용)"""
+    if req.gender not in comic_generator.CHARACTER_STYLES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 성별입니다: {req.gender}")
+    try:
+        job, deduplicated = comic_jobs.submit(req.raw_text, req.gender)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"success": True, "deduplicated": deduplicated, **job.to_dict()}
+
+@app.get("/api/comic-jobs/{job_id}")
+async def get_comic_job(job_id: str):
+    """작업 상태, 진행 단계, 결과 조회 (폴링용)"""
+    job = comic_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job.to_dict()
+
+@app.get("/api/comic-jobs/{job_id}/events")
+async def comic_job_events(job_id: str):
+    """작업 상태가 바뀔 때마다 SSE로 전송 (완료/실패 시 종료)"""
+    job = comic_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    async def stream():
+        version = -1
+        while True:
+            if job.version != version:
+                version = job.version
+                yield f"data: {json.dumps(job.to_dict(), ensure_ascii=False)}\n\n"
+                if job.finished:
+                    return
+            elif not await job.wait_changed(version, SSE_HEARTBEAT_SECONDS):
+                # 프록시가 유휴 연결을 끊지 않도록 주석 이벤트 전송
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # @app.post("/api/diary-comic")
 # async def diary_comic(req: DiaryComicRequest):
 #     try:
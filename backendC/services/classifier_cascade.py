@@ -0,0 +1,106 @@
+"""
+신뢰도 기반 분류기 캐스케이드
+
+로컬 분류기(KoELECTRA)로 먼저 분석하고, 신뢰도가 기준 이상이면 바로 반환합니다.
+애매한 텍스트만 OpenAI 분류기로 넘겨서 네트워크 지연과 API 비용을 줄입니다.
+단계별 지연 시간과 에스컬레이션 비율을 기록해 기준값을 조정할 수 있게 합니다.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+import numpy as np
+
+from models.emotion import EmotionAnalysisResult
+from services.emotion_classifier import EmotionClassifier
+
+logger = logging.getLogger(__name__)
+
+# 단계별 지연 시간 통계에 사용할 최근 요청 수
+LATENCY_WINDOW = 1000
+
+
+class CascadeMetrics:
+    """캐스케이드 단계별 호출 수, 지연 시간, 에스컬레이션 비율"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.escalations = 0
+        self.local_failures = 0
+        self._latencies: Dict[str, Deque[float]] = {
+            "local": deque(maxlen=window),
+            "remote": deque(maxlen=window),
+            "total": deque(maxlen=window),
+        }
+
+    def record(self, tier: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies[tier].append(seconds * 1000)
+
+    def record_request(self, escalated: bool, local_failed: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.escalations += int(escalated)
+            self.local_failures += int(local_failed)
+
+    def stats(self) -> Dict[str, Any]:
+        """임계값 조정용 통계 (지연 시간은 ms)"""
+        with self._lock:
+            latency = {}
+            for tier, values in self._latencies.items():
+                if values:
+                    array = np.array(values)
+                    latency[tier] = {
+                        'count': len(values),
+                        'p50_ms': round(float(np.percentile(array, 50)), 2),
+                        'p95_ms': round(float(np.percentile(array, 95)), 2),
+                    }
+            return {
+                'requests': self.requests,
+                'escalations': self.escalations,
+                'local_failures': self.local_failures,
+                'escalation_rate': round(self.escalations / self.requests, 4) if self.requests else 0.0,
+                'latency': latency,
+            }
+
+
+class ClassifierCascade:
+    """로컬 분류기 → (신뢰도 미달 시) 원격 분류기 순서로 예측"""
+
+    def __init__(self, local: EmotionClassifier, remote: EmotionClassifier, threshold: float):
+        self.local = local
+        self.remote = remote
+        self.threshold = threshold
+        self.metrics = CascadeMetrics()
+
+    async def predict(self, text: str) -> EmotionAnalysisResult:
+        """텍스트 감정 예측 (EmotionClassifier.predict와 같은 형식)"""
+        started = time.perf_counter()
+
+        local_result = None
+        local_failed = False
+        try:
+            local_result = await self.local.predict(text)
+        except Exception as e:
+            # 로컬 모델을 쓸 수 없으면 원격 분류기로 처리
+            logger.warning(f"로컬 감정 분류 실패, 원격 분류기로 전환: {e}")
+            local_failed = True
+        self.metrics.record("local", time.perf_counter() - started)
+
+        if local_result is not None and local_result.confidence >= self.threshold:
+            self.metrics.record_request(escalated=False)
+            self.metrics.record("total", time.perf_counter() - started)
+            return local_result
+
+        remote_started = time.perf_counter()
+        result = await self.remote.predict(text)
+        self.metrics.record("remote", time.perf_counter() - remote_started)
+        self.metrics.record_request(escalated=True, local_failed=local_failed)
+        self.metrics.record("total", time.perf_counter() - started)
+
+        if local_result is not None:
+            logger.info(f"신뢰도 {local_result.confidence:.3f} < {self.threshold}, 원격 분류기로 에스컬레이션")
+        return result
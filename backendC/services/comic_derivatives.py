@@ -0,0 +1,151 @@
+"""
+만화 이미지 파생본 생성 (썸네일, 중간 크기, 컷별 이미지, WebP/AVIF)
+
+모바일 목록 화면도 1024x1024 PNG 원본을 내려받고 있어서 전송량과 디코딩 시간이 큽니다.
+원본 저장 후 크기별·컷별 파생본을 WebP/AVIF로 만들어 원본 내용 해시 디렉터리에 저장합니다.
+경로가 내용으로 정해지므로 파일은 바뀌지 않고, 긴 캐시 헤더(immutable)로 제공할 수 있습니다.
+PIL 리사이즈와 인코딩은 CPU 작업이라 이벤트 루프를 막지 않도록 프로세스 풀에서 실행합니다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from PIL import Image, features
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+CONTENT_HASH_LENGTH = 16
+
+# 파생본 이름 -> (긴 변 픽셀, 자를 컷 번호 또는 None)
+DERIVATIVE_SPECS = {
+    "thumb": (256, None),
+    "medium": (512, None),
+    "panel_1": (512, 0),
+    "panel_2": (512, 1),
+    "panel_3": (512, 2),
+    "panel_4": (512, 3),
+}
+
+# 형식별 저장 옵션 (손실 압축, 만화 그림 기준으로 눈에 띄는 열화가 없는 품질)
+FORMAT_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 60},
+}
+
+
+def supported_formats(formats: Sequence[str]) -> List[str]:
+    """설치된 Pillow가 인코딩할 수 있는 형식만 (AVIF는 Pillow 11.2+ 또는 플러그인 필요)"""
+    return [fmt for fmt in formats if fmt in FORMAT_OPTIONS and features.check(fmt)]
+
+
+def content_hash(path: str) -> str:
+    """원본 파일 내용 SHA-256 앞부분 (파생본 디렉터리 이름)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:CONTENT_HASH_LENGTH]
+
+
+def _panel_box(img: Image.Image, panel: int) -> tuple:
+    """2x2 격자에서 panel번째 컷 영역 (읽는 순서)"""
+    half_w, half_h = img.width // 2, img.height // 2
+    left, top = (panel % 2) * half_w, (panel // 2) * half_h
+    return (left, top, left + half_w, top + half_h)
+
+
+def render_derivatives(source_path: str, output_root: str, base_url: str, formats: Sequence[str]) -> Dict[str, Any]:
+    """
+    원본 하나의 파생본을 모두 만들고 매니페스트 반환 (프로세스 풀 작업, 이미 있으면 재사용)
+
+    Returns:
+        {'hash': 내용 해시, 'variants': {이름: {'width', 'height', 형식: URL}}}
+    """
+    digest = content_hash(source_path)
+    output_dir = os.path.join(output_root, digest)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    os.makedirs(output_dir, exist_ok=True)
+    variants: Dict[str, Dict[str, Any]] = {}
+    with Image.open(source_path) as source:
+        source = source.convert("RGB")
+        for name, (max_side, panel) in DERIVATIVE_SPECS.items():
+            img = source.crop(_panel_box(source, panel)) if panel is not None else source.copy()
+            img.thumbnail((max_side, max_side), Image.LANCZOS)
+            variant: Dict[str, Any] = {"width": img.width, "height": img.height}
+            for fmt in formats:
+                filename = f"{name}.{fmt}"
+                path = os.path.join(output_dir, filename)
+                # 임시 파일에 쓰고 교체해서 제공 중인 파일이 덜 쓴 상태로 보이지 않도록 함
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                img.save(temp_path, **FORMAT_OPTIONS[fmt])
+                os.replace(temp_path, path)
+                variant[fmt] = f"{base_url}/{digest}/{filename}"
+            variants[name] = variant
+
+    manifest = {"hash": digest, "variants": variants}
+    temp_manifest = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temp_manifest, manifest_path)
+    return manifest
+
+
+class DerivativeRenderer:
+    """파생본 생성을 프로세스 풀에 맡기는 비동기 인터페이스"""
+
+    def __init__(self, output_root: str, base_url: str, formats: Sequence[str], max_workers: int = 2):
+        self.output_root = output_root
+        self.base_url = base_url.rstrip("/")
+        self.formats = supported_formats(formats)
+        self.max_workers = max_workers  # 0이면 프로세스 풀 없이 스레드에서 실행
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        skipped = sorted(set(formats) - set(self.formats))
+        if skipped:
+            logger.warning(f"인코딩할 수 없는 파생본 형식 제외: {', '.join(skipped)}")
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers <= 0:
+            return None
+        if self._pool is None:
+            # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn으로 워커 생성
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def render(self, source_path: str) -> Dict[str, Any]:
+        """원본 이미지의 파생본 생성 후 매니페스트 반환"""
+        args = (os.path.abspath(source_path), self.output_root, self.base_url, self.formats)
+        executor = self._executor()
+        if executor is None:
+            return await asyncio.to_thread(render_derivatives, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, render_derivatives, *args)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# 싱글톤 인스턴스 생성
+derivative_renderer = DerivativeRenderer(
+    output_root=settings.comic_derivatives_dir,
+    base_url=settings.comic_derivatives_url,
+    formats=settings.comic_derivative_formats,
+    max_workers=settings.comic_derivative_workers
+)
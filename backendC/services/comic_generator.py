@@ -1,25 +1,40 @@
 import os
 from PIL import Image, ImageDraw, ImageFont
 import requests
-import io
 import uuid
 import textwrap
 import httpx
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 import asyncio
+from typing import Callable, Optional
+
+from config.settings import settings
+from services.comic_derivatives import derivative_renderer
+from services.comic_script import PANEL_COUNT, SCRIPT_SCHEMA_EXAMPLE, ComicScript, parse_comic_script, parse_panel_text
+from services.image_cache import comic_image_cache, prompt_cache_key
+from services.image_providers import ImageProvider, create_image_provider, draw_panel_grid, panel_positions
+from services.llm_gateway import LANE_COMIC, estimate_chat_tokens, llm_gateway
 
 load_dotenv()
 
-# httpx 클라이언트 설정
+# httpx 클라이언트 설정 (재시도는 공용 게이트웨이가 담당)
 http_client = httpx.AsyncClient()
 client = AsyncOpenAI(
     api_key=os.getenv("OPENAI_API_KEY"),
-    http_client=http_client
+    http_client=http_client,
+    max_retries=0
 )
 
 class ComicGenerator:
-    def __init__(self):
+    def __init__(self, image_provider: Optional[ImageProvider] = None):
+        # 이미지 생성기 (기본값은 설정의 comic_image_provider, 부하 테스트는 local)
+        self.image_provider = image_provider or create_image_provider(
+            settings.comic_image_provider,
+            client=client,
+            latency_seconds=settings.comic_local_image_latency_seconds,
+            jitter_seconds=settings.comic_local_image_jitter_seconds
+        )
         self.CHARACTER_STYLES = {
             "male": {
                 "default": "A calm Korean man in his late 20s with short black hair and glasses, wearing a hoodie.",
@@ -29,6 +44,76 @@ class ComicGenerator:
             }
         }
 
+    async def get_comic_script(self, text: str, gender: str) -> ComicScript:
+        """
+        일기 정리, 4컷 장면, 한국어 대사를 한 번의 호출로 생성
+
+        응답에서 빠진 필드만 대체합니다: 일기는 원문, 장면은 get_script 재호출,
+        한국어 대사는 해당 컷만 번역. 정상 응답이면 LLM 호출은 한 번입니다.
+        """
+        character_style = self.CHARACTER_STYLES[gender]["default"]
+        prompt = f"""
+사용자가 음성으로 녹음해서 텍스트로 변환된 내용입니다. 아래 두 가지를 JSON 객체 하나로만 답하세요.
+
+1. diary: 내용을 더하거나 덜지 말고 자연스러운 한국어 일기로 정리하세요. 내용 전체를 표현하는 감정 이모지로 시작하세요.
+2. panels: You are a Japanese comic writer INOUE TAKEHIKO. Do not use speech bubbles.
+   Generate a 4-panel wholesome slice-of-life comic scenario from the diary with a character described as: {character_style}
+   Each panel has an English 'scene', an English 'dialogue', and 'dialogue_ko' (the dialogue in comics style natural Korean).
+   Exactly {PANEL_COUNT} panels.
+
+형식:
+{SCRIPT_SCHEMA_EXAMPLE}
+
+내용: "{text}"
+"""
+        messages = [
+            {"role": "system", "content": "너는 사용자의 하루를 정리해주는 일기 작가이자 만화 작가야. JSON으로만 답해."},
+            {"role": "user", "content": prompt}
+        ]
+        try:
+            res = await llm_gateway.run(
+                lambda: client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=1500,
+                    response_format={"type": "json_object"},
+                ),
+                lane=LANE_COMIC,
+                estimated_tokens=estimate_chat_tokens(messages, 1500)
+            )
+            raw = res.choices[0].message.content or ""
+        except Exception as e:
+            print(f"⚠️ 구조화 스크립트 생성 실패: {e}")
+            raw = ""
+
+        script = parse_comic_script(raw, fallback_diary=text)
+        if script.missing:
+            print(f"⚠️ 스크립트 응답에 없는 필드: {', '.join(script.missing)}")
+
+        # 장면이 하나라도 비면 기존 방식으로 장면만 다시 생성 (한국어 대사는 아래에서 번역)
+        if any(not scene["scene"] for scene in script.scenes):
+            scenes = await self.get_script(script.diary_text, gender)
+            script = script._replace(scenes=[{**scene, "dialogue_ko": ""} for scene in scenes])
+
+        await self._fill_korean_dialogue(script.scenes)
+        return script
+
+    async def _fill_korean_dialogue(self, scenes: list) -> None:
+        """한국어 대사가 빠진 컷만 영어 대사를 번역해서 채움 (번역 실패 시 영어 대사 사용)"""
+        targets = [scene for scene in scenes if not scene.get("dialogue_ko") and scene.get("dialogue")]
+        if not targets:
+            return
+        results = await asyncio.gather(
+            *(self.translate_text_to_korean(scene["dialogue"]) for scene in targets),
+            return_exceptions=True
+        )
+        for scene, translated in zip(targets, results):
+            if isinstance(translated, Exception):
+                print(f"⚠️ 대사 번역 실패: {translated}")
+                translated = scene["dialogue"]
+            scene["dialogue_ko"] = translated
+
     async def get_script(self, text: str, gender: str) -> list:
         character_style = self.CHARACTER_STYLES[gender]["default"]
         prompt = f"""
@@ -49,43 +134,35 @@ Dialogue: ...
 Diary: {text}
 """
 
-        res = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
+        messages = [{"role": "user", "content": prompt}]
+        res = await llm_gateway.run(
+            lambda: client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                temperature=0.7,
+            ),
+            lane=LANE_COMIC,
+            estimated_tokens=estimate_chat_tokens(messages, 800)
         )
         text = res.choices[0].message.content.strip()
 
-        scenes = []
-        for i in range(1, 5):
-            start_token = f"[Panel {i}]"
-            end_token = f"[Panel {i+1}]" if i < 4 else None
-
-            if start_token not in text:
-                raise ValueError(f"{start_token} not found in GPT output.")
-
-            part = text.split(start_token)[1]
-            if end_token and end_token in part:
-                part = part.split(end_token)[0]
-
-            lines = part.strip().splitlines()
-            scene = {"scene": "", "dialogue": ""}
-            for line in lines:
-                if line.lower().startswith("scene:"):
-                    scene["scene"] = line.split(":", 1)[-1].strip()
-                elif line.lower().startswith("dialogue:"):
-                    scene["dialogue"] = line.split(":", 1)[-1].strip()
-            scenes.append(scene)
-        
+        scenes = parse_panel_text(text)
+        if len(scenes) < PANEL_COUNT:
+            raise ValueError(f"[Panel {len(scenes) + 1}] not found in GPT output.")
         return scenes
 
     async def translate_text_to_korean(self, text: str) -> str:
-        res = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": f"Translate this into comics style natural Korean:\n{text}"}
-            ],
-            temperature=0.5,
+        messages = [
+            {"role": "user", "content": f"Translate this into comics style natural Korean:\n{text}"}
+        ]
+        res = await llm_gateway.run(
+            lambda: client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                temperature=0.5,
+            ),
+            lane=LANE_COMIC,
+            estimated_tokens=estimate_chat_tokens(messages, 100)
         )
         return res.choices[0].message.content.strip()
 
@@ -113,31 +190,7 @@ Diary: {text}
                 # 프롬프트 검증 및 정리
                 cleaned_prompt = self._clean_prompt(prompt)
                 
-                response = await client.images.generate(
-                    model="dall-e-3",
-                    prompt=cleaned_prompt,
-                    size="1024x1024",
-                    quality="standard",
-                    n=1,
-                    response_format="url",
-                    style="natural"
-                )
-                
-                if not response.data or len(response.data) == 0:
-                    raise RuntimeError("OpenAI API에서 이미지 데이터를 받지 못했습니다.")
-                
-                image_url = response.data[0].url
-                print(f"✅ 이미지 URL 생성 성공: {image_url[:50]}...")
-                
-                # 이미지 다운로드 (더 긴 타임아웃)
-                async with httpx.AsyncClient(timeout=600) as http_client:
-                    response = await http_client.get(image_url)
-                    if response.status_code != 200:
-                        raise RuntimeError(f"이미지 다운로드 실패: {response.status_code}")
-                    image_data = response.content
-                
-                print(f"✅ 이미지 다운로드 완료: {len(image_data)} bytes")
-                return Image.open(io.BytesIO(image_data))
+                return await self.image_provider.generate(cleaned_prompt)
                 
             except Exception as e:
                 error_msg = str(e)
@@ -145,9 +198,9 @@ Diary: {text}
                 
                 # 특정 에러에 대한 처리
                 if "rate_limit" in error_msg.lower() or "quota" in error_msg.lower():
-                    wait_time = attempt * 10  # Rate limit 시 더 오래 대기
-                    print(f"⏳ Rate limit 감지. {wait_time}초 대기...")
-                    await asyncio.sleep(wait_time)
+                    # 게이트웨이 재시도까지 실패했거나 할당량 소진 - 여기서 더 기다려도 다른 요청만 밀림
+                    print("⏳ Rate limit/할당량 초과. 재시도 중단")
+                    raise RuntimeError(f"Image generation rate limited: {error_msg}")
                 elif "content_policy" in error_msg.lower():
                     print("🚫 콘텐츠 정책 위반. 프롬프트 수정 필요")
                     # 프롬프트를 더 안전하게 수정
@@ -212,8 +265,8 @@ Diary: {text}
         ]
 
         for idx, (x, y) in enumerate(positions):
-            original_dialogue = scenes[idx]['dialogue']
-            translated = await self.translate_text_to_korean(original_dialogue)
+            # get_comic_script로 만든 장면은 한국어 대사가 이미 있음
+            translated = scenes[idx].get('dialogue_ko') or await self.translate_text_to_korean(scenes[idx]['dialogue'])
 
             font_size = base_font_size
             lines = []
@@ -260,36 +313,66 @@ Diary: {text}
 
         return img
 
-    async def generate(self, text: str, gender: str = "male") -> dict:
+    async def generate(self, text: str, gender: str = "male", on_stage: Optional[Callable[[str], None]] = None) -> dict:
+        """
+        만화 생성
+
+        Args:
+            on_stage: 단계가 바뀔 때 단계 이름으로 호출 (script, prompt, image, text, save, derivatives)
+        """
+        report = on_stage or (lambda stage: None)
         try:
-            # 1. 스크립트 생성
-            scenes = await self.get_script(text, gender)
+            # 1. 일기 정리 + 스크립트 + 한국어 대사 생성 (한 번의 호출)
+            report("script")
+            script = await self.get_comic_script(text, gender)
+            scenes = script.scenes
             
             # 2. DALL-E 프롬프트 생성
+            report("prompt")
             prompt = await self.build_combined_prompt(scenes, gender)
             
-            # 3. 이미지 생성 (실패 시 기본 이미지 사용)
-            try:
-                comic_img = await self.generate_combined_image(prompt)
-                print("✅ DALL-E 이미지 생성 성공")
-            except Exception as img_error:
-                print(f"⚠️ DALL-E 이미지 생성 실패: {img_error}")
-                print("🔄 기본 이미지 사용")
-                comic_img = self._create_default_image()
+            # 3. 이미지 생성 (같은 프롬프트로 만든 이미지가 캐시에 있으면 재사용, 실패 시 기본 이미지 사용)
+            report("image")
+            cache_key = prompt_cache_key(self._clean_prompt(prompt), model=self.image_provider.name)
+            comic_img = await comic_image_cache.get(cache_key)
+            if comic_img is not None:
+                print("♻️ 캐시된 이미지 사용")
+            else:
+                try:
+                    comic_img = await self.generate_combined_image(prompt)
+                    print("✅ DALL-E 이미지 생성 성공")
+                    # 텍스트를 올리기 전의 기본 이미지를 저장
+                    await comic_image_cache.put(cache_key, comic_img)
+                except Exception as img_error:
+                    print(f"⚠️ DALL-E 이미지 생성 실패: {img_error}")
+                    print("🔄 기본 이미지 사용")
+                    comic_img = self._create_default_image()
             
             # 4. 텍스트 추가
+            report("text")
             comic_img = await self.add_text_boxes_to_combined_image(comic_img, scenes)
             
-            # 5. 이미지 저장
+            # 5. 이미지 저장 (PNG 인코딩은 스레드에서 실행해서 이벤트 루프를 막지 않음)
+            report("save")
             filename = f"comic_{uuid.uuid4().hex[:8]}.png"
             output_dir = "outputs"
             os.makedirs(output_dir, exist_ok=True)
             output_path = os.path.join(output_dir, filename)
-            comic_img.save(output_path)
+            await asyncio.to_thread(comic_img.save, output_path)
+            
+            # 6. 썸네일, 중간 크기, 컷별 파생본 생성 (프로세스 풀, 실패해도 원본은 반환)
+            report("derivatives")
+            try:
+                derivatives = await derivative_renderer.render(output_path)
+            except Exception as derivative_error:
+                print(f"⚠️ 파생본 생성 실패: {derivative_error}")
+                derivatives = None
             
             return {
                 "comic_image_url": f"/outputs/{filename}",
-                "generated_text": text
+                "derivatives": derivatives,
+                "generated_text": text,
+                "diary_text": script.diary_text
             }
             
         except Exception as e:
@@ -304,21 +387,10 @@ Diary: {text}
         # 2x2 그리드 그리기
         panel_width = 512
         panel_height = 512
-        
-        # 패널 경계선 그리기
-        for i in range(1, 2):
-            # 세로선
-            draw.line([(i * panel_width, 0), (i * panel_width, 1024)], fill='black', width=2)
-            # 가로선
-            draw.line([(0, i * panel_height), (1024, i * panel_height)], fill='black', width=2)
+        draw_panel_grid(draw)
         
         # 각 패널에 기본 텍스트 추가
-        positions = [
-            (0, 0), (panel_width, 0),
-            (0, panel_height), (panel_width, panel_height)
-        ]
-        
-        for i, (x, y) in enumerate(positions, 1):
+        for i, (x, y) in enumerate(panel_positions(), 1):
             text = f"Panel {i}"
             # 텍스트를 패널 중앙에 배치
             text_x = x + panel_width // 2 - 50
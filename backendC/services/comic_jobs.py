@@ -0,0 +1,251 @@
+"""
+만화 생성 작업 큐
+
+만화 생성(LLM + DALL-E + 다운로드 + 렌더링)은 수십 초가 걸려서 HTTP 요청으로 끝까지 기다리면
+동시에 들어온 요청 수만큼 연결과 메모리가 묶입니다. 요청은 작업 ID만 받고 바로 반환하고,
+정해진 수의 워커가 큐에서 작업을 꺼내 실행합니다. 단계별 진행 상황은 작업에 기록되어
+클라이언트가 폴링하거나 SSE로 구독합니다.
+같은 (텍스트, 성별) 요청은 진행 중이거나 완료된 작업을 그대로 돌려줍니다.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# ComicGenerator.generate가 알려 주는 단계 (진행률 계산용, 순서대로)
+COMIC_STAGES = ["script", "prompt", "image", "text", "save", "derivatives"]
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+# (텍스트, 성별, 단계 알림 콜백) -> 결과 dict
+ComicRunner = Callable[[str, str, Callable[[str], None]], Awaitable[Dict[str, Any]]]
+
+
+class QueueFullError(Exception):
+    """대기 중인 작업이 큐 한도를 넘음"""
+
+
+def job_key(text: str, gender: str) -> str:
+    """중복 제거용 작업 키 (성별 + 앞뒤 공백을 정리한 텍스트의 SHA-256)"""
+    return hashlib.sha256(f"{gender}\n{text.strip()}".encode("utf-8")).hexdigest()
+
+
+class ComicJob:
+    """만화 생성 작업 하나의 상태"""
+
+    def __init__(self, text: str, gender: str, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.text = text
+        self.gender = gender
+        self.status = STATUS_QUEUED
+        self.stage: Optional[str] = None
+        self.progress = 0.0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at: Optional[float] = None  # 완료/실패 시각 (보관 시간 기준)
+        self.stage_seconds: Dict[str, float] = {}
+
+        self.version = 0  # 상태가 바뀔 때마다 증가 (SSE 구독자가 변경 여부 확인)
+        self._changed = asyncio.Event()
+        self._stage_started = time.monotonic()
+
+    def _touch(self) -> None:
+        self.version += 1
+        self.updated_at = time.time()
+        # 기다리던 구독자를 모두 깨우고 다음 변경용 이벤트로 교체
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def set_stage(self, stage: str) -> None:
+        now = time.monotonic()
+        if self.stage is not None:
+            self.stage_seconds[self.stage] = round(now - self._stage_started, 2)
+        self._stage_started = now
+        self.stage = stage
+        if stage in COMIC_STAGES:
+            self.progress = round(COMIC_STAGES.index(stage) / len(COMIC_STAGES), 2)
+        self._touch()
+
+    def start(self) -> None:
+        self.status = STATUS_RUNNING
+        self._stage_started = time.monotonic()
+        self._touch()
+
+    def finish(self, result: Dict[str, Any]) -> None:
+        self._close_stage()
+        self.status = STATUS_DONE
+        self.progress = 1.0
+        self.result = result
+        self.finished_at = time.time()
+        self._touch()
+
+    def fail(self, error: str) -> None:
+        self._close_stage()
+        self.status = STATUS_FAILED
+        self.error = error
+        self.finished_at = time.time()
+        self._touch()
+
+    def _close_stage(self) -> None:
+        if self.stage is not None and self.stage not in self.stage_seconds:
+            self.stage_seconds[self.stage] = round(time.monotonic() - self._stage_started, 2)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    async def wait_changed(self, version: int, timeout: float) -> bool:
+        """version 이후 상태가 바뀔 때까지 대기 (시간 초과면 False)"""
+        if self.version != version:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'stage': self.stage,
+            'progress': self.progress,
+            'stage_seconds': self.stage_seconds,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ComicJobQueue:
+    """워커 수가 제한된 만화 생성 작업 큐 (완료된 작업은 job_ttl_seconds 동안 보관)"""
+
+    def __init__(self, runner: ComicRunner, max_workers: int = 2, max_pending: int = 100, job_ttl_seconds: float = 3600):
+        self.runner = runner
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.job_ttl_seconds = job_ttl_seconds
+
+        self._jobs: "OrderedDict[str, ComicJob]" = OrderedDict()
+        self._by_key: Dict[str, ComicJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.submitted = 0
+        self.deduplicated = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _ensure_workers(self) -> None:
+        """첫 요청 때 현재 이벤트 루프에서 워커 시작"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [task for task in self._workers if not task.done()]
+        for _ in range(self.max_workers - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def submit(self, text: str, gender: str) -> Tuple[ComicJob, bool]:
+        """
+        작업 등록 (같은 텍스트/성별의 진행 중이거나 완료된 작업이 있으면 그 작업 반환)
+
+        Returns:
+            (작업, 기존 작업 재사용 여부)
+
+        Raises:
+            QueueFullError: 대기 중인 작업이 max_pending 이상일 때
+        """
+        self._prune()
+        key = job_key(text, gender)
+        existing = self._by_key.get(key)
+        if existing is not None and existing.status != STATUS_FAILED:
+            self.deduplicated += 1
+            return existing, True
+
+        self._ensure_workers()
+        if self._queue.qsize() >= self.max_pending:
+            raise QueueFullError(f"대기 중인 만화 생성 작업이 너무 많습니다 ({self.max_pending}개)")
+
+        job = ComicJob(text, gender, key)
+        self._jobs[job.id] = job
+        self._by_key[key] = job
+        self._queue.put_nowait(job)
+        self.submitted += 1
+        return job, False
+
+    def get(self, job_id: str) -> Optional[ComicJob]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ComicJob) -> None:
+        job.start()
+        try:
+            result = await self.runner(job.text, job.gender, job.set_stage)
+        except asyncio.CancelledError:
+            job.fail("작업이 취소되었습니다.")
+            raise
+        except Exception as e:
+            logger.error(f"만화 생성 작업 실패 ({job.id}): {e}")
+            self.failed += 1
+            job.fail(str(e))
+            return
+        self.completed += 1
+        job.finish(result)
+
+    def _prune(self) -> None:
+        """끝난 지 보관 시간이 지난 작업 삭제 (오래 실행된 작업도 완료 시점부터 보관)"""
+        cutoff = time.time() - self.job_ttl_seconds
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            if job.finished_at is None or job.finished_at >= cutoff:
+                continue
+            del self._jobs[job_id]
+            if self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
+
+    def stats(self) -> Dict[str, Any]:
+        """작업 수와 상태별 개수"""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'workers': self.max_workers,
+            'pending': self._queue.qsize() if self._queue is not None else 0,
+            'jobs': counts,
+            'submitted': self.submitted,
+            'deduplicated': self.deduplicated,
+            'completed': self.completed,
+            'failed': self.failed,
+        }
+
+
+def create_comic_job_queue(runner: ComicRunner) -> ComicJobQueue:
+    """설정값으로 작업 큐 생성"""
+    return ComicJobQueue(
+        runner,
+        max_workers=settings.comic_job_workers,
+        max_pending=settings.comic_job_max_pending,
+        job_ttl_seconds=settings.comic_job_ttl_seconds
+    )
@@ -0,0 +1,108 @@
+"""
+만화 스크립트 구조화 응답 파싱
+
+일기 정리, 4컷 장면, 한국어 대사를 한 번의 호출에서 JSON으로 받습니다.
+모델이 코드 블록으로 감싸거나 앞뒤에 설명을 붙여도 첫 JSON 객체를 찾아 읽고,
+JSON이 깨졌으면 기존 "[Panel N]" 텍스트 형식으로도 읽어 봅니다.
+필드가 비어 있으면 그 필드만 대체값으로 채우고 missing에 기록해서 호출하는 쪽이 필요한 것만 다시 요청합니다.
+"""
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+PANEL_COUNT = 4
+
+# 한 번의 호출로 받을 응답 형식 (프롬프트에 그대로 넣음)
+SCRIPT_SCHEMA_EXAMPLE = """{
+  "diary": "감정 이모지로 시작하는 자연스러운 한국어 일기",
+  "panels": [
+    {"scene": "English scene description", "dialogue": "English dialogue", "dialogue_ko": "만화체 한국어 대사"}
+  ]
+}"""
+
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+
+
+class ComicScript(NamedTuple):
+    """정리된 일기와 4컷 장면 (장면마다 scene, dialogue, dialogue_ko)"""
+    diary_text: str
+    scenes: List[Dict[str, str]]
+    missing: List[str]  # 응답에 없어서 대체값을 쓴 필드
+
+
+def extract_json_object(raw: str) -> Optional[Dict[str, Any]]:
+    """응답에서 첫 JSON 객체 추출 (코드 블록, 앞뒤 설명 허용, 없으면 None)"""
+    text = _CODE_FENCE.sub("", (raw or "").strip())
+    try:
+        data = json.loads(text)
+        return data if isinstance(data, dict) else None
+    except ValueError:
+        pass
+
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r"\{", text):
+        try:
+            data, _ = decoder.raw_decode(text, match.start())
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def parse_panel_text(raw: str) -> List[Dict[str, str]]:
+    """기존 "[Panel N] Scene: ... Dialogue: ..." 텍스트 형식 파싱 (찾은 컷만 반환)"""
+    panels = []
+    for i in range(1, PANEL_COUNT + 1):
+        start_token = f"[Panel {i}]"
+        if start_token not in raw:
+            break
+        part = raw.split(start_token, 1)[1]
+        part = part.split(f"[Panel {i + 1}]", 1)[0]
+
+        panel = {"scene": "", "dialogue": ""}
+        for line in part.strip().splitlines():
+            if line.lower().startswith("scene:"):
+                panel["scene"] = line.split(":", 1)[-1].strip()
+            elif line.lower().startswith("dialogue:"):
+                panel["dialogue"] = line.split(":", 1)[-1].strip()
+        panels.append(panel)
+    return panels
+
+
+def _text(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def parse_comic_script(raw: str, fallback_diary: str) -> ComicScript:
+    """
+    구조화 응답을 ComicScript로 변환
+
+    Args:
+        raw: 모델 응답 원문
+        fallback_diary: 일기 필드가 없을 때 쓸 텍스트 (보통 사용자 원문)
+    """
+    data = extract_json_object(raw) or {}
+    missing = []
+
+    diary_text = _text(data.get("diary"))
+    if not diary_text:
+        diary_text = fallback_diary
+        missing.append("diary")
+
+    panels = data.get("panels")
+    if not isinstance(panels, list) or not panels:
+        panels = parse_panel_text(raw or "")
+
+    scenes = []
+    for i in range(PANEL_COUNT):
+        panel = panels[i] if i < len(panels) and isinstance(panels[i], dict) else {}
+        scene = {
+            "scene": _text(panel.get("scene")),
+            "dialogue": _text(panel.get("dialogue")),
+            "dialogue_ko": _text(panel.get("dialogue_ko")),
+        }
+        missing.extend(f"panels[{i}].{field}" for field, value in scene.items() if not value)
+        scenes.append(scene)
+
+    return ComicScript(diary_text, scenes, missing)
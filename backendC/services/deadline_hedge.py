@@ -0,0 +1,154 @@
+"""
+마감 시간 기반 헤지 호출과 회로 차단기
+
+원격 호출(OpenAI)이 마감 시간 안에 끝나지 않으면 로컬 분류기를 동시에 실행하고,
+조건을 만족하는 결과가 먼저 나온 쪽을 반환한 뒤 나머지 작업은 취소합니다.
+마감 초과나 실패가 연속되면 회로를 열어 일정 시간 동안 원격 호출을 건너뜁니다.
+업스트림 상태와 관계없이 응답 시간은 대략 마감 시간 + 로컬 분류 시간으로 제한됩니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 회로 차단기 (closed → open → half-open)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+        self.opens = 0
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """원격 호출 허용 여부 (half-open 상태에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.short_circuits += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            reopen = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopen or (self._opened_at is None and self._consecutive_failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self.opens += 1
+                logger.warning(f"회로 차단기 열림: 연속 {self._consecutive_failures}회 실패, {self.reset_seconds}초간 원격 호출 생략")
+
+    def record_cancel(self) -> None:
+        """결과 없이 끝난 호출 (취소 등): 상태는 그대로 두고 시험 호출 표시만 해제"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self._state(),
+                'consecutive_failures': self._consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'reset_seconds': self.reset_seconds,
+                'opens': self.opens,
+                'short_circuits': self.short_circuits,
+            }
+
+
+class HedgeOutcome(NamedTuple):
+    """헤지 호출 결과"""
+    result: Any
+    source: str  # "primary" 또는 "hedge"
+    primary_on_time: bool  # 원격 호출이 마감 시간 안에 사용 가능한 결과를 반환했는지
+
+
+async def hedged_call(
+    primary: Callable[[], Awaitable[Any]],
+    hedge: Callable[[], Awaitable[Any]],
+    deadline: float,
+    accept: Callable[[Any], bool] = lambda result: True
+) -> HedgeOutcome:
+    """
+    마감 시간 기반 헤지 호출
+
+    primary가 deadline 안에 accept를 만족하는 결과를 반환하면 그대로 사용합니다.
+    마감을 넘기거나 실패하면 hedge를 실행하고, 먼저 사용 가능한 결과를 낸 쪽을 반환하며 나머지는 취소합니다.
+    (스레드에서 실행 중인 동기 호출은 취소 후에도 자체 타임아웃까지 백그라운드에서 끝나고 결과는 버려집니다.)
+    """
+    primary_task = asyncio.ensure_future(primary())
+    done, _ = await asyncio.wait({primary_task}, timeout=deadline)
+
+    unusable = None
+    if done:
+        try:
+            result = primary_task.result()
+            if accept(result):
+                return HedgeOutcome(result, "primary", True)
+            unusable = result
+        except Exception as e:
+            logger.warning(f"원격 호출 실패, 로컬 헤지로 전환: {e}")
+        # 원격 호출이 이미 끝났으므로 로컬 결과만 기다림
+        return HedgeOutcome(await hedge(), "hedge", False)
+
+    logger.info(f"원격 호출이 마감 시간({deadline}초)을 넘겨 로컬 헤지 실행")
+    hedge_task = asyncio.ensure_future(hedge())
+    pending = {primary_task, hedge_task}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            if primary_task in done:
+                try:
+                    result = primary_task.result()
+                    if accept(result):
+                        return HedgeOutcome(result, "primary", False)
+                    unusable = result
+                except Exception as e:
+                    logger.warning(f"원격 호출 실패: {e}")
+
+            if hedge_task in done:
+                try:
+                    return HedgeOutcome(hedge_task.result(), "hedge", False)
+                except Exception as e:
+                    logger.error(f"로컬 헤지 실패: {e}")
+    finally:
+        for task in (primary_task, hedge_task):
+            if not task.done():
+                task.cancel()
+
+    # 양쪽 모두 사용할 수 있는 결과가 없으면 원격 쪽의 폴백 결과 사용
+    if unusable is not None:
+        return HedgeOutcome(unusable, "primary", False)
+    raise RuntimeError("원격 호출과 로컬 헤지가 모두 실패했습니다.")
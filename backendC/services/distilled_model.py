@@ -0,0 +1,195 @@
+"""
+OpenAI 감정 분석 결과로 학습하는 경량 로컬 분류기 (지식 증류)
+
+저장된 OpenAI 분석 결과(정제된 텍스트, 7개 감정 확률)를 교사 라벨로 사용해서
+글자 n-gram 해시 특징 위의 소프트맥스 선형 모델을 학습합니다.
+교사 확률 분포 전체를 목표로 교차 엔트로피를 줄이므로 1등 감정뿐 아니라 점수 분포도 따라갑니다.
+추론은 희소 특징 × 가중치 행렬 곱 한 번이라 GPU나 torch 없이 CPU에서 밀리초 단위로 끝납니다.
+"""
+import json
+import zlib
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# 교사(OpenAI) 응답과 같은 감정 순서
+EMOTION_NAMES = ["JOY", "SADNESS", "ANGER", "FEAR", "SURPRISE", "DISGUST", "NEUTRAL"]
+
+DEFAULT_NGRAM_RANGE = (1, 3)
+DEFAULT_NUM_FEATURES = 1 << 18
+
+
+class SparseRows(NamedTuple):
+    """희소 특징 행렬 (COO 형식, 행 번호 순으로 정렬)"""
+    rows: np.ndarray
+    indices: np.ndarray
+    values: np.ndarray
+    num_rows: int
+
+
+class CharNgramHasher:
+    """글자 n-gram을 고정 크기 특징 공간으로 해싱 (어휘 사전 없이 새 단어도 처리)"""
+
+    def __init__(self, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE, num_features: int = DEFAULT_NUM_FEATURES):
+        self.ngram_range = tuple(ngram_range)
+        self.num_features = num_features
+
+    def _features(self, text: str) -> Dict[int, float]:
+        normalized = f" {' '.join(text.lower().split())} "
+        counts: Dict[int, float] = {}
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            for i in range(len(normalized) - n + 1):
+                index = zlib.crc32(normalized[i:i + n].encode("utf-8")) % self.num_features
+                counts[index] = counts.get(index, 0.0) + 1.0
+        return counts
+
+    def transform(self, texts: Sequence[str]) -> SparseRows:
+        """텍스트 목록을 로그 빈도 + L2 정규화된 희소 특징으로 변환"""
+        rows, indices, values = [], [], []
+        for row, text in enumerate(texts):
+            counts = self._features(text)
+            if not counts:
+                continue
+            weights = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            weights /= np.linalg.norm(weights)
+            rows.append(np.full(len(counts), row, dtype=np.int64))
+            indices.append(np.fromiter(counts.keys(), dtype=np.int64, count=len(counts)))
+            values.append(weights)
+
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return SparseRows(empty, empty, np.zeros(0, dtype=np.float32), len(texts))
+        return SparseRows(np.concatenate(rows), np.concatenate(indices), np.concatenate(values), len(texts))
+
+
+def _segment_sum(ids: np.ndarray, contributions: np.ndarray, size: int) -> np.ndarray:
+    """ids별로 (nnz × 라벨) 기여도 합산 (열마다 bincount)"""
+    out = np.zeros((size, contributions.shape[1]), dtype=np.float64)
+    for column in range(contributions.shape[1]):
+        out[:, column] = np.bincount(ids, weights=contributions[:, column], minlength=size)
+    return out
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+class LinearEmotionModel:
+    """해시 글자 n-gram 특징 위의 소프트맥스 선형 모델"""
+
+    def __init__(self, hasher: CharNgramHasher, labels: Sequence[str] = EMOTION_NAMES):
+        self.hasher = hasher
+        self.labels = list(labels)
+        self.weights = np.zeros((hasher.num_features, len(self.labels)), dtype=np.float32)
+        self.bias = np.zeros(len(self.labels), dtype=np.float32)
+
+    def _logits(self, features: SparseRows) -> np.ndarray:
+        contributions = self.weights[features.indices] * features.values[:, None]
+        return _segment_sum(features.rows, contributions, features.num_rows) + self.bias
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """(텍스트 × 감정) 확률"""
+        return softmax(self._logits(self.hasher.transform(texts)))
+
+    def fit(
+        self,
+        texts: Sequence[str],
+        targets: np.ndarray,
+        epochs: int = 10,
+        batch_size: int = 64,
+        learning_rate: float = 0.5,
+        l2: float = 1e-6,
+        seed: int = 42
+    ) -> List[float]:
+        """
+        교사 확률 분포(targets)에 대한 교차 엔트로피를 AdaGrad 미니배치로 최소화
+
+        Returns:
+            에폭별 평균 손실
+        """
+        features = self.hasher.transform(texts)
+        targets = np.asarray(targets, dtype=np.float64)
+        targets = targets / targets.sum(axis=1, keepdims=True)
+
+        # 행별 특징 구간 (rows가 정렬되어 있으므로 searchsorted로 배치 추출)
+        row_starts = np.searchsorted(features.rows, np.arange(len(texts) + 1))
+
+        weight_acc = np.zeros_like(self.weights)
+        bias_acc = np.zeros_like(self.bias)
+        rng = np.random.RandomState(seed)
+        history = []
+
+        for _ in range(epochs):
+            order = rng.permutation(len(texts))
+            total_loss = 0.0
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                spans = [np.arange(row_starts[row], row_starts[row + 1]) for row in batch]
+                positions = np.concatenate(spans) if spans else np.zeros(0, dtype=np.int64)
+                local_rows = np.repeat(np.arange(len(batch)), [len(span) for span in spans])
+                batch_features = SparseRows(
+                    local_rows, features.indices[positions], features.values[positions], len(batch)
+                )
+
+                probabilities = softmax(self._logits(batch_features))
+                batch_targets = targets[batch]
+                total_loss -= float(np.sum(batch_targets * np.log(probabilities + 1e-12)))
+
+                error = (probabilities - batch_targets) / len(batch)
+                unique, inverse = np.unique(batch_features.indices, return_inverse=True)
+                grad = _segment_sum(inverse, batch_features.values[:, None] * error[batch_features.rows], len(unique))
+                grad += l2 * self.weights[unique]
+                bias_grad = error.sum(axis=0)
+
+                weight_acc[unique] += grad ** 2
+                self.weights[unique] -= learning_rate * grad / np.sqrt(weight_acc[unique] + 1e-8)
+                bias_acc += bias_grad ** 2
+                self.bias -= learning_rate * bias_grad / np.sqrt(bias_acc + 1e-8)
+
+            history.append(total_loss / max(len(texts), 1))
+        return history
+
+    def save(self, path: str) -> None:
+        """가중치와 특징 설정을 npz 하나로 저장 (0인 가중치 행은 생략)"""
+        used = np.flatnonzero(np.any(self.weights != 0, axis=1))
+        config = {
+            'labels': self.labels,
+            'ngram_range': list(self.hasher.ngram_range),
+            'num_features': self.hasher.num_features,
+        }
+        np.savez_compressed(
+            path, rows=used, weights=self.weights[used], bias=self.bias,
+            config=np.array(json.dumps(config))
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LinearEmotionModel":
+        with np.load(path) as data:
+            config = json.loads(str(data["config"]))
+            model = cls(CharNgramHasher(tuple(config["ngram_range"]), config["num_features"]), config["labels"])
+            model.weights[data["rows"]] = data["weights"]
+            model.bias[:] = data["bias"]
+        return model
+
+
+def agreement_report(student: np.ndarray, teacher: np.ndarray, labels: Sequence[str] = EMOTION_NAMES) -> Dict[str, Any]:
+    """교사 대비 1등 감정 일치율, 확률 평균 절대 오차, 감정별 재현율"""
+    student_top = student.argmax(axis=1)
+    teacher_top = teacher.argmax(axis=1)
+    per_label = {}
+    for column, label in enumerate(labels):
+        mask = teacher_top == column
+        if mask.any():
+            per_label[label] = {
+                'count': int(mask.sum()),
+                'recall': round(float(np.mean(student_top[mask] == column)), 4),
+            }
+    return {
+        'samples': int(len(teacher)),
+        'top1_agreement': round(float(np.mean(student_top == teacher_top)), 4) if len(teacher) else 0.0,
+        'mean_abs_error': round(float(np.mean(np.abs(student - teacher))), 4) if len(teacher) else 0.0,
+        'per_label': per_label,
+    }
@@ -1,23 +1,49 @@
 """
 감정 분석 서비스
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import logging
 from datetime import datetime
 import re
 import json
 
 from models.emotion import EmotionAnalysisRequest, EmotionAnalysisResult, EmotionAnalysisResponse
-from services.emotion_classifier import openai_classifier, koelectra_generalized_classifier
+from services.emotion_classifier import openai_classifier, koelectra_generalized_classifier, local_classifiers
+from services.classifier_cascade import ClassifierCascade
+from services.near_duplicate_index import NearDuplicateIndex
+from services.model_registry import model_registry
+from services.emotion_timeline import expand_timeline
 from config.database import db_manager
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# 유사 일기 결과를 재사용했을 때 model_used에 붙이는 표시
+NEAR_DUPLICATE_SUFFIX = "+near-duplicate"
+
 class EmotionAnalysisService:
     """감정 분석 서비스"""
     
     def __init__(self):
         self.collection_name = "emotion_analysis"
+        
+        # 로컬 우선 캐스케이드 (신뢰도가 낮은 텍스트만 OpenAI 사용)
+        self.local_classifier = local_classifiers.get(
+            settings.cascade_local_model, koelectra_generalized_classifier
+        )
+        self.cascade = ClassifierCascade(
+            local=self.local_classifier,
+            remote=openai_classifier,
+            threshold=settings.cascade_confidence_threshold
+        )
+        
+        # 같은 사용자의 거의 같은 일기는 이전 분석 결과 재사용
+        self.duplicate_index = NearDuplicateIndex(
+            threshold=settings.near_duplicate_threshold,
+            max_entries=settings.near_duplicate_max_entries
+        )
+        self._warmed_users = set()
+        self._analysis_count = 0
     
     def _sanitize_text(self, text: str) -> str:
         """텍스트 데이터 정제 - 제어 문자 및 문제가 될 수 있는 문자 제거"""
@@ -38,8 +64,8 @@ class EmotionAnalysisService:
         if not text:
             return ""
         
-        # 텍스트 길이 제한 (너무 긴 텍스트는 잘라냄)
-        max_length = 1000
+        # 텍스트 길이 제한 (비정상적으로 긴 입력만 잘라냄, 일반적인 긴 일기는 분류기에서 구간으로 나눠 분석)
+        max_length = settings.max_analysis_text_length
         if len(text) > max_length:
             text = text[:max_length]
             logger.warning(f"텍스트가 너무 길어서 {max_length}자로 잘렸습니다.")
@@ -64,17 +90,40 @@ class EmotionAnalysisService:
             user_id=request.user_id.strip()
         )
     
+    def _resolve_model_type(self, model_type: Optional[str]) -> str:
+        """요청한 모델 타입 정규화 (기본값은 settings.emotion_model_type)"""
+        model_type = (model_type or settings.emotion_model_type).lower()
+        if model_type in local_classifiers or model_type in ("cascade", "openai"):
+            return model_type
+        # 지원하지 않는 모델 타입인 경우 OpenAI를 기본으로 사용
+        logger.warning(f"지원하지 않는 모델 타입 '{model_type}', OpenAI 모델을 사용합니다.")
+        return "openai"
+    
+    def _select_classifier(self, model_type: Optional[str]):
+        """모델 타입에 해당하는 분류기 선택 (기본값은 settings.emotion_model_type)"""
+        model_type = self._resolve_model_type(model_type)
+        if model_type in local_classifiers:
+            return local_classifiers[model_type]
+        if model_type == "cascade":
+            return self.cascade
+        return openai_classifier
+    
+    @staticmethod
+    def _duplicate_scope(user_id: str, model_type: str) -> str:
+        """유사 일기 인덱스 범위 (다른 모델로 분석한 결과는 재사용하지 않도록 사용자 + 모델 타입)"""
+        return f"{user_id}:{model_type}"
+    
     async def analyze_emotion(
         self, 
         request: EmotionAnalysisRequest,
-        model_type: str = "openai"  # OpenAI를 기본으로 사용
+        model_type: Optional[str] = None  # 기본값은 settings.emotion_model_type (OpenAI)
     ) -> EmotionAnalysisResponse:
         """
         텍스트 감정 분석
         
         Args:
             request: 감정 분석 요청
-            model_type: 사용할 모델 ("openai", "generalized")
+            model_type: 사용할 모델 ("openai", "generalized", "onnx", "distilled", "cascade")
         
         Returns:
             EmotionAnalysisResponse: 감정 분석 결과
@@ -83,22 +132,37 @@ class EmotionAnalysisService:
             # 요청 데이터 검증 및 정제
             validated_request = self._validate_request(request)
             
-            # 모델 선택 - 기본값은 OpenAI 모델 사용
-            if model_type.lower() == "generalized":
-                classifier = koelectra_generalized_classifier
-            elif model_type.lower() == "openai":
-                classifier = openai_classifier
-            else:
-                # 지원하지 않는 모델 타입인 경우 OpenAI를 기본으로 사용
-                logger.warning(f"지원하지 않는 모델 타입 '{model_type}', OpenAI 모델을 사용합니다.")
-                classifier = openai_classifier
-            
-            # 감정 분석 수행
-            result = await classifier.predict(validated_request.text)
+            model_type = self._resolve_model_type(model_type)
+            
+            # 같은 모델로 분석한 최근 결과 중 거의 같은 일기가 있으면 분류기 호출 없이 재사용
+            signature = None
+            result = None
+            if settings.near_duplicate_enabled:
+                signature = self.duplicate_index.signature(validated_request.text)
+                result = await self._find_near_duplicate(validated_request, signature, model_type)
+            
+            if result is None:
+                # 모델 선택 - 기본값은 OpenAI 모델 사용
+                classifier = self._select_classifier(model_type)
+                
+                # 감정 분석 수행
+                result = await classifier.predict(validated_request.text)
             result.user_id = validated_request.user_id
             
+            # 문장별 감정 흐름 (로컬 모델 배치 1회)
+            extra_fields = {}
+            if signature is not None:
+                extra_fields["text_minhash"] = signature
+                extra_fields["model_type"] = model_type
+            timeline = await self._build_emotion_timeline(validated_request.text)
+            if timeline is not None:
+                extra_fields["emotion_timeline"] = timeline
+            
             # 결과를 데이터베이스에 저장
-            await self._save_analysis_result(result)
+            await self._save_analysis_result(result, extra_fields)
+            if signature is not None:
+                scope = self._duplicate_scope(validated_request.user_id, model_type)
+                self.duplicate_index.add(result.id, signature, scope, result)
             
             # 응답 객체 생성
             response = EmotionAnalysisResponse(
@@ -111,6 +175,7 @@ class EmotionAnalysisService:
             )
             
             logger.info(f"감정 분석 완료: {result.primary_emotion} ({result.confidence:.3f})")
+            self._log_service_stats()
             return response
             
         except ValueError as e:
@@ -120,14 +185,158 @@ class EmotionAnalysisService:
             logger.error(f"감정 분석 실패: {e}")
             raise
     
-    async def _save_analysis_result(self, result: EmotionAnalysisResult) -> str:
-        """감정 분석 결과를 데이터베이스에 저장"""
+    async def analyze_emotions_batch(
+        self,
+        requests: List[EmotionAnalysisRequest],
+        model_type: Optional[str] = None
+    ) -> List[EmotionAnalysisResponse]:
+        """
+        여러 텍스트 감정 분석 (일괄 처리/백필용, 입력 순서대로 반환)
+        
+        OpenAI 모델은 여러 텍스트를 하나의 요청으로 묶어 요청 수와 프롬프트 토큰을 줄이고,
+        다른 모델은 텍스트별로 분석합니다.
+        """
+        validated_requests = [self._validate_request(request) for request in requests]
+        model_type = self._resolve_model_type(model_type)
+        classifier = self._select_classifier(model_type)
+        
+        if classifier is openai_classifier:
+            results = await openai_classifier.predict_batch([request.text for request in validated_requests])
+        else:
+            results = [await classifier.predict(request.text) for request in validated_requests]
+        
+        responses = []
+        for request, result in zip(validated_requests, results):
+            result.user_id = request.user_id
+            
+            # 단건 분석과 같이 서명을 저장하고 인덱스에 등록 (이후 단건 요청에서 재사용)
+            extra_fields = {}
+            signature = None
+            if settings.near_duplicate_enabled:
+                signature = self.duplicate_index.signature(request.text)
+                extra_fields = {"text_minhash": signature, "model_type": model_type}
+            await self._save_analysis_result(result, extra_fields)
+            if signature is not None:
+                scope = self._duplicate_scope(request.user_id, model_type)
+                self.duplicate_index.add(result.id, signature, scope, result)
+            responses.append(EmotionAnalysisResponse(
+                primary_emotion=result.primary_emotion,
+                primary_emotion_score=result.primary_emotion_score,
+                primary_emotion_emoji=result.primary_emotion_emoji,
+                all_emotions=result.all_emotions,
+                confidence=result.confidence,
+                model_used=result.model_used
+            ))
+        
+        logger.info(f"감정 일괄 분석 완료: {len(responses)}개")
+        return responses
+    
+    async def _find_near_duplicate(
+        self,
+        request: EmotionAnalysisRequest,
+        signature: List[int],
+        model_type: str
+    ) -> Optional[EmotionAnalysisResult]:
+        """같은 사용자가 같은 모델로 분석한 최근 결과 중 유사도가 기준 이상인 결과를 복사해서 반환"""
+        if request.user_id not in self._warmed_users:
+            await self._warm_duplicate_index(request.user_id)
+        
+        match = self.duplicate_index.query(signature, scope=self._duplicate_scope(request.user_id, model_type))
+        if match is None:
+            return None
+        
+        logger.info(f"유사 일기 분석 결과 재사용: {match.key} (유사도 {match.similarity:.3f})")
+        # 재사용한 결과가 다시 인덱스에 들어가 재사용되어도 표시는 한 번만 붙임
+        model_used = match.payload.model_used
+        if model_used.endswith(NEAR_DUPLICATE_SUFFIX):
+            model_used = model_used[:-len(NEAR_DUPLICATE_SUFFIX)]
+        return match.payload.copy(update={
+            'id': None,
+            'text': request.text,
+            'model_used': f"{model_used}{NEAR_DUPLICATE_SUFFIX}"
+        })
+    
+    async def _build_emotion_timeline(self, text: str) -> Optional[dict]:
+        """문장별 감정 타임라인 계산 (실패해도 분석 결과 저장은 계속 진행)"""
+        if not settings.emotion_timeline_enabled:
+            return None
+        try:
+            return await self.local_classifier.predict_timeline(text)
+        except Exception as e:
+            logger.warning(f"감정 타임라인 계산 실패: {e}")
+            return None
+    
+    async def _warm_duplicate_index(self, user_id: str) -> None:
+        """서버 재시작 후 첫 요청 시 사용자의 최근 분석 서명을 인덱스에 등록"""
+        self._warmed_users.add(user_id)
+        try:
+            collection = db_manager.get_collection(self.collection_name)
+            query = (
+                collection.where("user_id", "==", user_id)
+                .order_by("analyzed_at", direction="desc")
+                .limit(settings.near_duplicate_warm_limit)
+            )
+            for doc in query.get():
+                doc_data = doc.to_dict()
+                signature = doc_data.pop("text_minhash", None)
+                model_type = doc_data.pop("model_type", None)
+                doc_data.pop("emotion_timeline", None)
+                # 모델 타입이 기록되지 않은 결과는 어떤 모델 요청에 재사용할지 알 수 없으므로 제외
+                if signature and model_type:
+                    doc_data["id"] = doc.id
+                    scope = self._duplicate_scope(user_id, model_type)
+                    self.duplicate_index.add(doc.id, signature, scope, EmotionAnalysisResult(**doc_data))
+        except Exception as e:
+            logger.warning(f"유사 일기 인덱스 초기화 실패 ({user_id}): {e}")
+    
+    def get_duplicate_index_stats(self) -> dict:
+        """유사 일기 재사용 적중률 등 인덱스 통계"""
+        return self.duplicate_index.stats()
+    
+    def get_model_registry_stats(self) -> dict:
+        """로컬 모델별 로드 상태, 메모리 사용량, 퇴출 횟수"""
+        return model_registry.stats()
+    
+    def get_hedge_stats(self) -> dict:
+        """OpenAI 마감 초과 헤지 및 회로 차단기 상태"""
+        return openai_classifier.get_hedge_stats()
+    
+    def get_cascade_stats(self) -> dict:
+        """캐스케이드 에스컬레이션 비율 및 단계별 지연 시간"""
+        return {
+            'threshold': self.cascade.threshold,
+            **self.cascade.metrics.stats()
+        }
+    
+    def get_service_stats(self) -> dict:
+        """운영 지표 묶음 (주기적 통계 로그용)"""
+        return {
+            'cascade': self.get_cascade_stats(),
+            'duplicate_index': self.get_duplicate_index_stats(),
+        }
+    
+    def _log_service_stats(self) -> None:
+        """분석 service_stats_log_interval건마다 통계를 로그로 남김 (캐스케이드 임계값, 유사 일기 기준값 조정용)"""
+        self._analysis_count += 1
+        interval = settings.service_stats_log_interval
+        if interval <= 0 or self._analysis_count % interval:
+            return
+        logger.info(f"감정 분석 서비스 통계: {json.dumps(self.get_service_stats(), ensure_ascii=False)}")
+    
+    async def _save_analysis_result(
+        self,
+        result: EmotionAnalysisResult,
+        extra_fields: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """감정 분석 결과를 데이터베이스에 저장 (유사 일기 MinHash 서명, 감정 타임라인 등 부가 필드 포함)"""
         try:
             collection = db_manager.get_collection(self.collection_name)
             
             # 결과를 딕셔너리로 변환
             result_dict = result.dict(exclude_unset=True)
             result_dict["analyzed_at"] = datetime.utcnow()
+            if extra_fields:
+                result_dict.update(extra_fields)
             
             # Firebase에 저장
             time_ref, doc_ref = collection.add(result_dict)
@@ -155,9 +364,7 @@ class EmotionAnalysisService:
             
             results = []
             for doc in docs:
-                doc_data = doc.to_dict()
-                doc_data["id"] = doc.id
-                result = EmotionAnalysisResult(**doc_data)
+                result, _ = self._doc_to_result(doc)
                 results.append(result)
             
             return results
@@ -165,6 +372,38 @@ class EmotionAnalysisService:
         except Exception as e:
             logger.error(f"감정 분석 이력 조회 실패: {e}")
             raise
+    
+    async def get_analysis_detail(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """
+        감정 분석 결과 상세 조회 (문장별 감정 타임라인 포함)
+        
+        Returns:
+            {'analysis': 분석 결과, 'emotion_timeline': 문장 목록 또는 None}, 결과가 없으면 None
+        """
+        try:
+            collection = db_manager.get_collection(self.collection_name)
+            doc = collection.document(analysis_id).get()
+            if not doc.exists():
+                return None
+            
+            result, timeline = self._doc_to_result(doc)
+            return {
+                'analysis': result,
+                'emotion_timeline': expand_timeline(timeline, result.text or "") if timeline else None
+            }
+            
+        except Exception as e:
+            logger.error(f"감정 분석 결과 조회 실패 ({analysis_id}): {e}")
+            raise
+    
+    def _doc_to_result(self, doc) -> tuple:
+        """저장된 문서를 (분석 결과, 저장된 감정 타임라인) 으로 변환 (부가 필드는 결과 모델에서 분리)"""
+        doc_data = doc.to_dict()
+        doc_data["id"] = doc.id
+        doc_data.pop("text_minhash", None)
+        doc_data.pop("model_type", None)
+        timeline = doc_data.pop("emotion_timeline", None)
+        return EmotionAnalysisResult(**doc_data), timeline
 
 # 전역 감정 분석 서비스 인스턴스
 emotion_service = EmotionAnalysisService() 
\ No newline at end of file
@@ -6,6 +6,8 @@ from typing import Dict, List, Any
 from models.emotion import EmotionAnalysisRequest, EmotionAnalysisResult, EmotionScore
 import random
 
+from services.keyword_scoring import KeywordLexicon
+
 logger = logging.getLogger(__name__)
 
 class MockEmotionService:
@@ -21,16 +23,40 @@ class MockEmotionService:
             {"emotion": "혐오", "emoji": "🤢"},
             {"emotion": "중성", "emoji": "😐"},
         ]
+        
+        # 키워드 매핑
+        self.keyword_mapping = {
+            "기쁨": ["행복", "기쁘", "즐거", "웃", "좋", "사랑", "감사", "축하"],
+            "슬픔": ["슬프", "우울", "아프", "눈물", "힘들", "괴로", "외로"],
+            "분노": ["화", "짜증", "열받", "분노", "싫", "미워", "답답"],
+            "두려움": ["무서", "걱정", "불안", "두렵", "떨려", "겁"],
+            "놀람": ["놀라", "깜짝", "어머", "헉", "와", "대박"],
+            "혐오": ["역겨", "싫", "더러", "지겨", "짜증"],
+            "중성": ["평범", "그냥", "보통", "일반적"]
+        }
+        self.lexicon = KeywordLexicon(self.keyword_mapping)
     
     async def analyze_emotion(self, request: EmotionAnalysisRequest) -> EmotionAnalysisResult:
         """감정 분석 (Mock 버전)"""
+        return (await self.analyze_emotions_batch([request]))[0]
+    
+    async def analyze_emotions_batch(self, requests: List[EmotionAnalysisRequest]) -> List[EmotionAnalysisResult]:
+        """여러 텍스트 감정 분석 (Mock 버전, 키워드 채점은 한 번에 계산, 입력 순서대로 반환)"""
         try:
-            # 텍스트 기반 간단한 감정 분석
-            text_lower = request.text.lower()
-            
             # 키워드 기반 감정 분석
-            primary_emotion = self._detect_primary_emotion(text_lower)
-            
+            primary_emotions = self._detect_primary_emotions([request.text for request in requests])
+        except Exception as e:
+            logger.error(f"Mock 감정 분석 중 오류: {e}")
+            return [self._default_result(request) for request in requests]
+        
+        return [
+            self._build_result(request, primary_emotion)
+            for request, primary_emotion in zip(requests, primary_emotions)
+        ]
+    
+    def _build_result(self, request: EmotionAnalysisRequest, primary_emotion: Dict[str, Any]) -> EmotionAnalysisResult:
+        """감지된 주요 감정으로 결과 생성"""
+        try:
             # 모든 감정 점수 생성
             all_emotions = []
             for emotion_info in self.emotions:
@@ -58,65 +84,45 @@ class MockEmotionService:
             
         except Exception as e:
             logger.error(f"Mock 감정 분석 중 오류: {e}")
-            # 기본값 반환
-            return EmotionAnalysisResult(
-                primary_emotion="중성",
-                primary_emotion_score=0.7,
-                primary_emotion_emoji="😐",
-                all_emotions=[
-                    EmotionScore(emotion="중성", score=0.7, emoji="😐"),
-                    EmotionScore(emotion="기쁨", score=0.2, emoji="😊"),
-                    EmotionScore(emotion="슬픔", score=0.1, emoji="😢"),
-                ],
-                confidence=0.7,
-                user_id=request.user_id
-            )
+            return self._default_result(request)
+    
+    def _default_result(self, request: EmotionAnalysisRequest) -> EmotionAnalysisResult:
+        """기본값 반환"""
+        return EmotionAnalysisResult(
+            primary_emotion="중성",
+            primary_emotion_score=0.7,
+            primary_emotion_emoji="😐",
+            all_emotions=[
+                EmotionScore(emotion="중성", score=0.7, emoji="😐"),
+                EmotionScore(emotion="기쁨", score=0.2, emoji="😊"),
+                EmotionScore(emotion="슬픔", score=0.1, emoji="😢"),
+            ],
+            confidence=0.7,
+            user_id=request.user_id
+        )
     
     def _detect_primary_emotion(self, text: str) -> Dict[str, Any]:
         """키워드 기반 감정 감지"""
+        return self._detect_primary_emotions([text])[0]
+    
+    def _detect_primary_emotions(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """키워드 기반 감정 감지 (적중 행렬 × 키워드 가중치로 여러 텍스트를 한 번에 채점)"""
+        emotion_scores = self.lexicon.score(texts)
         
-        # 키워드 매핑
-        keyword_mapping = {
-            "기쁨": ["행복", "기쁘", "즐거", "웃", "좋", "사랑", "감사", "축하"],
-            "슬픔": ["슬프", "우울", "아프", "눈물", "힘들", "괴로", "외로"],
-            "분노": ["화", "짜증", "열받", "분노", "싫", "미워", "답답"],
-            "두려움": ["무서", "걱정", "불안", "두렵", "떨려", "겁"],
-            "놀람": ["놀라", "깜짝", "어머", "헉", "와", "대박"],
-            "혐오": ["역겨", "싫", "더러", "지겨", "짜증"],
-            "중성": ["평범", "그냥", "보통", "일반적"]
-        }
-        
-        emotion_scores = {}
-        
-        for emotion, keywords in keyword_mapping.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text:
-                    score += 1
-            emotion_scores[emotion] = score
-        
-        # 점수가 가장 높은 감정 선택
-        primary_emotion_name = max(emotion_scores, key=emotion_scores.get)
-        
-        # 점수가 0이면 중성으로 설정
-        if emotion_scores[primary_emotion_name] == 0:
-            primary_emotion_name = "중성"
-        
-        # 해당 감정 정보 찾기
-        for emotion_info in self.emotions:
-            if emotion_info["emotion"] == primary_emotion_name:
-                return {
-                    "emotion": emotion_info["emotion"],
-                    "score": random.uniform(0.6, 0.9),
-                    "emoji": emotion_info["emoji"]
-                }
+        # 점수가 가장 높은 감정 선택 (동점이면 먼저 정의된 감정)
+        best = emotion_scores.argmax(axis=1)
         
-        # 기본값
-        return {
-            "emotion": "중성",
-            "score": 0.7,
-            "emoji": "😐"
-        }
+        emoji_map = {info["emotion"]: info["emoji"] for info in self.emotions}
+        results = []
+        for row, column in zip(emotion_scores, best):
+            # 점수가 0이면 중성으로 설정
+            primary_emotion_name = self.lexicon.labels[column] if row[column] > 0 else "중성"
+            results.append({
+                "emotion": primary_emotion_name,
+                "score": random.uniform(0.6, 0.9),
+                "emoji": emoji_map.get(primary_emotion_name, "😐")
+            })
+        return results
 
 # 싱글톤 인스턴스 생성
 emotion_service = MockEmotionService() 
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+일기 내 문장별 감정 흐름 (감정 타임라인)
+
+문장별 감정 점수로 감정 흐름과 전환 지점을 만들고, 분석 결과 옆에 저장할 수 있는
+작은 JSON 형식으로 변환합니다. 문장 원문은 저장하지 않고 원문 기준 위치만 기록합니다.
+
+저장 형식:
+    {
+        "v": 1,
+        "segments": [[시작, 끝, "JOY", 0.62], ...],      # 문장별 (위치, 주요 감정, 점수)
+        "transitions": [[2, "JOY", "SADNESS"], ...]      # 감정이 바뀐 문장 번호와 전후 감정
+    }
+"""
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+TIMELINE_VERSION = 1
+
+
+def build_timeline(spans: Sequence[Tuple[int, int]], sentence_scores: Sequence[Mapping[Any, float]]) -> Dict[str, Any]:
+    """
+    문장 위치와 문장별 감정 점수로 타임라인 생성
+
+    Args:
+        spans: 원문 기준 문장 (시작, 끝) 위치
+        sentence_scores: 문장별 {감정 라벨: 점수} (라벨은 Enum 또는 문자열)
+    """
+    segments: List[List[Any]] = []
+    transitions: List[List[Any]] = []
+
+    previous = None
+    for index, ((start, end), scores) in enumerate(zip(spans, sentence_scores)):
+        primary = max(scores, key=scores.get)
+        name = getattr(primary, "name", str(primary))
+        segments.append([start, end, name, round(float(scores[primary]), 3)])
+
+        if previous is not None and name != previous:
+            transitions.append([index, previous, name])
+        previous = name
+
+    return {'v': TIMELINE_VERSION, 'segments': segments, 'transitions': transitions}
+
+
+def expand_timeline(timeline: Mapping[str, Any], text: str) -> List[Dict[str, Any]]:
+    """저장된 타임라인을 앱 표시용 문장 목록으로 변환"""
+    return [
+        {'index': index, 'text': text[start:end], 'emotion': emotion, 'score': score}
+        for index, (start, end, emotion, score) in enumerate(timeline.get('segments', []))
+    ]
@@ -23,6 +23,7 @@ except ImportError:
 from models.emotion import EmotionLabel, EmotionAnalysisRequest
 from models.feedback import FeedbackGenerationRequest, FeedbackResult, FeedbackResponse
 from config.settings import settings
+from services.llm_gateway import LANE_INTERACTIVE, estimate_chat_tokens, llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,8 @@ class OpenAIFeedbackGenerator:
                 
             if api_key:
                 try:
-                    self.client = OpenAI_class(api_key=api_key)
+                    # 재시도는 공용 게이트웨이가 담당 (클라이언트 자체 재시도 끔)
+                    self.client = OpenAI_class(api_key=api_key, max_retries=0)
                     print("DEBUG: OpenAI client initialized successfully")
                     logger.info("OpenAI API 클라이언트 초기화 성공")
                 except Exception as e:
@@ -181,19 +183,24 @@ class OpenAIFeedbackGenerator:
             # 사용자 프롬프트
             user_prompt = f"다음 일기 내용에 대해 피드백을 해주세요:\n\n{request.text}"
             
-            # OpenAI API 호출
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=300,
-                temperature=0.7,
-                top_p=1.0,
-                frequency_penalty=0.0,
-                presence_penalty=0.0
+            # OpenAI API 호출 (공용 게이트웨이의 사용자 요청 레인)
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            response = await llm_gateway.run(
+                lambda: asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=300,
+                    temperature=0.7,
+                    top_p=1.0,
+                    frequency_penalty=0.0,
+                    presence_penalty=0.0
+                ),
+                lane=LANE_INTERACTIVE,
+                estimated_tokens=estimate_chat_tokens(messages, 300)
             )
             
             # 응답 텍스트 추출
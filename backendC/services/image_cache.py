@@ -0,0 +1,153 @@
+"""
+만화 기본 이미지 캐시 (프롬프트 해시 기반)
+
+DALL-E 이미지 생성은 만화 생성에서 가장 느리고 비싼 단계입니다.
+정리된 결합 프롬프트가 같으면 같은 이미지를 다시 그릴 필요가 없으므로
+텍스트를 올리기 전의 기본 이미지를 프롬프트 SHA-256 이름으로 저장해 두고 재사용합니다.
+캐시 디렉터리 전체 크기가 한도를 넘으면 가장 오래 안 쓴 이미지부터 지웁니다 (파일 수정 시각으로 LRU 관리).
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from PIL import Image
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".png"
+
+
+def prompt_cache_key(prompt: str, model: str = "dall-e-3", size: str = "1024x1024") -> str:
+    """이미지 생성 조건(모델, 크기, 정리된 프롬프트)의 SHA-256"""
+    return hashlib.sha256(f"{model}\n{size}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class ImageCache:
+    """디렉터리 기반 이미지 캐시 (크기 한도 초과 시 LRU 퇴출)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes  # 0이면 캐시 사용 안 함
+
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None  # 키 -> 파일 크기 (오래 안 쓴 순서)
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """처음 사용할 때 디렉터리를 읽어 인덱스 구성 (수정 시각 순서 = 마지막 사용 순서)"""
+        if self._entries is None:
+            os.makedirs(self.directory, exist_ok=True)
+            files = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:-len(CACHE_FILE_SUFFIX)], stat.st_size))
+            self._entries = OrderedDict((key, size) for _, key, size in sorted(files))
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def get_sync(self, key: str) -> Optional[Image.Image]:
+        """캐시된 이미지 반환 (없으면 None, 반환한 이미지는 수정해도 캐시에 영향 없음)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entries = self._load_index()
+            if key not in entries:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with Image.open(path) as img:
+                    img.load()
+                    image = img.copy()
+                os.utime(path)
+            except OSError as e:
+                logger.warning(f"캐시 이미지 읽기 실패, 항목 삭제: {key} ({e})")
+                self._remove(key)
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put_sync(self, key: str, image: Image.Image) -> None:
+        """이미지 저장 후 크기 한도를 넘으면 오래 안 쓴 이미지부터 삭제"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entries = self._load_index()
+            path = self._path(key)
+            # 임시 파일에 쓰고 교체해서 읽는 쪽이 덜 쓴 파일을 보지 않도록 함
+            temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                image.save(temp_path, format="PNG")
+                os.replace(temp_path, path)
+            except OSError as e:
+                logger.warning(f"캐시 이미지 저장 실패: {key} ({e})")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return
+
+            self._total_bytes -= entries.pop(key, 0)
+            entries[key] = os.path.getsize(path)
+            self._total_bytes += entries[key]
+            self._evict()
+
+    def _evict(self) -> None:
+        # 방금 저장한 항목(맨 뒤)은 남김
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    async def get(self, key: str) -> Optional[Image.Image]:
+        return await asyncio.to_thread(self.get_sync, key)
+
+    async def put(self, key: str, image: Image.Image) -> None:
+        await asyncio.to_thread(self.put_sync, key, image)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률과 캐시 크기"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'entries': len(self._entries or {}),
+                'size_mb': round(self._total_bytes / 1024 / 1024, 1),
+                'max_mb': round(self.max_bytes / 1024 / 1024, 1),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / requests, 4) if requests else 0.0,
+                'evictions': self.evictions,
+            }
+
+
+# 싱글톤 인스턴스 생성
+comic_image_cache = ImageCache(
+    directory=settings.comic_image_cache_dir,
+    max_bytes=int(settings.comic_image_cache_max_mb * 1024 * 1024)
+)
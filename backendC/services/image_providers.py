@@ -0,0 +1,141 @@
+"""
+만화 이미지 생성기 (DALL-E / 로컬 절차적 렌더러)
+
+ComicGenerator는 이미지 생성을 ImageProvider에 맡깁니다.
+- dalle: OpenAI DALL-E 3로 생성하고 이미지를 내려받음 (운영 기본값)
+- local: 프롬프트 해시를 시드로 4컷 격자 이미지를 그림 (네트워크 없음, 같은 프롬프트는 같은 이미지)
+  지연 시간을 흉내 낼 수 있어서 네트워크 없이 만화 생성 처리량과 메모리를 측정할 때 사용합니다.
+"""
+import asyncio
+import hashlib
+import io
+import random
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+import httpx
+from PIL import Image, ImageDraw
+
+from services.llm_gateway import LANE_COMIC, llm_gateway
+
+IMAGE_SIZE = 1024
+
+
+def panel_positions(width: int = IMAGE_SIZE, height: int = IMAGE_SIZE) -> List[Tuple[int, int]]:
+    """2x2 격자 각 컷의 왼쪽 위 좌표 (읽는 순서)"""
+    panel_width, panel_height = width // 2, height // 2
+    return [(0, 0), (panel_width, 0), (0, panel_height), (panel_width, panel_height)]
+
+
+def draw_panel_grid(draw: ImageDraw.ImageDraw, width: int = IMAGE_SIZE, height: int = IMAGE_SIZE) -> None:
+    """컷 경계선 그리기"""
+    draw.line([(width // 2, 0), (width // 2, height)], fill='black', width=2)
+    draw.line([(0, height // 2), (width, height // 2)], fill='black', width=2)
+
+
+class ImageProvider(ABC):
+    """프롬프트로 1024x1024 4컷 이미지를 만드는 생성기"""
+
+    # 캐시 키에 들어가는 생성기 이름 (생성기가 다르면 같은 프롬프트라도 다른 이미지)
+    name: str = ""
+
+    @abstractmethod
+    async def generate(self, prompt: str) -> Image.Image:
+        """이미지 생성 (실패 시 예외)"""
+
+
+class DalleImageProvider(ImageProvider):
+    """OpenAI DALL-E 3 이미지 생성"""
+
+    name = "dall-e-3"
+
+    def __init__(self, client: Any, download_timeout: float = 600):
+        self.client = client
+        self.download_timeout = download_timeout
+
+    async def generate(self, prompt: str) -> Image.Image:
+        # 속도 제한(429)은 게이트웨이가 Retry-After만큼 기다렸다가 재시도
+        response = await llm_gateway.run(
+            lambda: self.client.images.generate(
+                model="dall-e-3",
+                prompt=prompt,
+                size=f"{IMAGE_SIZE}x{IMAGE_SIZE}",
+                quality="standard",
+                n=1,
+                response_format="url",
+                style="natural"
+            ),
+            lane=LANE_COMIC
+        )
+
+        if not response.data or len(response.data) == 0:
+            raise RuntimeError("OpenAI API에서 이미지 데이터를 받지 못했습니다.")
+
+        image_url = response.data[0].url
+        print(f"✅ 이미지 URL 생성 성공: {image_url[:50]}...")
+
+        # 이미지 다운로드 (더 긴 타임아웃)
+        async with httpx.AsyncClient(timeout=self.download_timeout) as http_client:
+            response = await http_client.get(image_url)
+            if response.status_code != 200:
+                raise RuntimeError(f"이미지 다운로드 실패: {response.status_code}")
+            image_data = response.content
+
+        print(f"✅ 이미지 다운로드 완료: {len(image_data)} bytes")
+        return Image.open(io.BytesIO(image_data))
+
+
+class LocalImageProvider(ImageProvider):
+    """프롬프트 해시를 시드로 그리는 결정적 4컷 이미지 (네트워크 없이 부하 테스트용)"""
+
+    name = "local-procedural"
+
+    def __init__(self, latency_seconds: float = 0.0, jitter_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds  # DALL-E 응답 시간을 흉내 내는 지연
+        self.jitter_seconds = jitter_seconds  # 지연 시간에 더하는 0~jitter 난수
+
+    async def generate(self, prompt: str) -> Image.Image:
+        delay = self.latency_seconds + random.uniform(0, self.jitter_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await asyncio.to_thread(self.render, prompt)
+
+    def render(self, prompt: str) -> Image.Image:
+        """같은 프롬프트는 항상 같은 이미지"""
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+        img = Image.new('RGB', (IMAGE_SIZE, IMAGE_SIZE), color='white')
+        draw = ImageDraw.Draw(img)
+        half = IMAGE_SIZE // 2
+
+        for x, y in panel_positions():
+            # 파스텔 배경, 바닥, 인물 실루엣, 소품
+            draw.rectangle([x, y, x + half, y + half], fill=tuple(rng.randint(180, 250) for _ in range(3)))
+            floor = y + rng.randint(int(half * 0.6), int(half * 0.75))
+            draw.rectangle([x, floor, x + half, y + half], fill=tuple(rng.randint(120, 200) for _ in range(3)))
+
+            center = x + rng.randint(int(half * 0.3), int(half * 0.7))
+            head = rng.randint(35, 55)
+            body_color = tuple(rng.randint(40, 160) for _ in range(3))
+            draw.rectangle([center - head, floor - head * 3, center + head, floor], fill=body_color)
+            draw.ellipse([center - head, floor - head * 5, center + head, floor - head * 3],
+                         fill=(250, 220, 190), outline='black')
+
+            for _ in range(rng.randint(1, 3)):
+                px = x + rng.randint(10, half - 90)
+                py = y + rng.randint(10, max(10, floor - y - 90))
+                size = rng.randint(30, 80)
+                shape = draw.ellipse if rng.random() < 0.5 else draw.rectangle
+                shape([px, py, px + size, py + size], fill=tuple(rng.randint(60, 240) for _ in range(3)))
+
+        draw_panel_grid(draw)
+        return img
+
+
+def create_image_provider(name: str, client: Any = None, latency_seconds: float = 0.0,
+                          jitter_seconds: float = 0.0) -> ImageProvider:
+    """설정 이름으로 이미지 생성기 생성 (dalle, local)"""
+    if name == "dalle":
+        return DalleImageProvider(client)
+    if name == "local":
+        return LocalImageProvider(latency_seconds, jitter_seconds)
+    raise ValueError(f"알 수 없는 이미지 생성기: {name} (dalle, local)")
@@ -0,0 +1,107 @@
+"""
+벡터화된 일괄 키워드 감정 점수 계산
+
+텍스트마다 키워드를 하나씩 `in`으로 확인하는 대신, N개의 텍스트를 하나의 문자열로 이어 붙이고
+키워드별로 한 번씩만 검색해서 (텍스트 × 키워드) 희소 적중 행렬을 만듭니다.
+감정 점수는 적중 행렬과 (키워드 × 감정) 사전 가중치 행렬의 곱으로 한 번에 계산합니다.
+전체 말뭉치 재채점(백필)에 사용하고, 단건 분석도 같은 경로를 사용합니다.
+"""
+import re
+from typing import Any, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# 텍스트 구분 문자 (키워드에 포함될 수 없음)
+SEPARATOR = "\x00"
+
+
+class KeywordHits(NamedTuple):
+    """희소 적중 행렬 (COO 형식, 텍스트별 키워드의 첫 등장 위치 포함)"""
+    docs: np.ndarray
+    keywords: np.ndarray
+    positions: np.ndarray
+    num_texts: int
+
+
+def find_keyword_hits(texts: Sequence[str], keywords: Sequence[str]) -> KeywordHits:
+    """
+    텍스트 목록에서 각 키워드가 처음 등장하는 위치 검색 (소문자 기준)
+
+    키워드마다 이어 붙인 말뭉치를 한 번 검색하고, 검색 위치를 텍스트 시작 위치와 비교해서
+    어느 텍스트의 적중인지 계산합니다.
+    """
+    lowered = [text.lower().replace(SEPARATOR, " ") for text in texts]
+    corpus = SEPARATOR.join(lowered)
+
+    starts = np.zeros(len(lowered), dtype=np.int64)
+    if len(lowered) > 1:
+        starts[1:] = np.cumsum([len(text) + 1 for text in lowered[:-1]])
+
+    docs, keyword_ids, positions = [], [], []
+    for keyword_id, keyword in enumerate(keywords):
+        found = np.fromiter(
+            (match.start() for match in re.finditer(re.escape(keyword), corpus)),
+            dtype=np.int64
+        )
+        if found.size == 0:
+            continue
+        doc_ids = np.searchsorted(starts, found, side="right") - 1
+        # 텍스트별 첫 등장 위치만 사용 (str.find와 같은 의미)
+        unique_docs, first = np.unique(doc_ids, return_index=True)
+        docs.append(unique_docs)
+        keyword_ids.append(np.full(unique_docs.size, keyword_id, dtype=np.int64))
+        positions.append(found[first] - starts[unique_docs])
+
+    if not docs:
+        empty = np.zeros(0, dtype=np.int64)
+        return KeywordHits(empty, empty, empty, len(texts))
+    return KeywordHits(np.concatenate(docs), np.concatenate(keyword_ids), np.concatenate(positions), len(texts))
+
+
+def sparse_scores(hits: KeywordHits, weights: np.ndarray, values: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    (텍스트 × 키워드) 적중 행렬 × (키워드 × 라벨) 가중치 행렬
+
+    Args:
+        values: 적중 항목별 값 (기본값 1, 강도/부정 보정에 사용)
+    """
+    contributions = weights[hits.keywords]
+    if values is not None:
+        contributions = contributions * values[:, None]
+
+    scores = np.zeros((hits.num_texts, weights.shape[1]))
+    for column in range(weights.shape[1]):
+        scores[:, column] = np.bincount(hits.docs, weights=contributions[:, column], minlength=hits.num_texts)
+    return scores
+
+
+def first_positions(hits: KeywordHits, num_keywords: int) -> np.ndarray:
+    """(텍스트 × 키워드) 첫 등장 위치 행렬 (없으면 -1)"""
+    positions = np.full((hits.num_texts, num_keywords), -1, dtype=np.int64)
+    positions[hits.docs, hits.keywords] = hits.positions
+    return positions
+
+
+class KeywordLexicon:
+    """라벨별 키워드 사전과 (키워드 × 라벨) 가중치 행렬"""
+
+    def __init__(self, lexicon: Mapping[Any, Sequence[str]]):
+        self.labels: List[Any] = list(lexicon)
+        self.keywords: List[str] = list(dict.fromkeys(
+            keyword for keywords in lexicon.values() for keyword in keywords
+        ))
+        index = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+        # 여러 라벨에 속한 키워드는 각 라벨에, 한 라벨에 중복된 키워드는 중복 횟수만큼 반영
+        self.weights = np.zeros((len(self.keywords), len(self.labels)))
+        for column, keywords in enumerate(lexicon.values()):
+            for keyword in keywords:
+                self.weights[index[keyword], column] += 1
+
+    def find_hits(self, texts: Sequence[str]) -> KeywordHits:
+        """텍스트 목록의 키워드 적중 행렬"""
+        return find_keyword_hits(texts, self.keywords)
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """(텍스트 × 라벨) 적중 키워드 수"""
+        return sparse_scores(self.find_hits(texts), self.weights)
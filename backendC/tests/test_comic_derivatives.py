@@ -0,0 +1,82 @@
+"""
+만화 이미지 파생본 생성 테스트 (파일, 크기, AVIF 미지원 환경)
+"""
+import asyncio
+import json
+import os
+
+import pytest
+from PIL import Image, features
+
+from services import comic_derivatives
+from services.comic_derivatives import (
+    DERIVATIVE_SPECS,
+    MANIFEST_FILENAME,
+    DerivativeRenderer,
+    render_derivatives,
+    supported_formats,
+)
+from services.image_providers import IMAGE_SIZE, LocalImageProvider
+
+
+def _source(tmp_path):
+    path = tmp_path / "comic.png"
+    LocalImageProvider().render("derivative test").save(path)
+    return str(path)
+
+
+def test_render_writes_every_variant_with_expected_size(tmp_path):
+    """크기별·컷별 파생본 파일과 매니페스트가 기대한 크기로 만들어지는지 확인"""
+    output_root = str(tmp_path / "derived")
+    manifest = render_derivatives(_source(tmp_path), output_root, "/outputs/derived", ["webp"])
+
+    output_dir = os.path.join(output_root, manifest["hash"])
+    assert set(manifest["variants"]) == set(DERIVATIVE_SPECS)
+    for name, (max_side, panel) in DERIVATIVE_SPECS.items():
+        expected = max_side if panel is None else min(max_side, IMAGE_SIZE // 2)
+        variant = manifest["variants"][name]
+        assert (variant["width"], variant["height"]) == (expected, expected)
+        assert variant["webp"] == f"/outputs/derived/{manifest['hash']}/{name}.webp"
+        with Image.open(os.path.join(output_dir, f"{name}.webp")) as img:
+            assert img.format == "WEBP"
+            assert img.size == (expected, expected)
+
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), encoding="utf-8") as f:
+        assert json.load(f) == manifest
+    assert not [name for name in os.listdir(output_dir) if name.endswith(".tmp")]
+
+
+def test_existing_manifest_is_reused(tmp_path):
+    """같은 원본은 다시 인코딩하지 않고 저장된 매니페스트를 반환하는지 확인"""
+    source = _source(tmp_path)
+    output_root = str(tmp_path / "derived")
+    first = render_derivatives(source, output_root, "/d", ["webp"])
+    thumb = os.path.join(output_root, first["hash"], "thumb.webp")
+    mtime = os.path.getmtime(thumb)
+
+    assert render_derivatives(source, output_root, "/d", ["webp"]) == first
+    assert os.path.getmtime(thumb) == mtime
+
+
+def test_unsupported_avif_is_skipped(tmp_path, monkeypatch):
+    """Pillow가 AVIF를 인코딩할 수 없으면 AVIF는 빼고 WebP만 만드는지 확인"""
+    monkeypatch.setattr(comic_derivatives.features, "check", lambda feature: feature != "avif")
+    assert supported_formats(["webp", "avif", "gif"]) == ["webp"]
+
+    renderer = DerivativeRenderer(str(tmp_path / "derived"), "/d/", ["webp", "avif"], max_workers=0)
+    manifest = asyncio.run(renderer.render(_source(tmp_path)))
+
+    assert renderer.formats == ["webp"]
+    output_dir = tmp_path / "derived" / manifest["hash"]
+    assert not list(output_dir.glob("*.avif"))
+    assert all("avif" not in variant and variant["webp"].startswith("/d/") for variant in manifest["variants"].values())
+
+
+@pytest.mark.skipif(not features.check("avif"), reason="Pillow AVIF 인코더 없음")
+def test_avif_variants_when_supported(tmp_path):
+    """AVIF를 지원하면 파생본마다 AVIF 파일도 만들어지는지 확인"""
+    manifest = render_derivatives(_source(tmp_path), str(tmp_path / "derived"), "/d", ["webp", "avif"])
+
+    with Image.open(tmp_path / "derived" / manifest["hash"] / "thumb.avif") as img:
+        assert img.size == (256, 256)
+    assert all("avif" in variant for variant in manifest["variants"].values())
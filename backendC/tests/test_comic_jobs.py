@@ -0,0 +1,105 @@
+"""
+만화 생성 작업 큐 테스트 (중복 제거, 보관 시간, 실패 상태)
+"""
+import asyncio
+
+from services.comic_jobs import STATUS_DONE, STATUS_FAILED, ComicJobQueue
+
+
+async def _wait_finished(job, timeout=1.0):
+    while not job.finished:
+        await job.wait_changed(job.version, timeout)
+
+
+def test_same_request_reuses_job():
+    """같은 텍스트/성별 요청은 작업을 새로 만들지 않고 러너도 한 번만 실행하는지 확인"""
+    calls = []
+
+    async def runner(text, gender, set_stage):
+        calls.append(text)
+        set_stage("script")
+        return {"text": text}
+
+    async def run():
+        queue = ComicJobQueue(runner, max_workers=1)
+        job, reused = queue.submit("오늘 하루", "female")
+        again, reused_again = queue.submit("  오늘 하루 ", "female")
+        other, _ = queue.submit("오늘 하루", "male")
+        await _wait_finished(job)
+        await _wait_finished(other)
+        done_again, reused_after_done = queue.submit("오늘 하루", "female")
+        return queue, job, reused, again, reused_again, other, done_again, reused_after_done
+
+    queue, job, reused, again, reused_again, other, done_again, reused_after_done = asyncio.run(run())
+
+    assert not reused and reused_again and reused_after_done
+    assert again is job and done_again is job
+    assert other is not job
+    assert job.status == STATUS_DONE and job.result == {"text": "오늘 하루"}
+    assert calls == ["오늘 하루", "오늘 하루"]
+    assert queue.stats()["deduplicated"] == 2
+
+
+def test_failed_job_records_error_and_is_retried():
+    """러너 예외는 실패 상태로 기록되고 같은 요청은 새 작업으로 다시 실행되는지 확인"""
+    attempts = []
+
+    async def runner(text, gender, set_stage):
+        attempts.append(1)
+        set_stage("image")
+        if len(attempts) == 1:
+            raise RuntimeError("이미지 생성 실패")
+        return {"ok": True}
+
+    async def run():
+        queue = ComicJobQueue(runner, max_workers=1)
+        failed, _ = queue.submit("일기", "female")
+        await _wait_finished(failed)
+        retry, reused = queue.submit("일기", "female")
+        await _wait_finished(retry)
+        return queue, failed, retry, reused
+
+    queue, failed, retry, reused = asyncio.run(run())
+
+    assert failed.status == STATUS_FAILED
+    assert failed.error == "이미지 생성 실패"
+    assert failed.finished_at is not None
+    assert "image" in failed.stage_seconds
+    assert not reused and retry is not failed and retry.status == STATUS_DONE
+    assert queue.stats()["failed"] == 1 and queue.stats()["completed"] == 1
+
+
+def test_ttl_counts_from_finish_time():
+    """보관 시간은 생성 시각이 아니라 완료 시각부터 계산하고 실행 중인 작업은 지우지 않는지 확인"""
+    release = None
+
+    async def runner(text, gender, set_stage):
+        if text == "느린 작업":
+            await release.wait()
+        return {"text": text}
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        queue = ComicJobQueue(runner, max_workers=2, job_ttl_seconds=60)
+        slow, _ = queue.submit("느린 작업", "female")
+        fast, _ = queue.submit("빠른 작업", "female")
+        await _wait_finished(fast)
+
+        # 오래 실행 중인 작업이 앞에 있어도 뒤의 만료된 작업을 지움
+        slow.created_at -= 3600
+        fast.finished_at -= 120
+        queue._prune()
+        after_expiry = (queue.get(slow.id), queue.get(fast.id))
+
+        # 오래전에 생성됐어도 방금 끝난 작업은 남김
+        release.set()
+        await _wait_finished(slow)
+        queue._prune()
+        return slow, after_expiry, queue.get(slow.id)
+
+    slow, (slow_kept, fast_kept), slow_after_finish = asyncio.run(run())
+
+    assert slow_kept is slow
+    assert fast_kept is None
+    assert slow_after_finish is slow
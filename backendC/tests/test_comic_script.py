@@ -0,0 +1,69 @@
+"""
+만화 스크립트 구조화 응답 파싱 테스트
+"""
+import json
+
+from services.comic_script import PANEL_COUNT, extract_json_object, parse_comic_script
+
+
+def _panels(count=PANEL_COUNT):
+    return [
+        {"scene": f"Scene {i}", "dialogue": f"Line {i}", "dialogue_ko": f"대사 {i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+def test_complete_response_has_no_missing_fields():
+    """필드가 모두 있으면 그대로 읽고 대체값을 쓰지 않는지 확인"""
+    raw = json.dumps({"diary": "😊 좋은 하루였다.", "panels": _panels()}, ensure_ascii=False)
+    script = parse_comic_script(raw, fallback_diary="원문")
+
+    assert script.diary_text == "😊 좋은 하루였다."
+    assert [scene["dialogue_ko"] for scene in script.scenes] == ["대사 1", "대사 2", "대사 3", "대사 4"]
+    assert script.missing == []
+
+
+def test_code_fence_and_surrounding_prose_are_ignored():
+    """코드 블록이나 앞뒤 설명이 붙어도 첫 JSON 객체를 찾는지 확인"""
+    body = json.dumps({"diary": "일기", "panels": _panels()}, ensure_ascii=False)
+
+    assert extract_json_object(f"```json\n{body}\n```")["diary"] == "일기"
+    assert extract_json_object(f"Here is the script:\n{body}\nHope it helps!")["diary"] == "일기"
+
+
+def test_malformed_json_falls_back_to_raw_diary():
+    """JSON이 깨지면 일기는 원문으로, 장면은 모두 missing으로 표시되는지 확인"""
+    script = parse_comic_script('{"diary": "잘린 응답", "panels": [', fallback_diary="원문")
+
+    assert script.diary_text == "원문"
+    assert "diary" in script.missing
+    assert len(script.scenes) == PANEL_COUNT
+    assert all(scene == {"scene": "", "dialogue": "", "dialogue_ko": ""} for scene in script.scenes)
+    assert "panels[0].scene" in script.missing
+
+
+def test_legacy_panel_text_is_parsed():
+    """JSON이 아니면 기존 "[Panel N]" 텍스트 형식으로 장면을 읽는지 확인 (한국어 대사는 missing)"""
+    raw = "\n".join(f"[Panel {i}]\nScene: Scene {i}\nDialogue: Line {i}" for i in range(1, PANEL_COUNT + 1))
+    script = parse_comic_script(raw, fallback_diary="원문")
+
+    assert [scene["scene"] for scene in script.scenes] == ["Scene 1", "Scene 2", "Scene 3", "Scene 4"]
+    assert script.missing == ["diary"] + [f"panels[{i}].dialogue_ko" for i in range(PANEL_COUNT)]
+
+
+def test_missing_dialogue_is_reported_per_panel():
+    """대사가 빠진 컷과 부족한 컷만 missing에 기록되는지 확인"""
+    panels = _panels(3)
+    panels[1]["dialogue_ko"] = "  "
+    del panels[2]["dialogue"]
+    raw = json.dumps({"diary": "일기", "panels": panels}, ensure_ascii=False)
+    script = parse_comic_script(raw, fallback_diary="원문")
+
+    assert script.missing == [
+        "panels[1].dialogue_ko",
+        "panels[2].dialogue",
+        "panels[3].scene",
+        "panels[3].dialogue",
+        "panels[3].dialogue_ko",
+    ]
+    assert script.scenes[0]["dialogue_ko"] == "대사 1"
@@ -0,0 +1,66 @@
+"""
+만화 기본 이미지 캐시 테스트 (적중, 미스, 크기 한도 퇴출)
+"""
+import os
+
+from PIL import Image
+
+from services.image_cache import ImageCache, prompt_cache_key
+
+
+def _image(color, size=64):
+    return Image.new("RGB", (size, size), color=color)
+
+
+def _file_size(tmp_path, color):
+    path = tmp_path / "probe.png"
+    _image(color).save(path, format="PNG")
+    return os.path.getsize(path)
+
+
+def test_prompt_cache_key_depends_on_generation_options():
+    """모델이나 크기가 다르면 같은 프롬프트라도 다른 키인지 확인"""
+    key = prompt_cache_key("four panel comic")
+
+    assert key == prompt_cache_key("four panel comic")
+    assert key != prompt_cache_key("four panel comic", model="local-procedural")
+    assert key != prompt_cache_key("four panel comic", size="512x512")
+
+
+def test_miss_then_hit_returns_stored_image(tmp_path):
+    """저장 전에는 미스, 저장 후에는 같은 이미지가 적중하는지 확인 (새 인스턴스도 디렉터리에서 읽음)"""
+    cache = ImageCache(str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    key = prompt_cache_key("prompt")
+
+    assert cache.get_sync(key) is None
+    cache.put_sync(key, _image("red"))
+    cached = cache.get_sync(key)
+
+    assert cached.getpixel((0, 0)) == (255, 0, 0)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert ImageCache(str(tmp_path / "cache"), max_bytes=1024 * 1024).get_sync(key) is not None
+
+
+def test_least_recently_used_image_is_evicted(tmp_path):
+    """크기 한도를 넘으면 가장 오래 안 쓴 이미지부터 지우는지 확인"""
+    entry_size = _file_size(tmp_path, "red")
+    cache = ImageCache(str(tmp_path / "cache"), max_bytes=entry_size * 2)
+
+    cache.put_sync("a", _image("red"))
+    cache.put_sync("b", _image("red"))
+    assert cache.get_sync("a") is not None  # a를 최근 사용으로 갱신
+    cache.put_sync("c", _image("red"))
+
+    assert cache.get_sync("b") is None
+    assert cache.get_sync("a") is not None and cache.get_sync("c") is not None
+    assert not os.path.exists(tmp_path / "cache" / "b.png")
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    """크기 한도가 0이면 저장하지 않고 항상 미스인지 확인"""
+    cache = ImageCache(str(tmp_path / "cache"), max_bytes=0)
+    cache.put_sync("a", _image("red"))
+
+    assert cache.get_sync("a") is None
+    assert not os.path.exists(tmp_path / "cache")
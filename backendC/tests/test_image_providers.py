@@ -0,0 +1,52 @@
+"""
+만화 이미지 생성기 테스트 (로컬 렌더러 결정성, 생성기 선택)
+"""
+import asyncio
+
+import pytest
+
+from services.image_providers import (
+    IMAGE_SIZE,
+    DalleImageProvider,
+    LocalImageProvider,
+    create_image_provider,
+)
+
+
+def test_same_prompt_renders_identical_image():
+    """같은 프롬프트는 인스턴스가 달라도 바이트 단위로 같은 이미지인지 확인"""
+    first = LocalImageProvider().render("A rainy walk home")
+    second = LocalImageProvider().render("A rainy walk home")
+
+    assert first.size == (IMAGE_SIZE, IMAGE_SIZE)
+    assert first.tobytes() == second.tobytes()
+
+
+def test_different_prompts_render_different_images():
+    """프롬프트가 다르면 다른 이미지인지 확인"""
+    provider = LocalImageProvider()
+
+    assert provider.render("A rainy walk home").tobytes() != provider.render("A sunny picnic").tobytes()
+
+
+def test_generate_matches_render():
+    """비동기 generate가 render와 같은 결과를 반환하는지 확인"""
+    provider = LocalImageProvider()
+    generated = asyncio.run(provider.generate("Morning coffee"))
+
+    assert generated.tobytes() == provider.render("Morning coffee").tobytes()
+
+
+def test_create_image_provider_by_name():
+    """설정 이름으로 생성기를 만들고 지연 설정이 전달되는지 확인"""
+    local = create_image_provider("local", latency_seconds=1.5, jitter_seconds=0.5)
+
+    assert isinstance(local, LocalImageProvider)
+    assert (local.latency_seconds, local.jitter_seconds) == (1.5, 0.5)
+    assert isinstance(create_image_provider("dalle", client=object()), DalleImageProvider)
+
+
+def test_unknown_provider_name_raises():
+    """알 수 없는 생성기 이름은 선택 가능한 이름과 함께 ValueError인지 확인"""
+    with pytest.raises(ValueError, match="stable-diffusion.*dalle, local"):
+        create_image_provider("stable-diffusion")
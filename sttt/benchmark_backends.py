@@ -0,0 +1,185 @@
+"""
+STT 백엔드 비교 벤치마크 (WER/CER, 실시간 배율)
+
+테스트셋 디렉토리의 manifest.jsonl을 읽어 백엔드 × 모델 크기 조합별로
+단어 오류율(WER), 글자 오류율(CER), 실시간 배율(RTF = 처리 시간 / 오디오 길이)을 비교합니다.
+
+manifest.jsonl 한 줄 형식:
+    {"audio": "sample_001.wav", "text": "오늘은 날씨가 좋아서 산책을 했다"}
+
+테스트셋이 없으면 benchmark_stt.py의 합성 음성 픽스처로 실시간 배율만 비교합니다 (정답이 없어 WER/CER은 생략).
+
+사용법:
+    python benchmark_backends.py --testset testset --backends torch,torch-int8 --models tiny,base
+    python benchmark_backends.py --lengths 5,15,30  # 테스트셋 없이 합성 음성으로 비교
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Sequence
+
+import librosa
+import numpy as np
+
+from benchmark_stt import synthesize_speech_like
+from stt_backends import BACKENDS, create_backend
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# main.py와 같은 인식 옵션 (CPU 기준)
+BENCHMARK_OPTIONS = {
+    "language": "ko",
+    "task": "transcribe",
+    "fp16": False,
+    "no_speech_threshold": 0.6,
+    "logprob_threshold": -1.0,
+    "condition_on_previous_text": False,
+    "initial_prompt": None,
+    "word_timestamps": False
+}
+
+
+def normalize_text(text: str) -> str:
+    """문장 부호 제거, 소문자화, 공백 정리"""
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def edit_distance(reference: Sequence, hypothesis: Sequence) -> int:
+    """레벤슈타인 거리 (삽입/삭제/치환)"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_item in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_item in enumerate(hypothesis, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_item != hyp_item),
+            )
+        previous = current
+    return previous[-1]
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """단어 오류율"""
+    ref_words = normalize_text(reference).split()
+    hyp_words = normalize_text(hypothesis).split()
+    return edit_distance(ref_words, hyp_words) / max(len(ref_words), 1)
+
+
+def char_error_rate(reference: str, hypothesis: str) -> float:
+    """글자 오류율 (띄어쓰기 차이가 큰 한국어에서는 CER이 더 안정적)"""
+    ref_chars = normalize_text(reference).replace(" ", "")
+    hyp_chars = normalize_text(hypothesis).replace(" ", "")
+    return edit_distance(ref_chars, hyp_chars) / max(len(ref_chars), 1)
+
+
+def load_testset(testset_dir: str) -> List[Dict]:
+    """manifest.jsonl을 읽어 (오디오 배열, 정답 텍스트) 목록 생성"""
+    manifest_path = os.path.join(testset_dir, "manifest.jsonl")
+    items = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            audio, _ = librosa.load(os.path.join(testset_dir, entry["audio"]), sr=SAMPLE_RATE)
+            items.append({
+                'name': entry["audio"],
+                'audio': audio.astype(np.float32),
+                'reference': entry.get("text", ""),
+            })
+    return items
+
+
+def synthetic_testset(lengths: Sequence[float]) -> List[Dict]:
+    """정답 없는 합성 음성 테스트셋 (실시간 배율 비교용)"""
+    return [
+        {'name': f"synthetic_{seconds:g}s", 'audio': synthesize_speech_like(seconds, seed=i), 'reference': ""}
+        for i, seconds in enumerate(lengths)
+    ]
+
+
+def benchmark_backend(backend_name: str, model_size: str, items: List[Dict]) -> Dict:
+    """백엔드 하나를 로드하고 테스트셋 전체를 인식"""
+    backend = create_backend(backend_name, model_size, device="cpu")
+
+    start = time.perf_counter()
+    backend.load()
+    load_seconds = time.perf_counter() - start
+
+    total_audio = 0.0
+    total_elapsed = 0.0
+    wers, cers = [], []
+    for item in items:
+        duration = len(item['audio']) / SAMPLE_RATE
+        start = time.perf_counter()
+        result = backend.transcribe(item['audio'], BENCHMARK_OPTIONS)
+        elapsed = time.perf_counter() - start
+
+        total_audio += duration
+        total_elapsed += elapsed
+        if item['reference']:
+            wers.append(word_error_rate(item['reference'], result.get("text", "")))
+            cers.append(char_error_rate(item['reference'], result.get("text", "")))
+
+    return {
+        'backend': backend_name,
+        'model_size': model_size,
+        'load_seconds': round(load_seconds, 3),
+        'audio_seconds': round(total_audio, 3),
+        'elapsed_seconds': round(total_elapsed, 3),
+        'rtf': round(total_elapsed / total_audio, 4) if total_audio else None,
+        'wer': round(float(np.mean(wers)), 4) if wers else None,
+        'cer': round(float(np.mean(cers)), 4) if cers else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="STT 백엔드 WER/RTF 비교 벤치마크")
+    parser.add_argument("--testset", default="testset", help="manifest.jsonl이 있는 테스트셋 디렉토리")
+    parser.add_argument("--lengths", default="5,15,30", help="테스트셋이 없을 때 사용할 합성 음성 길이 (초)")
+    parser.add_argument("--backends", default="torch,torch-int8", help=f"비교할 백엔드 ({', '.join(BACKENDS)})")
+    parser.add_argument("--models", default="tiny,base", help="비교할 모델 크기")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if os.path.exists(os.path.join(args.testset, "manifest.jsonl")):
+        items = load_testset(args.testset)
+        testset_name = args.testset
+    else:
+        logger.warning(f"테스트셋을 찾을 수 없습니다: {args.testset}/manifest.jsonl - 합성 음성으로 실시간 배율만 비교합니다.")
+        items = synthetic_testset([float(x) for x in args.lengths.split(",")])
+        testset_name = "synthetic"
+    logger.info(f"테스트셋 로드 완료: {len(items)}개")
+
+    results = []
+    for backend_name in args.backends.split(","):
+        for model_size in args.models.split(","):
+            try:
+                result = benchmark_backend(backend_name.strip(), model_size.strip(), items)
+            except Exception as e:
+                logger.error(f"벤치마크 실패 ({backend_name}/{model_size}): {e}")
+                result = {'backend': backend_name, 'model_size': model_size, 'error': str(e)}
+            logger.info(json.dumps(result, ensure_ascii=False))
+            results.append(result)
+
+    report = json.dumps({'testset': testset_name, 'items': len(items), 'results': results},
+                        ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+STT 성능 벤치마크 (실시간 배율, 단계별 지연 시간, 최대 메모리, 동시 처리량)
+
+길이가 다른 음성 픽스처로 다음을 측정하고 실행 간 비교(diff)할 수 있는 JSON을 출력합니다.
+- 단계별 지연 시간: preprocess_audio_simple, transcribe_audio, HTTP 엔드포인트 전체
+- 실시간 배율(RTF = 처리 시간 / 오디오 길이)
+- 최대 RSS
+- 동시 요청 수별 처리량 (TestClient)
+
+픽스처는 기본적으로 음절 리듬과 억양을 흉내 낸 합성 음성을 생성하고,
+--fixtures 디렉토리를 주면 그 안의 실제 한국어 녹음(wav/mp3/m4a/webm)도 함께 사용합니다.
+
+사용법:
+    python benchmark_stt.py --lengths 5,15,30 --concurrency 1,2,4 --output bench.json
+    python benchmark_stt.py --baseline bench.json  # 이전 결과와 비교
+"""
+import argparse
+import glob
+import io
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+def synthesize_speech_like(seconds: float, seed: int = 0) -> np.ndarray:
+    """
+    음성과 비슷한 합성 오디오 생성
+
+    초당 약 5음절의 진폭 변조, 100~250Hz 사이에서 움직이는 기본 주파수와 배음,
+    문장 사이의 짧은 휴지를 넣어 VAD와 Whisper가 실제 녹음과 비슷한 경로를 타도록 합니다.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+
+    # 억양: 천천히 움직이는 기본 주파수
+    f0 = 170 + 50 * np.sin(2 * np.pi * 0.3 * t + rng.uniform(0, np.pi))
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+
+    # 음절 리듬 (약 5Hz)
+    syllables = 0.5 * (1 + np.sin(2 * np.pi * 5 * t + rng.uniform(0, np.pi))) ** 2
+
+    # 3~5초마다 0.6초 휴지
+    pauses = np.ones(n)
+    position = rng.uniform(3, 5)
+    while position < seconds:
+        start = int(position * SAMPLE_RATE)
+        pauses[start:start + int(0.6 * SAMPLE_RATE)] = 0
+        position += rng.uniform(3, 5)
+
+    noise = 0.005 * rng.standard_normal(n)
+    audio = 0.3 * voiced / np.max(np.abs(voiced)) * syllables * pauses + noise
+    return audio.astype(np.float32)
+
+
+def to_wav_bytes(audio: np.ndarray) -> bytes:
+    """업로드용 wav 바이트로 인코딩"""
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, SAMPLE_RATE, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def build_fixtures(lengths: List[float], fixtures_dir: Optional[str]) -> List[Dict]:
+    """합성 픽스처 + (선택) 실제 녹음 픽스처 목록"""
+    fixtures = []
+    for i, seconds in enumerate(lengths):
+        audio = synthesize_speech_like(seconds, seed=i)
+        fixtures.append({
+            'name': f"synthetic_{seconds:g}s",
+            'duration': seconds,
+            'data': to_wav_bytes(audio),
+        })
+
+    if fixtures_dir:
+        import librosa
+
+        for path in sorted(glob.glob(os.path.join(fixtures_dir, "*"))):
+            if os.path.splitext(path)[1].lower() not in (".wav", ".mp3", ".m4a", ".webm", ".ogg", ".flac"):
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            duration = librosa.get_duration(path=path)
+            fixtures.append({'name': os.path.basename(path), 'duration': duration, 'data': data})
+    return fixtures
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """지연 시간 요약 통계 (ms)"""
+    array = np.array(values) * 1000
+    return {
+        'mean_ms': round(float(array.mean()), 2),
+        'p50_ms': round(float(np.percentile(array, 50)), 2),
+        'p95_ms': round(float(np.percentile(array, 95)), 2),
+        'max_ms': round(float(array.max()), 2),
+    }
+
+
+def benchmark_stages(stt, fixtures: List[Dict], repeats: int) -> List[Dict]:
+    """전처리와 음성 인식 단계를 함수 단위로 측정"""
+    results = []
+    for fixture in fixtures:
+        preprocess_times, transcribe_times = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            processed_path, speech_map = stt.preprocess_audio_simple(fixture['data'])
+            preprocess_times.append(time.perf_counter() - start)
+            if processed_path is None:
+                raise RuntimeError(f"전처리 실패: {fixture['name']}")
+
+            try:
+                start = time.perf_counter()
+                stt.transcribe_audio(processed_path, speech_map)
+                transcribe_times.append(time.perf_counter() - start)
+            finally:
+                if os.path.exists(processed_path):
+                    os.unlink(processed_path)
+
+        total = np.array(preprocess_times) + np.array(transcribe_times)
+        results.append({
+            'fixture': fixture['name'],
+            'audio_seconds': round(fixture['duration'], 2),
+            'speech_seconds': round(speech_map.speech_duration, 2) if speech_map else None,
+            'preprocess': summarize(preprocess_times),
+            'transcribe': summarize(transcribe_times),
+            'rtf': round(float(total.mean()) / fixture['duration'], 4),
+        })
+        logger.info(f"단계 측정 완료: {fixture['name']} (RTF {results[-1]['rtf']})")
+    return results
+
+
+def benchmark_http(client, fixtures: List[Dict], repeats: int, concurrency_levels: List[int]) -> Dict:
+    """HTTP 엔드포인트 전체 지연 시간과 동시 요청 수별 처리량 측정"""
+
+    def post(fixture: Dict) -> float:
+        start = time.perf_counter()
+        response = client.post(
+            "/api/speech-to-text",
+            files={"audio": (f"{fixture['name']}.wav", fixture['data'], "audio/wav")},
+        )
+        elapsed = time.perf_counter() - start
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+        return elapsed
+
+    latency = []
+    for fixture in fixtures:
+        times = [post(fixture) for _ in range(repeats)]
+        latency.append({
+            'fixture': fixture['name'],
+            'audio_seconds': round(fixture['duration'], 2),
+            'end_to_end': summarize(times),
+            'rtf': round(float(np.mean(times)) / fixture['duration'], 4),
+        })
+
+    throughput = []
+    for level in concurrency_levels:
+        # 모든 픽스처를 요청 수만큼 돌려가며 전송
+        requests = [fixtures[i % len(fixtures)] for i in range(max(level * 2, len(fixtures)))]
+        audio_seconds = sum(fixture['duration'] for fixture in requests)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            times = list(executor.map(post, requests))
+        wall = time.perf_counter() - start
+        throughput.append({
+            'concurrency': level,
+            'requests': len(requests),
+            'wall_seconds': round(wall, 3),
+            'requests_per_second': round(len(requests) / wall, 3),
+            'audio_seconds_per_second': round(audio_seconds / wall, 3),
+            'latency': summarize(times),
+        })
+        logger.info(f"동시 요청 {level}: {throughput[-1]['requests_per_second']} req/s")
+
+    return {'latency': latency, 'throughput': throughput}
+
+
+def compare_reports(baseline: Dict, current: Dict) -> List[str]:
+    """이전 결과 대비 RTF 변화 요약"""
+    lines = []
+    previous = {item['fixture']: item for item in baseline.get('stages', [])}
+    for item in current.get('stages', []):
+        if item['fixture'] not in previous:
+            continue
+        before = previous[item['fixture']]['rtf']
+        after = item['rtf']
+        change = (after - before) / before * 100 if before else 0.0
+        lines.append(f"{item['fixture']}: RTF {before} → {after} ({change:+.1f}%)")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="STT 실시간 배율 벤치마크")
+    parser.add_argument("--lengths", default="5,15,30", help="합성 픽스처 길이 (초)")
+    parser.add_argument("--fixtures", default=None, help="실제 녹음 픽스처 디렉토리")
+    parser.add_argument("--repeats", type=int, default=3, help="픽스처별 반복 횟수")
+    parser.add_argument("--concurrency", default="1,2,4", help="동시 요청 수")
+    parser.add_argument("--skip-http", action="store_true", help="HTTP 엔드포인트 측정 생략")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # 서버 모듈은 무거우므로 인자 확인 후 로드
+    import main as stt
+    from transcription_cache import TranscriptionCache
+
+    # 반복 측정이 캐시에 적중하지 않도록 캐시 비활성화
+    stt.transcription_cache = TranscriptionCache(max_entries=0, disk_dir=None)
+
+    fixtures = build_fixtures([float(x) for x in args.lengths.split(",")], args.fixtures)
+    rss_before = peak_rss_mb()
+
+    start = time.perf_counter()
+    if not stt.load_whisper_model():
+        logger.error("Whisper 모델 로드 실패")
+        return 1
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stt.warmup_whisper_model()
+    warmup_seconds = time.perf_counter() - start
+    stt.model_status.update({
+        'state': 'ready',
+        'load_seconds': round(load_seconds, 3),
+        'warmup_seconds': round(warmup_seconds, 3),
+    })
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec="seconds"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'stt_backend': stt.whisper_model.describe(),
+            'load_seconds': round(load_seconds, 3),
+            'warmup_seconds': round(warmup_seconds, 3),
+            'repeats': args.repeats,
+        },
+        'fixtures': [{'name': f['name'], 'audio_seconds': round(f['duration'], 2)} for f in fixtures],
+        'stages': benchmark_stages(stt, fixtures, args.repeats),
+    }
+
+    if not args.skip_http:
+        from fastapi.testclient import TestClient
+
+        # 모델은 이미 로드했으므로 startup 이벤트 없이 앱만 사용
+        client = TestClient(stt.app)
+        levels = [int(x) for x in args.concurrency.split(",")]
+        report['http'] = benchmark_http(client, fixtures, args.repeats, levels)
+
+    report['memory'] = {
+        'peak_rss_mb_before_model': rss_before,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for line in compare_reports(baseline, report):
+            logger.info(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,12 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
+import json
+import asyncio
+import time
 import tempfile
-import whisper
+import threading
 import librosa
 import soundfile as sf
 import logging
@@ -11,6 +14,12 @@ import uvicorn
 import numpy as np
 import torch
 
+from streaming import StreamingTranscriber
+from vad import SilentAudioError, trim_silence
+from stt_backends import STT_BACKEND, STT_MODEL_SIZE, create_backend
+from transcription_cache import TranscriptionCache
+from upload import UploadRejected, receive_audio_upload
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,21 +35,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Whisper 모델 로드 (전역 변수)
+# 업로드 엔드포인트 API 문서 (스트리밍 수신이라 File 파라미터 대신 직접 명시)
+UPLOAD_OPENAPI_SCHEMA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["audio"],
+                    "properties": {"audio": {"type": "string", "format": "binary"}}
+                }
+            },
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+        }
+    }
+}
+
+# Whisper 추론 백엔드 (전역 변수)
 whisper_model = None
 
-def load_whisper_model():
-    """OpenAI Whisper 모델 로드 (패딩 문제 없음)"""
+# 추론 직렬화 잠금: Whisper는 디코딩마다 모델에 kv-cache 훅을 설치하므로
+# 업로드와 스트리밍 세션이 공유 모델을 동시에 호출하면 서로의 디코딩이 깨짐
+inference_lock = threading.Lock()
+
+# 인식 결과 캐시 (같은 녹음 재업로드 시 재사용)
+transcription_cache = TranscriptionCache()
+
+# 모델 준비 상태 (loading → warming_up → ready / failed)
+model_status = {
+    'state': 'loading',
+    'load_seconds': None,
+    'warmup_seconds': None,
+    'error': None
+}
+
+# 백그라운드 모델 로드 태스크 (가비지 컬렉션 방지용 참조)
+model_loading_task = None
+
+def is_model_ready():
+    """모델 로드와 워밍업이 모두 끝났는지 확인"""
+    return whisper_model is not None and model_status['state'] == 'ready'
+
+def load_whisper_model(backend_name=STT_BACKEND, model_size=STT_MODEL_SIZE):
+    """
+    OpenAI Whisper 모델 로드 (패딩 문제 없음)
+    
+    STT_BACKEND(torch, torch-int8, ctranslate2), STT_MODEL_SIZE(tiny, base, small ...)
+    환경변수로 추론 백엔드와 모델 크기를 선택합니다.
+    """
     global whisper_model
     try:
-        logger.info("OpenAI Whisper 모델을 로드하는 중...")
+        logger.info(f"OpenAI Whisper 모델을 로드하는 중... (백엔드: {backend_name}, 모델: {model_size})")
         
         # GPU 사용 가능 여부 확인
         device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"사용 중인 디바이스: {device}")
         
-        # Whisper 모델 로드 (tiny 모델 - 빠르고 안정적)
-        whisper_model = whisper.load_model("tiny", device=device)
+        # 백엔드 생성 후 모델 로드 (기본값 tiny 모델 - 빠르고 안정적)
+        backend = create_backend(backend_name, model_size, device)
+        backend.load()
+        whisper_model = backend
         
         logger.info("OpenAI Whisper 모델 로드 완료!")
         return True
@@ -48,103 +103,224 @@ def load_whisper_model():
         logger.error(f"Whisper 모델 로드 실패: {e}")
         return False
 
+def run_inference(audio, options):
+    """공유 모델로 음성 인식 (한 번에 하나씩 실행)"""
+    with inference_lock:
+        return whisper_model.transcribe(audio, options)
+
+def warmup_whisper_model():
+    """
+    합성 톤으로 추론을 한 번 실행해서 지연 초기화와 커널 워밍업 비용을 미리 지불
+    
+    캐시를 거치지 않고 백엔드를 직접 호출합니다.
+    """
+    sr = 16000
+    t = np.arange(2 * sr) / sr
+    # 기본음 + 배음으로 음성과 비슷한 스펙트럼을 가진 2초짜리 톤 생성
+    tone = sum(np.sin(2 * np.pi * 220 * k * t) / k for k in range(1, 6))
+    tone = (0.3 * tone / np.max(np.abs(tone))).astype(np.float32)
+    run_inference(tone, build_transcribe_options())
+
 def preprocess_audio_simple(audio_data):
-    """간단한 오디오 전처리"""
+    """
+    간단한 오디오 전처리 (메모리의 오디오 바이트 입력)
+    
+    Returns:
+        (처리된 오디오 경로, 타임스탬프 맵) - 실패 시 (None, None)
+    
+    Raises:
+        SilentAudioError: 음성이 전혀 감지되지 않은 경우
+    """
     try:
         # 임시 파일에 오디오 데이터 저장
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
             temp_file.write(audio_data)
             temp_file_path = temp_file.name
-        
-        try:
-            # 오디오 로드 및 기본 전처리
-            audio, sr = librosa.load(temp_file_path, sr=16000)
-            
-            # 기본 정보 로깅
-            duration = len(audio) / sr
-            logger.info(f"오디오 길이: {duration:.2f}초")
-            
-            # 너무 짧은 오디오 처리
-            if duration < 0.1:
-                logger.warning("오디오가 너무 짧습니다. 0.5초로 패딩합니다.")
-                target_length = int(0.5 * sr)
-                audio = np.pad(audio, (0, max(0, target_length - len(audio))), 'constant')
-            
-            # 너무 긴 오디오 처리 (30초로 제한)
-            if duration > 30:
-                audio = audio[:30*sr]
-                logger.info("오디오를 30초로 자름")
-            
-            # 볼륨 정규화
-            if np.max(np.abs(audio)) > 0:
-                audio = audio / np.max(np.abs(audio)) * 0.95
-            
-            # 처리된 오디오 저장
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as processed_temp:
-                sf.write(processed_temp.name, audio, sr)
-                processed_path = processed_temp.name
-            
-            # 원본 임시 파일 삭제
-            os.unlink(temp_file_path)
-            
-            logger.info(f"오디오 전처리 완료: {len(audio)/sr:.2f}초")
-            return processed_path
-            
-        except Exception as preprocessing_error:
-            logger.error(f"오디오 전처리 실패: {preprocessing_error}")
-            return temp_file_path
-            
     except Exception as e:
         logger.error(f"오디오 전처리 중 오류: {e}")
-        return None
+        return None, None
+    
+    return preprocess_audio_file(temp_file_path)
 
-def transcribe_audio(audio_file_path):
-    """OpenAI Whisper로 음성 인식 (패딩 문제 없음)"""
+def preprocess_audio_file(temp_file_path):
+    """
+    간단한 오디오 전처리 (무음 구간 제거 포함)
+    
+    업로드 중 바로 기록된 임시 파일을 입력으로 받으며, 처리 후 입력 파일은 삭제합니다.
+    
+    Returns:
+        (처리된 오디오 경로, 타임스탬프 맵) - 전처리 실패 시 (원본 경로, None)
+    
+    Raises:
+        SilentAudioError: 음성이 전혀 감지되지 않은 경우
+    """
+    try:
+        # 오디오 로드 및 기본 전처리
+        audio, sr = librosa.load(temp_file_path, sr=16000)
+        
+        # 기본 정보 로깅
+        duration = len(audio) / sr
+        logger.info(f"오디오 길이: {duration:.2f}초")
+        
+        # 무음 구간 제거 (앞뒤 무음, 긴 휴지) - 모든 구간이 무음이면 모델 실행 전에 거부
+        audio, speech_map = trim_silence(audio, sr)
+        duration = len(audio) / sr
+        
+        # 너무 짧은 오디오 처리
+        if duration < 0.1:
+            logger.warning("오디오가 너무 짧습니다. 0.5초로 패딩합니다.")
+            target_length = int(0.5 * sr)
+            audio = np.pad(audio, (0, max(0, target_length - len(audio))), 'constant')
+        
+        # 너무 긴 오디오 처리 (30초로 제한)
+        if duration > 30:
+            audio = audio[:30*sr]
+            logger.info("오디오를 30초로 자름")
+        
+        # 볼륨 정규화
+        if np.max(np.abs(audio)) > 0:
+            audio = audio / np.max(np.abs(audio)) * 0.95
+        
+        # 처리된 오디오 저장
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as processed_temp:
+            sf.write(processed_temp.name, audio, sr)
+            processed_path = processed_temp.name
+        
+        # 원본 임시 파일 삭제
+        os.unlink(temp_file_path)
+        
+        logger.info(f"오디오 전처리 완료: {len(audio)/sr:.2f}초")
+        return processed_path, speech_map
+        
+    except SilentAudioError:
+        os.unlink(temp_file_path)
+        raise
+    except Exception as preprocessing_error:
+        logger.error(f"오디오 전처리 실패: {preprocessing_error}")
+        return temp_file_path, None
+
+def build_transcribe_options():
+    """Whisper 음성 인식 옵션"""
+    return {
+        "language": "ko",  # 한국어 설정
+        "task": "transcribe",
+        "fp16": torch.cuda.is_available(),  # GPU 사용 시 fp16 활성화
+        "no_speech_threshold": 0.6,
+        "logprob_threshold": -1.0,
+        "condition_on_previous_text": False,  # 이전 텍스트 조건 비활성화
+        "initial_prompt": None,
+        "word_timestamps": False
+    }
+
+def transcribe_array(audio):
+    """16kHz float32 오디오 배열을 바로 음성 인식 (스트리밍용)"""
+    if whisper_model is None:
+        return ""
+    try:
+        result = run_inference(audio.astype(np.float32), build_transcribe_options())
+        return result.get("text", "").strip()
+    except Exception as e:
+        logger.error(f"스트리밍 음성 인식 실패: {e}")
+        return ""
+
+def _realign_segments(result, speech_map):
+    """Whisper 구간 타임스탬프를 무음 제거 전 원본 시간으로 변환"""
+    segments = []
+    for segment in result.get("segments", []):
+        start = segment.get("start", 0.0)
+        end = segment.get("end", 0.0)
+        if speech_map is not None:
+            start = speech_map.to_original(start)
+            end = speech_map.to_original(end)
+        segments.append({
+            'start': round(start, 2),
+            'end': round(end, 2),
+            'text': segment.get("text", "").strip()
+        })
+    return segments
+
+def transcribe_audio(audio_file_path, speech_map=None, with_segments=False):
+    """
+    OpenAI Whisper로 음성 인식 (패딩 문제 없음)
+    
+    with_segments=True이면 (텍스트, 원본 시간 기준 구간 목록)을 반환합니다.
+    """
+    text, segments = _transcribe_with_segments(audio_file_path, speech_map)
+    if with_segments:
+        return text, segments
+    return text
+
+def _load_pcm(audio_file_path):
+    """음성 인식용 16kHz mono float32 PCM 로드"""
+    try:
+        audio, sr = sf.read(audio_file_path, dtype="float32")
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        if sr == 16000:
+            return audio
+    except Exception:
+        pass
+    # 전처리 실패로 원본 파일이 넘어온 경우 등은 librosa로 디코딩
+    audio, _ = librosa.load(audio_file_path, sr=16000)
+    return audio.astype(np.float32)
+
+def _transcribe_with_segments(audio_file_path, speech_map=None):
+    """음성 인식 실행 후 (텍스트, 구간 목록) 반환"""
     try:
         if whisper_model is None:
-            return "Whisper 모델이 로드되지 않았습니다."
+            return "Whisper 모델이 로드되지 않았습니다.", []
         
         # 파일 크기 확인
         file_size = os.path.getsize(audio_file_path)
         logger.info(f"음성 인식할 파일 크기: {file_size} bytes")
         
         if file_size < 1000:
-            return "오디오 파일이 너무 작습니다. 더 길게 녹음해주세요."
+            return "오디오 파일이 너무 작습니다. 더 길게 녹음해주세요.", []
         
         if file_size > 25 * 1024 * 1024:  # 25MB 제한
-            return "오디오 파일이 너무 큽니다. 더 짧게 녹음해주세요."
-        
-        # OpenAI Whisper로 음성 인식
-        logger.info("OpenAI Whisper로 음성 인식 시작...")
-        
-        # 옵션 설정
-        options = {
-            "language": "ko",  # 한국어 설정
-            "task": "transcribe",
-            "fp16": torch.cuda.is_available(),  # GPU 사용 시 fp16 활성화
-            "no_speech_threshold": 0.6,
-            "logprob_threshold": -1.0,
-            "condition_on_previous_text": False,  # 이전 텍스트 조건 비활성화
-            "initial_prompt": None,
-            "word_timestamps": False
-        }
+            return "오디오 파일이 너무 큽니다. 더 짧게 녹음해주세요.", []
         
-        # 음성 인식 실행
-        result = whisper_model.transcribe(audio_file_path, **options)
+        # 디코딩된 PCM 기준으로 캐시 조회 (재업로드된 같은 녹음은 바로 반환)
+        audio = _load_pcm(audio_file_path)
+        options = build_transcribe_options()
+        backend_info = whisper_model.describe()
+        cache_key = TranscriptionCache.make_key(
+            audio, f"{backend_info['backend']}:{backend_info['model_size']}", options
+        )
+        result = transcription_cache.get(cache_key)
+        cache_hit = result is not None
+        
+        if cache_hit:
+            logger.info("음성 인식 캐시 적중")
+        else:
+            # OpenAI Whisper로 음성 인식
+            logger.info("OpenAI Whisper로 음성 인식 시작...")
+            
+            # 음성 인식 실행
+            result = run_inference(audio, options)
         
         # 결과 텍스트 추출
         text = result.get("text", "").strip()
         
         if text:
             logger.info(f"음성 인식 성공: {text}")
-            return text
+            # 새로 인식한 결과만 저장 (적중 시 디스크 파일을 다시 쓰지 않도록)
+            if not cache_hit:
+                transcription_cache.put(cache_key, {
+                    'text': result.get("text", ""),
+                    'segments': [
+                        {'start': seg.get("start", 0.0), 'end': seg.get("end", 0.0), 'text': seg.get("text", "")}
+                        for seg in result.get("segments", [])
+                    ]
+                })
+            return text, _realign_segments(result, speech_map)
         else:
             logger.warning("음성 인식 결과가 비어있습니다.")
-            return "음성을 인식할 수 없습니다. 더 명확하게 말씀해주세요."
+            return "음성을 인식할 수 없습니다. 더 명확하게 말씀해주세요.", []
             
     except Exception as e:
         logger.error(f"음성 인식 실패: {e}")
-        return "음성 인식 중 오류가 발생했습니다. 다시 시도해주세요."
+        return "음성 인식 중 오류가 발생했습니다. 다시 시도해주세요.", []
 
 @app.get("/")
 async def root():
@@ -153,51 +329,73 @@ async def root():
         'message': 'STT 서버가 실행 중입니다!',
         'model': 'OpenAI Whisper (패딩 문제 완전 해결)',
         'version': '2.0.0',
-        'status': 'ready' if whisper_model else 'loading',
+        'status': model_status['state'],
         'docs': '/docs'
     }
 
 @app.get("/health")
 async def health_check():
-    """서버 상태 확인"""
+    """서버 상태 확인 (liveness - 모델 로드 중에도 프로세스가 살아있으면 정상)"""
     return {
         'status': 'healthy',
         'model_loaded': whisper_model is not None,
+        'model_status': model_status,
+        'stt_backend': whisper_model.describe() if whisper_model else None,
+        'transcription_cache': transcription_cache.stats(),
         'device': 'cuda' if torch.cuda.is_available() else 'cpu'
     }
 
-@app.post("/api/speech-to-text")
-async def convert_speech(audio: UploadFile = File(...)):
-    """음성을 텍스트로 변환하는 API (OpenAI Whisper 사용)"""
+@app.get("/ready")
+async def readiness_check():
+    """트래픽 수신 가능 여부 (readiness - 모델 로드와 워밍업이 끝나야 200)"""
+    if not is_model_ready():
+        return JSONResponse(status_code=503, content={'status': model_status['state'], **model_status})
+    return {'status': 'ready', **model_status}
+
+@app.post("/api/speech-to-text", openapi_extra=UPLOAD_OPENAPI_SCHEMA)
+async def convert_speech(request: Request):
+    """
+    음성을 텍스트로 변환하는 API (OpenAI Whisper 사용)
+    
+    업로드를 스트리밍으로 받으면서 용량과 파일 형식을 검사하므로,
+    너무 크거나 오디오가 아닌 파일은 본문 전체를 받기 전에 거부됩니다.
+    """
     try:
-        # 모델 로드 확인
-        if whisper_model is None:
+        # 모델 로드 확인 (본문을 받기 전에 확인)
+        if not is_model_ready():
             raise HTTPException(
                 status_code=503, 
                 detail="Whisper 모델이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요."
             )
         
-        # 파일 검증
-        if not audio.filename:
-            raise HTTPException(status_code=400, detail="파일이 선택되지 않았습니다.")
-        
-        logger.info(f"음성 파일 수신: {audio.filename}")
+        # 오디오 업로드 수신 (임시 파일로 바로 기록)
+        try:
+            upload = await receive_audio_upload(request)
+        except UploadRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
         
-        # 오디오 데이터 읽기
-        audio_data = await audio.read()
+        logger.info(f"음성 파일 수신: {upload.filename} ({upload.size} bytes, {upload.format})")
         
-        # 오디오 전처리
-        processed_audio_path = preprocess_audio_simple(audio_data)
+        # 오디오 전처리 (무음 구간 제거)
+        # 디코딩/VAD와 추론은 스레드에서 실행 (추론 잠금을 기다리는 동안 이벤트 루프가 멈추지 않도록)
+        try:
+            processed_audio_path, speech_map = await asyncio.to_thread(preprocess_audio_file, upload.path)
+        except SilentAudioError:
+            raise HTTPException(status_code=400, detail="음성이 감지되지 않았습니다. 다시 녹음해주세요.")
         if processed_audio_path is None:
             raise HTTPException(status_code=400, detail="오디오 전처리 실패")
         
         try:
             # 음성 인식 실행
-            text = transcribe_audio(processed_audio_path)
+            text, segments = await asyncio.to_thread(
+                transcribe_audio, processed_audio_path, speech_map, with_segments=True
+            )
             
             return {
                 'success': True,
                 'text': text,
+                'segments': segments,
+                'speech_segments': speech_map.to_list() if speech_map else [],
                 'message': '음성 변환이 완료되었습니다.'
             }
             
@@ -219,27 +417,130 @@ async def convert_speech(audio: UploadFile = File(...)):
             }
         )
 
+def _parse_control_message(text):
+    """WebSocket 텍스트 프레임에서 제어 메시지 종류 추출"""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text.strip()
+    if isinstance(data, dict):
+        return data.get("type", "")
+    return ""
+
+@app.websocket("/ws/speech-to-text")
+async def stream_speech(websocket: WebSocket, encoding: str = "pcm16"):
+    """
+    스트리밍 음성 인식 WebSocket
+    
+    - 바이너리 프레임: 16kHz mono 오디오 (encoding=pcm16: int16 little-endian, encoding=opus: Opus 프레임)
+    - 텍스트 프레임 {"type": "end"}: 녹음 종료, 남은 구간을 확정하고 전체 텍스트 반환
+    - 서버 메시지: partial(중간 결과), final(확정 구간), done(전체 텍스트), error
+    """
+    await websocket.accept()
+    
+    if not is_model_ready():
+        await websocket.send_json({
+            'type': 'error',
+            'message': 'Whisper 모델이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요.'
+        })
+        await websocket.close(code=1013)
+        return
+    
+    try:
+        session = StreamingTranscriber(transcribe_array, encoding=encoding)
+    except ValueError as e:
+        await websocket.send_json({'type': 'error', 'message': str(e)})
+        await websocket.close(code=1003)
+        return
+    
+    logger.info(f"스트리밍 음성 인식 연결: encoding={encoding}")
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            
+            if message.get("bytes") is not None:
+                action = session.push(message["bytes"])
+                if action == "final":
+                    # 모델 추론은 이벤트 루프를 막지 않도록 스레드에서 실행
+                    segment = await asyncio.to_thread(session.finalize_segment)
+                    if segment:
+                        await websocket.send_json({'type': 'final', **segment})
+                elif action == "partial":
+                    text = await asyncio.to_thread(session.transcribe_partial)
+                    if text:
+                        await websocket.send_json({'type': 'partial', 'text': text})
+            
+            elif message.get("text") is not None:
+                if _parse_control_message(message["text"]) == "end":
+                    segment = await asyncio.to_thread(session.finalize_segment)
+                    if segment:
+                        await websocket.send_json({'type': 'final', **segment})
+                    await websocket.send_json({
+                        'type': 'done',
+                        'text': session.full_text,
+                        'segments': session.segments
+                    })
+                    await websocket.close()
+                    break
+                
+    except WebSocketDisconnect:
+        logger.info("스트리밍 음성 인식 연결 종료 (클라이언트)")
+    except Exception as e:
+        logger.error(f"스트리밍 음성 인식 오류: {e}")
+        try:
+            await websocket.send_json({'type': 'error', 'message': f'서버 오류가 발생했습니다: {str(e)}'})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+async def load_and_warmup_model():
+    """백그라운드에서 모델 로드 후 워밍업 (서버는 먼저 요청을 받기 시작)"""
+    start = time.perf_counter()
+    success = await asyncio.to_thread(load_whisper_model)
+    model_status['load_seconds'] = round(time.perf_counter() - start, 3)
+    
+    if not success:
+        model_status['state'] = 'failed'
+        model_status['error'] = 'Whisper 모델 로드 실패'
+        logger.error("❌ Whisper 모델 로드 실패!")
+        logger.error("서버는 시작되지만 STT 기능을 사용할 수 없습니다.")
+        return
+    logger.info(f"✅ Whisper 모델 로드 완료! ({model_status['load_seconds']}초)")
+    
+    model_status['state'] = 'warming_up'
+    start = time.perf_counter()
+    try:
+        await asyncio.to_thread(warmup_whisper_model)
+    except Exception as e:
+        # 워밍업 실패는 첫 요청이 느려질 뿐이므로 서비스는 계속 진행
+        logger.warning(f"Whisper 워밍업 실패: {e}")
+    model_status['warmup_seconds'] = round(time.perf_counter() - start, 3)
+    model_status['state'] = 'ready'
+    logger.info(f"✅ Whisper 워밍업 완료! ({model_status['warmup_seconds']}초)")
+    logger.info("서버 준비 완료!")
+
 # 서버 시작 시 모델 로드
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 실행"""
+    global model_loading_task
     logger.info("=" * 50)
     logger.info("STT 서버 시작 중...")
     logger.info("OpenAI Whisper 사용 (패딩 문제 해결)")
     logger.info("=" * 50)
     
-    success = load_whisper_model()
-    if not success:
-        logger.error("❌ Whisper 모델 로드 실패!")
-        logger.error("서버는 시작되지만 STT 기능을 사용할 수 없습니다.")
-    else:
-        logger.info("✅ Whisper 모델 로드 완료!")
-        logger.info("서버 준비 완료!")
+    # 모델 로드는 백그라운드에서 진행 - 준비 여부는 /ready로 확인
+    model_loading_task = asyncio.create_task(load_and_warmup_model())
     
     logger.info("=" * 50)
     logger.info("서버 주소: http://localhost:8000")
     logger.info("API 엔드포인트: /api/speech-to-text")
+    logger.info("스트리밍 엔드포인트: ws://localhost:8000/ws/speech-to-text")
     logger.info("API 문서: http://localhost:8000/docs")
+    logger.info("준비 상태 확인: http://localhost:8000/ready")
     logger.info("=" * 50)
 
 if __name__ == "__main__":
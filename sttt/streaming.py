@@ -0,0 +1,165 @@
+"""
+WebSocket 스트리밍 음성 인식 세션
+
+클라이언트가 말하는 동안 PCM(16kHz, mono, int16) 또는 Opus 프레임을 받아
+현재 구간을 롤링 버퍼에 쌓고, 몇 초마다 중간 결과(partial)를 만들며
+무음이 이어지면 구간을 확정(final)합니다.
+"""
+import logging
+from typing import Callable, List, Optional
+
+import numpy as np
+
+# Opus 디코더 선택적 import (없으면 PCM만 지원)
+try:
+    import opuslib
+    OPUS_AVAILABLE = True
+except ImportError:
+    opuslib = None
+    OPUS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# 중간 결과를 내보내는 주기 (초)
+PARTIAL_INTERVAL_SECONDS = 2.0
+
+# 이 시간 이상 무음이 이어지면 구간을 확정 (초)
+SILENCE_TO_FINALIZE_SECONDS = 0.8
+
+# 음성/무음 판단 기준 RMS
+SILENCE_RMS_THRESHOLD = 0.01
+
+# 음성 시작 전에 남겨둘 여유 구간 (초)
+PRE_ROLL_SECONDS = 0.3
+
+# Whisper 입력 창(30초)을 넘기 전에 강제로 구간 확정
+MAX_SEGMENT_SECONDS = 28.0
+
+# Opus 프레임 디코딩 시 최대 프레임 길이 (120ms)
+OPUS_MAX_FRAME_SAMPLES = int(SAMPLE_RATE * 0.12)
+
+SUPPORTED_ENCODINGS = ("pcm16", "opus")
+
+
+class StreamingTranscriber:
+    """스트리밍 음성 인식 세션 (연결 1개당 1개)"""
+
+    def __init__(
+        self,
+        transcribe_fn: Callable[[np.ndarray], str],
+        encoding: str = "pcm16",
+        sample_rate: int = SAMPLE_RATE,
+    ):
+        if encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(f"지원하지 않는 인코딩입니다: {encoding}")
+        if encoding == "opus" and not OPUS_AVAILABLE:
+            raise ValueError("Opus 디코더(opuslib)가 설치되지 않았습니다.")
+
+        self.transcribe_fn = transcribe_fn
+        self.encoding = encoding
+        self.sample_rate = sample_rate
+        self.decoder = opuslib.Decoder(sample_rate, 1) if encoding == "opus" else None
+
+        # 현재 구간의 롤링 버퍼
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.has_speech = False
+        self.trailing_silence_samples = 0
+        self.samples_since_partial = 0
+
+        # 스트림 시작 기준 현재 구간의 시작 위치 (샘플)
+        self.segment_start_sample = 0
+        self.total_samples = 0
+
+        self.segments: List[dict] = []
+        self.last_partial_text = ""
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """수신한 프레임을 float32 샘플로 변환"""
+        if self.decoder is not None:
+            data = self.decoder.decode(data, OPUS_MAX_FRAME_SAMPLES)
+        # 홀수 바이트는 int16으로 해석할 수 없으므로 버림
+        usable = len(data) - (len(data) % 2)
+        pcm = np.frombuffer(data[:usable], dtype="<i2")
+        return pcm.astype(np.float32) / 32768.0
+
+    def push(self, data: bytes) -> Optional[str]:
+        """
+        오디오 프레임을 버퍼에 추가합니다.
+
+        Returns:
+            "final": 구간을 확정해야 함, "partial": 중간 결과를 만들어야 함, None: 할 일 없음
+        """
+        samples = self.decode(data)
+        if len(samples) == 0:
+            return None
+
+        self.total_samples += len(samples)
+        rms = float(np.sqrt(np.mean(samples ** 2)))
+        is_silence = rms < SILENCE_RMS_THRESHOLD
+
+        if not self.has_speech:
+            if is_silence:
+                # 음성 시작 전 무음은 여유 구간만 남기고 버림
+                self.buffer = np.concatenate([self.buffer, samples])
+                pre_roll = int(PRE_ROLL_SECONDS * self.sample_rate)
+                if len(self.buffer) > pre_roll:
+                    self.buffer = self.buffer[-pre_roll:]
+                self.segment_start_sample = self.total_samples - len(self.buffer)
+                return None
+            self.has_speech = True
+
+        self.buffer = np.concatenate([self.buffer, samples])
+        self.samples_since_partial += len(samples)
+
+        if is_silence:
+            self.trailing_silence_samples += len(samples)
+        else:
+            self.trailing_silence_samples = 0
+
+        if self.trailing_silence_samples >= SILENCE_TO_FINALIZE_SECONDS * self.sample_rate:
+            return "final"
+        if len(self.buffer) >= MAX_SEGMENT_SECONDS * self.sample_rate:
+            return "final"
+        if self.samples_since_partial >= PARTIAL_INTERVAL_SECONDS * self.sample_rate:
+            return "partial"
+        return None
+
+    def transcribe_partial(self) -> str:
+        """현재 구간의 중간 결과 생성"""
+        self.samples_since_partial = 0
+        if not self.has_speech:
+            return ""
+        self.last_partial_text = self.transcribe_fn(self.buffer)
+        return self.last_partial_text
+
+    def finalize_segment(self) -> Optional[dict]:
+        """현재 구간을 확정하고 버퍼를 비움"""
+        segment = None
+        if self.has_speech:
+            # 구간 끝의 무음은 인식에 필요 없으므로 제외
+            speech_end = len(self.buffer) - self.trailing_silence_samples
+            audio = self.buffer[:max(speech_end, 0)]
+            text = self.transcribe_fn(audio) if len(audio) > 0 else ""
+            if text:
+                segment = {
+                    "text": text,
+                    "start": round(self.segment_start_sample / self.sample_rate, 2),
+                    "end": round((self.segment_start_sample + len(audio)) / self.sample_rate, 2),
+                }
+                self.segments.append(segment)
+                logger.info(f"스트리밍 구간 확정: {text}")
+
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.has_speech = False
+        self.trailing_silence_samples = 0
+        self.samples_since_partial = 0
+        self.segment_start_sample = self.total_samples
+        self.last_partial_text = ""
+        return segment
+
+    @property
+    def full_text(self) -> str:
+        """확정된 모든 구간의 텍스트"""
+        return " ".join(segment["text"] for segment in self.segments)
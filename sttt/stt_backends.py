@@ -0,0 +1,161 @@
+"""
+STT 추론 백엔드
+
+설정(환경변수)으로 추론 백엔드와 모델 크기를 선택합니다.
+- torch: 기본 PyTorch Whisper (CPU에서는 fp32)
+- torch-int8: PyTorch Whisper + Linear 레이어 int8 동적 양자화 (CPU 전용)
+- ctranslate2: faster-whisper(CTranslate2) 백엔드, CPU에서는 int8 연산 (선택 설치)
+
+양자화 백엔드는 같은 지연 시간 안에서 base/small 모델을 쓸 수 있게 해줍니다.
+"""
+import logging
+import os
+from typing import Any, Dict
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+# 백엔드 설정
+STT_BACKEND = os.getenv("STT_BACKEND", "torch")
+STT_MODEL_SIZE = os.getenv("STT_MODEL_SIZE", "tiny")
+STT_CPU_THREADS = int(os.getenv("STT_CPU_THREADS", "0"))  # 0이면 라이브러리 기본값
+
+
+class STTBackend:
+    """STT 추론 백엔드 베이스 클래스"""
+
+    name = "base"
+
+    def __init__(self, model_size: str = STT_MODEL_SIZE, device: str = "cpu"):
+        self.model_size = model_size
+        self.device = device
+        self.model = None
+
+    def load(self) -> None:
+        """모델 로드"""
+        raise NotImplementedError
+
+    def transcribe(self, audio, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        음성 인식
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz float32 배열
+            options: Whisper 형식의 인식 옵션
+
+        Returns:
+            Whisper 형식 결과 ({"text": ..., "segments": [{"start", "end", "text"}, ...]})
+        """
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """상태 확인용 백엔드 정보"""
+        return {'backend': self.name, 'model_size': self.model_size, 'device': self.device}
+
+
+class TorchWhisperBackend(STTBackend):
+    """기본 PyTorch Whisper 백엔드"""
+
+    name = "torch"
+
+    def load(self) -> None:
+        import whisper
+
+        if STT_CPU_THREADS > 0:
+            torch.set_num_threads(STT_CPU_THREADS)
+        self.model = whisper.load_model(self.model_size, device=self.device)
+
+    def transcribe(self, audio, options: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32)
+        return self.model.transcribe(audio, **options)
+
+
+class QuantizedTorchWhisperBackend(TorchWhisperBackend):
+    """Linear 레이어를 int8로 동적 양자화한 PyTorch Whisper 백엔드 (CPU 전용)"""
+
+    name = "torch-int8"
+
+    def __init__(self, model_size: str = STT_MODEL_SIZE, device: str = "cpu"):
+        # 동적 양자화 커널은 CPU에서만 동작
+        super().__init__(model_size, device="cpu")
+
+    def load(self) -> None:
+        import whisper
+
+        super().load()
+
+        # Whisper의 Linear는 입력 dtype에 맞춰 가중치를 캐스팅하는 하위 클래스라서
+        # quantize_dynamic이 인식하지 못함 → CPU fp32에서는 동작이 같은 nn.Linear로 바꿔서 양자화
+        for module in self.model.modules():
+            if isinstance(module, whisper.model.Linear):
+                module.__class__ = torch.nn.Linear
+
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info("Whisper Linear 레이어 int8 동적 양자화 완료")
+
+    def transcribe(self, audio, options: Dict[str, Any]) -> Dict[str, Any]:
+        return super().transcribe(audio, {**options, "fp16": False})
+
+
+class CTranslate2WhisperBackend(STTBackend):
+    """faster-whisper(CTranslate2) 백엔드 (pip install faster-whisper)"""
+
+    name = "ctranslate2"
+
+    def load(self) -> None:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("faster-whisper가 설치되지 않았습니다. pip install faster-whisper")
+
+        compute_type = "float16" if self.device == "cuda" else "int8"
+        self.model = WhisperModel(
+            self.model_size,
+            device=self.device,
+            compute_type=compute_type,
+            cpu_threads=STT_CPU_THREADS,
+        )
+
+    def transcribe(self, audio, options: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32)
+
+        segments, _info = self.model.transcribe(
+            audio,
+            language=options.get("language"),
+            task=options.get("task", "transcribe"),
+            no_speech_threshold=options.get("no_speech_threshold"),
+            log_prob_threshold=options.get("logprob_threshold"),
+            condition_on_previous_text=options.get("condition_on_previous_text", False),
+            initial_prompt=options.get("initial_prompt"),
+            word_timestamps=options.get("word_timestamps", False),
+        )
+
+        # faster-whisper는 제너레이터를 반환하므로 여기서 디코딩이 실제로 실행됨
+        result_segments = [
+            {'start': segment.start, 'end': segment.end, 'text': segment.text}
+            for segment in segments
+        ]
+        return {
+            'text': "".join(segment['text'] for segment in result_segments),
+            'segments': result_segments
+        }
+
+
+BACKENDS = {
+    TorchWhisperBackend.name: TorchWhisperBackend,
+    QuantizedTorchWhisperBackend.name: QuantizedTorchWhisperBackend,
+    CTranslate2WhisperBackend.name: CTranslate2WhisperBackend,
+}
+
+
+def create_backend(name: str = STT_BACKEND, model_size: str = STT_MODEL_SIZE, device: str = "cpu") -> STTBackend:
+    """설정된 이름으로 STT 백엔드 생성"""
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 STT 백엔드입니다: {name} (지원: {', '.join(BACKENDS)})")
+    return BACKENDS[name](model_size=model_size, device=device)
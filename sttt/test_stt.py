@@ -1 +1,376 @@
 # 내 첫 프로젝트
+"""
+STT 서버 테스트 (모델 없이 실행 가능한 단위 테스트)
+"""
+import os
+
+import numpy as np
+import pytest
+
+from streaming import SAMPLE_RATE, StreamingTranscriber
+from vad import SilentAudioError, trim_silence
+
+
+def _pcm16(seconds, amplitude):
+    """주어진 길이의 440Hz 톤을 int16 PCM 바이트로 생성"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    tone = amplitude * np.sin(2 * np.pi * 440 * t)
+    return (tone * 32767).astype("<i2").tobytes()
+
+
+def test_streaming_finalizes_segment_on_silence():
+    """음성 뒤에 무음이 이어지면 구간이 확정되는지 확인"""
+    calls = []
+
+    def fake_transcribe(audio):
+        calls.append(len(audio))
+        return "안녕하세요"
+
+    session = StreamingTranscriber(fake_transcribe)
+    assert session.push(_pcm16(0.5, 0.0)) is None  # 음성 시작 전 무음
+    assert session.push(_pcm16(1.0, 0.5)) is None
+
+    action = None
+    for _ in range(10):
+        action = session.push(_pcm16(0.1, 0.0))
+        if action:
+            break
+    assert action == "final"
+
+    segment = session.finalize_segment()
+    assert segment["text"] == "안녕하세요"
+    # 앞쪽 여유 구간(0.3초) + 음성(1초)만 인식에 사용
+    assert calls[-1] <= int(1.4 * SAMPLE_RATE)
+    assert session.full_text == "안녕하세요"
+
+
+def test_streaming_emits_partial_while_speaking():
+    """말하는 동안 주기적으로 중간 결과 요청이 나오는지 확인"""
+    session = StreamingTranscriber(lambda audio: "중간")
+    actions = [session.push(_pcm16(0.5, 0.5)) for _ in range(5)]
+    assert "partial" in actions
+    assert session.transcribe_partial() == "중간"
+
+
+def _tone(seconds, amplitude):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def test_vad_trims_silence_and_keeps_timestamp_map():
+    """앞뒤 무음과 긴 휴지를 잘라내고 원본 시간으로 되돌릴 수 있는지 확인"""
+    silence = np.zeros(2 * SAMPLE_RATE, dtype=np.float32)
+    audio = np.concatenate([silence, _tone(1.0, 0.5), silence, _tone(1.0, 0.5), silence])
+
+    trimmed, speech_map = trim_silence(audio, SAMPLE_RATE)
+
+    assert len(speech_map.segments) == 2
+    assert len(trimmed) < len(audio) / 2
+    # 잘라낸 오디오의 시작은 원본의 약 2초 지점 (여유 구간 0.15초 제외)
+    assert abs(speech_map.to_original(0.0) - 1.85) < 0.05
+    assert speech_map.speech_duration == pytest.approx(len(trimmed) / SAMPLE_RATE)
+
+
+def test_vad_rejects_all_silence():
+    """무음만 있는 업로드는 모델 실행 전에 거부"""
+    with pytest.raises(SilentAudioError):
+        trim_silence(np.zeros(3 * SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE)
+
+
+def test_vad_keeps_continuous_speech_without_pauses():
+    """휴지 없이 계속 말한 녹음은 잡음 바닥이 높게 잡혀도 음성으로 유지"""
+    t = np.arange(5 * SAMPLE_RATE) / SAMPLE_RATE
+    envelope = 0.8 + 0.2 * np.sin(2 * np.pi * 4 * t)
+    audio = (0.3 * envelope * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+    trimmed, speech_map = trim_silence(audio, SAMPLE_RATE)
+
+    assert speech_map.segments == [(0, len(audio))]
+    assert len(trimmed) == len(audio)
+
+
+def test_vad_passes_sub_frame_audio_through():
+    """프레임 하나보다 짧은 오디오는 거부하지 않고 그대로 반환 (전처리에서 패딩)"""
+    audio = _tone(0.01, 0.5)
+    trimmed, speech_map = trim_silence(audio, SAMPLE_RATE)
+
+    assert np.array_equal(trimmed, audio)
+    assert speech_map.to_original(0.005) == pytest.approx(0.005)
+
+
+def test_preprocess_pads_sub_frame_audio(tmp_path):
+    """아주 짧은 업로드는 기존처럼 0.5초로 패딩되어 인식 단계로 넘어감"""
+    pytest.importorskip("torch")
+    import soundfile as sf
+
+    from main import preprocess_audio_file
+
+    path = tmp_path / "short.wav"
+    sf.write(path, _tone(0.01, 0.5), SAMPLE_RATE)
+    processed_path, speech_map = preprocess_audio_file(str(path))
+    try:
+        audio, sr = sf.read(processed_path)
+        assert len(audio) == int(0.5 * sr)
+        assert speech_map is not None
+    finally:
+        os.unlink(processed_path)
+
+
+def test_transcription_cache_hits_on_same_pcm(tmp_path):
+    """같은 PCM + 모델 + 옵션이면 메모리/디스크 캐시에서 결과를 재사용"""
+    from transcription_cache import TranscriptionCache
+
+    audio = _tone(1.0, 0.5)
+    options = {"language": "ko"}
+    key = TranscriptionCache.make_key(audio, "torch:tiny", options)
+    assert key != TranscriptionCache.make_key(audio, "torch:base", options)
+
+    cache = TranscriptionCache(max_entries=1, disk_dir=str(tmp_path))
+    assert cache.get(key) is None
+    cache.put(key, {"text": "안녕하세요", "segments": []})
+    assert cache.get(key)["text"] == "안녕하세요"
+
+    # 메모리에서 밀려나도 디스크 단계에서 조회
+    cache.put("other", {"text": "", "segments": []})
+    assert cache.get(key)["text"] == "안녕하세요"
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["disk_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_transcription_cache_disk_tier_is_bounded(tmp_path):
+    """디스크 단계도 항목 수 한도를 넘으면 가장 오래 안 쓴 결과부터 삭제"""
+    from transcription_cache import TranscriptionCache
+
+    cache = TranscriptionCache(max_entries=1, disk_dir=str(tmp_path), max_disk_entries=2)
+    cache.put("aa01", {"text": "하나", "segments": []})
+    cache.put("bb02", {"text": "둘", "segments": []})
+    assert cache.get("aa01")["text"] == "하나"  # 디스크에서 읽으면서 최근 사용으로 갱신
+    cache.put("cc03", {"text": "셋", "segments": []})
+
+    assert not (tmp_path / "bb" / "bb02.json").exists()
+    assert (tmp_path / "aa" / "aa01.json").exists() and (tmp_path / "cc" / "cc03.json").exists()
+    assert cache.stats()["disk_entries"] == 2 and cache.stats()["disk_evictions"] == 1
+
+    # 재시작 후에도 남은 파일 기준으로 한도 적용
+    reopened = TranscriptionCache(max_entries=1, disk_dir=str(tmp_path), max_disk_entries=1)
+    assert reopened.stats()["disk_entries"] == 1
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+
+def test_sniff_audio_format():
+    """업로드 앞부분 바이트로 오디오 컨테이너 판별"""
+    from upload import sniff_audio_format
+
+    assert sniff_audio_format(b"RIFF\x24\x00\x00\x00WAVE") == "wav"
+    assert sniff_audio_format(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\xf7\x81") == "webm"
+    assert sniff_audio_format(b"\x00\x00\x00\x1cftypM4A ") == "mp4"
+    assert sniff_audio_format(b"OggS\x00\x02\x00\x00\x00\x00\x00\x00") == "ogg"
+    assert sniff_audio_format(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3") is None
+
+
+def test_benchmark_fixture_is_detected_as_speech():
+    """벤치마크용 합성 음성이 VAD를 통과하고 문장 사이 휴지만 잘리는지 확인"""
+    from benchmark_stt import synthesize_speech_like
+
+    audio = synthesize_speech_like(10.0)
+    trimmed, speech_map = trim_silence(audio, SAMPLE_RATE)
+
+    assert 6.0 < speech_map.speech_duration < 10.0
+    assert len(trimmed) < len(audio)
+
+
+class _FakeBackend:
+    """모델 없이 엔드포인트를 실행하기 위한 백엔드"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio, options):
+        self.calls += 1
+        return {"text": "안녕하세요", "segments": []}
+
+    def describe(self):
+        return {"backend": "fake", "model_size": "none", "device": "cpu"}
+
+
+@pytest.fixture
+def stt_client(monkeypatch):
+    """준비 완료 상태의 STT 서버 클라이언트 (startup 이벤트의 모델 로드는 실행하지 않음)"""
+    pytest.importorskip("torch")
+    from fastapi.testclient import TestClient
+
+    import main
+
+    backend = _FakeBackend()
+    monkeypatch.setattr(main, "whisper_model", backend)
+    monkeypatch.setitem(main.model_status, "state", "ready")
+    client = TestClient(main.app)
+    client.backend = backend
+    return client
+
+
+def _wav_header():
+    return b"RIFF\x24\x00\x00\x00WAVEfmt "
+
+
+def test_upload_over_limit_is_rejected_with_413(stt_client):
+    """용량 초과 업로드는 Content-Length만으로, 길이를 모르는 스트림은 수신 중에 413으로 거부"""
+    from upload import MAX_UPLOAD_BYTES
+
+    body = _wav_header() + bytes(MAX_UPLOAD_BYTES + 128 * 1024)
+    response = stt_client.post("/api/speech-to-text", content=body,
+                               headers={"content-type": "application/octet-stream"})
+    assert response.status_code == 413
+
+    def chunks():
+        yield _wav_header()
+        for _ in range(MAX_UPLOAD_BYTES // (1024 * 1024) + 1):
+            yield bytes(1024 * 1024)
+
+    response = stt_client.post("/api/speech-to-text", content=chunks(),
+                               headers={"content-type": "application/octet-stream"})
+    assert response.status_code == 413
+    assert stt_client.backend.calls == 0
+
+
+@pytest.mark.parametrize("payload", [
+    b"%PDF-1.4\n%\xe2\xe3\xcf\xd3" + bytes(4096),  # 오디오가 아닌 형식
+    b"\x00\x01\x02",  # 형식을 판별할 수 없을 만큼 짧은 본문
+], ids=["pdf", "too-short"])
+def test_upload_with_unknown_format_is_rejected_with_415(stt_client, payload):
+    """오디오로 판별되지 않는 업로드는 multipart/바이너리 본문 모두 415로 거부"""
+    response = stt_client.post("/api/speech-to-text", files={"audio": ("diary.m4a", payload, "audio/mp4")})
+    assert response.status_code == 415
+
+    response = stt_client.post("/api/speech-to-text", content=payload,
+                               headers={"content-type": "application/octet-stream"})
+    assert response.status_code == 415
+    assert stt_client.backend.calls == 0
+
+
+def test_wav_upload_is_transcribed(stt_client, tmp_path):
+    """정상 WAV 업로드는 전처리와 인식을 거쳐 텍스트를 반환"""
+    import soundfile as sf
+
+    path = tmp_path / "speech.wav"
+    sf.write(path, _tone(1.0, 0.5), SAMPLE_RATE)
+    response = stt_client.post("/api/speech-to-text", files={"audio": ("speech.wav", path.read_bytes(), "audio/wav")})
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "안녕하세요"
+
+
+def test_create_backend_selects_by_name():
+    """설정 이름으로 백엔드를 만들고 torch-int8은 항상 CPU로 고정되는지 확인"""
+    pytest.importorskip("torch")
+    from stt_backends import (
+        CTranslate2WhisperBackend,
+        QuantizedTorchWhisperBackend,
+        TorchWhisperBackend,
+        create_backend,
+    )
+
+    assert isinstance(create_backend("torch", "tiny"), TorchWhisperBackend)
+    assert isinstance(create_backend("ctranslate2", "base"), CTranslate2WhisperBackend)
+
+    quantized = create_backend("torch-int8", "small", device="cuda")
+    assert isinstance(quantized, QuantizedTorchWhisperBackend)
+    assert quantized.describe() == {'backend': 'torch-int8', 'model_size': 'small', 'device': 'cpu'}
+
+
+def test_create_backend_rejects_unknown_name():
+    """지원하지 않는 백엔드 이름은 지원 목록과 함께 ValueError"""
+    pytest.importorskip("torch")
+    from stt_backends import create_backend
+
+    with pytest.raises(ValueError, match="onnx.*torch, torch-int8, ctranslate2"):
+        create_backend("onnx")
+
+
+def test_int8_backend_quantizes_whisper_linear_layers(monkeypatch):
+    """Whisper의 Linear 하위 클래스를 nn.Linear로 바꿔 int8 동적 양자화되는지 확인 (가짜 whisper 모듈)"""
+    torch = pytest.importorskip("torch")
+    import sys
+    import types
+
+    from stt_backends import create_backend
+
+    class WhisperLinear(torch.nn.Linear):
+        """입력 dtype에 맞춰 가중치를 캐스팅하는 Whisper Linear 흉내"""
+
+    class TinyModel(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.proj = WhisperLinear(8, 4)
+
+        def transcribe(self, audio, **options):
+            return {"text": "", "segments": [], "fp16": options["fp16"]}
+
+    fake_whisper = types.ModuleType("whisper")
+    fake_whisper.model = types.SimpleNamespace(Linear=WhisperLinear)
+    fake_whisper.load_model = lambda size, device: TinyModel()
+    monkeypatch.setitem(sys.modules, "whisper", fake_whisper)
+
+    backend = create_backend("torch-int8", "tiny")
+    backend.load()
+
+    quantized_types = {type(module).__module__ for module in backend.model.modules()}
+    assert any("quantized" in name for name in quantized_types)
+    assert not any(isinstance(module, WhisperLinear) for module in backend.model.modules())
+    assert backend.transcribe(np.zeros(10, dtype=np.float32), {"fp16": True})["fp16"] is False
+
+
+def test_benchmark_falls_back_to_synthetic_testset(tmp_path, monkeypatch, capsys):
+    """manifest.jsonl이 없으면 합성 음성으로 실시간 배율만 측정하는지 확인"""
+    pytest.importorskip("torch")
+    import json
+    import sys
+
+    import benchmark_backends
+
+    class FakeBackend:
+        def load(self):
+            pass
+
+        def transcribe(self, audio, options):
+            return {"text": "", "segments": []}
+
+    monkeypatch.setattr(benchmark_backends, "create_backend", lambda name, size, device: FakeBackend())
+    monkeypatch.setattr(sys, "argv", [
+        "benchmark_backends.py", "--testset", str(tmp_path / "missing"),
+        "--backends", "torch", "--models", "tiny", "--lengths", "1,2",
+    ])
+
+    assert benchmark_backends.main() == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["testset"] == "synthetic" and report["items"] == 2
+    result = report["results"][0]
+    assert result["audio_seconds"] == pytest.approx(3.0)
+    assert result["rtf"] is not None and result["wer"] is None
+
+
+def test_cache_hit_does_not_rewrite_cache(stt_client, monkeypatch, tmp_path):
+    """같은 녹음을 다시 올리면 캐시에서 반환하고 캐시에 다시 쓰지 않는지 확인"""
+    import soundfile as sf
+
+    import main
+    from transcription_cache import TranscriptionCache
+
+    cache = TranscriptionCache(max_entries=4, disk_dir=None)
+    puts = []
+    original_put = cache.put
+    monkeypatch.setattr(cache, "put", lambda key, value: (puts.append(key), original_put(key, value)))
+    monkeypatch.setattr(main, "transcription_cache", cache)
+
+    path = tmp_path / "speech.wav"
+    sf.write(path, _tone(1.0, 0.5), SAMPLE_RATE)
+    for _ in range(2):
+        response = stt_client.post("/api/speech-to-text", files={"audio": ("speech.wav", path.read_bytes(), "audio/wav")})
+        assert response.json()["text"] == "안녕하세요"
+
+    assert stt_client.backend.calls == 1
+    assert len(puts) == 1
+    assert cache.stats()["memory_hits"] == 1
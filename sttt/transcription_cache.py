@@ -0,0 +1,157 @@
+"""
+음성 인식 결과 캐시 (오디오 지문 기반)
+
+모바일 클라이언트의 재업로드로 같은 녹음이 여러 번 들어오는 경우를 위해
+디코딩된 PCM + 모델 + 인식 옵션의 해시를 키로 인식 결과를 재사용합니다.
+- 1단계: 메모리 LRU
+- 2단계: 디스크 (STT_CACHE_DIR 설정 시, 서버 재시작 후에도 유지)
+  STT_CACHE_DISK_ENTRIES 개수를 넘으면 가장 오래 안 쓴 결과부터 삭제 (파일 수정 시각으로 LRU 관리)
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정
+STT_CACHE_SIZE = int(os.getenv("STT_CACHE_SIZE", "256"))
+STT_CACHE_DIR = os.getenv("STT_CACHE_DIR") or None
+STT_CACHE_DISK_ENTRIES = int(os.getenv("STT_CACHE_DISK_ENTRIES", "10000"))
+
+
+class TranscriptionCache:
+    """메모리 LRU + 선택적 디스크 2단계 인식 결과 캐시"""
+
+    def __init__(self, max_entries: int = STT_CACHE_SIZE, disk_dir: Optional[str] = STT_CACHE_DIR,
+                 max_disk_entries: int = STT_CACHE_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._disk_keys: "OrderedDict[str, None]" = OrderedDict()  # 디스크 항목 (오래 안 쓴 순서)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    def _load_disk_index(self) -> None:
+        """디스크에 남아 있는 결과를 수정 시각 순서(= 마지막 사용 순서)로 인덱스에 등록"""
+        files = []
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                if name.endswith(".json"):
+                    files.append((os.path.getmtime(os.path.join(root, name)), name[:-len(".json")]))
+        self._disk_keys = OrderedDict((key, None) for _, key in sorted(files))
+        self._evict_disk()
+
+    @staticmethod
+    def make_key(audio: np.ndarray, model_id: str, options: Dict[str, Any]) -> str:
+        """디코딩된 PCM, 모델, 옵션으로 캐시 키 생성"""
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+        digest.update(model_id.encode("utf-8"))
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (메모리 → 디스크 순서)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return self._entries[key]
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._store_memory(key, value)
+                    self._disk_keys[key] = None
+                    self._disk_keys.move_to_end(key)
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """캐시 저장"""
+        with self._lock:
+            self._store_memory(key, value)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # 다른 요청이 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False)
+                os.replace(temp_path, path)
+            except OSError as e:
+                logger.warning(f"인식 결과 디스크 캐시 저장 실패: {e}")
+                return
+            with self._lock:
+                self._disk_keys[key] = None
+                self._disk_keys.move_to_end(key)
+                self._evict_disk()
+
+    def _store_memory(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """디스크 항목이 max_disk_entries를 넘으면 가장 오래 안 쓴 결과부터 삭제"""
+        while len(self._disk_keys) > self.max_disk_entries:
+            key, _ = self._disk_keys.popitem(last=False)
+            try:
+                os.remove(self._disk_path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"인식 결과 디스크 캐시 삭제 실패: {e}")
+            self.disk_evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """상태 확인용 캐시 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'disk_enabled': self.disk_dir is not None,
+                'disk_entries': len(self._disk_keys),
+                'max_disk_entries': self.max_disk_entries,
+                'disk_evictions': self.disk_evictions,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,219 @@
+"""
+스트리밍 업로드 수신
+
+요청 본문을 청크 단위로 받으면서
+- Content-Length와 실제 수신 크기로 용량 제한을 바로 확인하고
+- 앞부분 몇 바이트로 컨테이너 형식을 판별해서
+용량 초과나 오디오가 아닌 파일은 본문 전체를 받기 전에 거부합니다.
+받은 데이터는 메모리에 모으지 않고 바로 임시 파일에 기록해 디코더에 넘깁니다.
+"""
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+# 업로드 용량 제한 (25MB)
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+# multipart 헤더/경계 문자열 등을 위한 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# 형식 판별에 필요한 앞부분 바이트 수
+SNIFF_BYTES = 12
+
+
+class UploadRejected(Exception):
+    """업로드 거부 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status_code: int, detail: str):
+        self.status_code = status_code
+        self.detail = detail
+        super().__init__(detail)
+
+
+class UploadedAudio:
+    """임시 파일에 저장된 업로드 오디오"""
+
+    def __init__(self, path: str, filename: str, size: int, audio_format: str):
+        self.path = path
+        self.filename = filename
+        self.size = size
+        self.format = audio_format
+
+
+def sniff_audio_format(header: bytes) -> Optional[str]:
+    """파일 앞부분으로 오디오 컨테이너 형식 판별 (알 수 없으면 None)"""
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:4] == b"\x1a\x45\xdf\xa3":
+        return "webm"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    if header[:3] == b"ID3" or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return "mp3"
+    if header[:4] == b"caff":
+        return "caf"
+    if header[:5] == b"#!AMR":
+        return "amr"
+    return None
+
+
+class _AudioSink:
+    """수신한 청크를 임시 파일에 기록하면서 용량과 형식을 검사"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.header = b""
+        self.format: Optional[str] = None
+        self.file = tempfile.NamedTemporaryFile(suffix=".upload", delete=False)
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadRejected(413, "오디오 파일이 너무 큽니다. 더 짧게 녹음해주세요.")
+
+        if self.format is None:
+            self.header += chunk[:SNIFF_BYTES]
+            if len(self.header) >= SNIFF_BYTES:
+                self._sniff()
+
+        self.file.write(chunk)
+
+    def _sniff(self) -> None:
+        self.format = sniff_audio_format(self.header[:SNIFF_BYTES])
+        if self.format is None:
+            raise UploadRejected(415, "지원하지 않는 파일 형식입니다. 오디오 파일을 업로드해주세요.")
+
+    def finish(self) -> None:
+        if self.format is None:
+            if self.size == 0:
+                raise UploadRejected(400, "파일이 선택되지 않았습니다.")
+            self._sniff()
+        self.file.close()
+
+    def discard(self) -> None:
+        self.file.close()
+        if os.path.exists(self.file.name):
+            os.unlink(self.file.name)
+
+
+class _MultipartAudioReceiver:
+    """multipart/form-data에서 지정한 파일 필드만 골라 sink로 전달"""
+
+    def __init__(self, field_name: str, sink: _AudioSink):
+        self.field_name = field_name
+        self.sink = sink
+        self.filename: Optional[str] = None
+        self.headers = {}
+        self.header_field = b""
+        self.header_value = b""
+        self.in_target = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self.headers = {}
+        self.in_target = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self.header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        if name == self.field_name and filename is not None and self.filename is None:
+            self.filename = filename.decode("utf-8", "replace")
+            self.in_target = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self.in_target:
+            self.sink.write(data[start:end])
+
+    def on_part_end(self) -> None:
+        self.in_target = False
+
+
+async def receive_audio_upload(
+    request: Request,
+    field_name: str = "audio",
+    max_bytes: int = MAX_UPLOAD_BYTES,
+) -> UploadedAudio:
+    """
+    요청 본문을 스트리밍으로 받아 임시 파일에 저장합니다.
+
+    multipart/form-data(필드명 audio)와 오디오 바이너리 본문(audio/*, application/octet-stream)을 지원합니다.
+
+    Raises:
+        UploadRejected: 용량 초과(413), 오디오가 아닌 형식(415), 파일 없음/잘못된 요청(400)
+    """
+    started = time.perf_counter()
+
+    # Content-Length가 있으면 본문을 받기 전에 바로 거부
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+            raise UploadRejected(413, "오디오 파일이 너무 큽니다. 더 짧게 녹음해주세요.")
+
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    sink = _AudioSink(max_bytes)
+    filename = "upload"
+
+    try:
+        if content_type == b"multipart/form-data":
+            boundary = options.get(b"boundary")
+            if not boundary:
+                raise UploadRejected(400, "multipart 경계(boundary)가 없습니다.")
+            receiver = _MultipartAudioReceiver(field_name, sink)
+            parser = MultipartParser(boundary, receiver.callbacks())
+            async for chunk in request.stream():
+                if chunk:
+                    parser.write(chunk)
+            parser.finalize()
+            if receiver.filename is None:
+                raise UploadRejected(400, "파일이 선택되지 않았습니다.")
+            filename = receiver.filename
+        else:
+            async for chunk in request.stream():
+                if chunk:
+                    sink.write(chunk)
+
+        sink.finish()
+    except UploadRejected as e:
+        sink.discard()
+        logger.warning(f"업로드 거부 ({e.status_code}): {e.detail} - {sink.size} bytes 수신 후 "
+                       f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        raise
+    except Exception:
+        sink.discard()
+        raise
+
+    return UploadedAudio(sink.file.name, filename, sink.size, sink.format)
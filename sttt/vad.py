@@ -0,0 +1,164 @@
+"""
+에너지/영교차율(ZCR) 기반 음성 구간 검출 (VAD)
+
+Whisper에 넣기 전에 앞뒤 무음과 긴 휴지 구간을 잘라내고,
+잘라낸 오디오의 시간을 원본 시간으로 되돌릴 수 있는 타임스탬프 맵을 만듭니다.
+"""
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 프레임 길이 (초)
+FRAME_SECONDS = 0.03
+
+# 음성으로 판단할 최소 RMS (아주 조용한 녹음의 잡음 바닥)
+MIN_SPEECH_RMS = 0.005
+
+# 잡음 바닥 대비 이 배수 이상이면 음성
+NOISE_FLOOR_RATIO = 3.0
+
+# 임계값 상한: 큰 프레임(상위 5%) RMS 대비 비율
+# 휴지 없이 계속 말한 녹음은 하위 10%도 음성이라 잡음 바닥이 높게 잡히므로 음성이 무음으로 잘리지 않도록 제한
+PEAK_RMS_RATIO = 0.25
+
+# 마찰음(ㅅ, ㅎ 등)은 에너지가 낮고 ZCR이 높으므로 별도로 인정
+FRICATIVE_ZCR = 0.25
+
+# 이보다 짧은 휴지는 자르지 않음 (초)
+MIN_SILENCE_SECONDS = 0.4
+
+# 이보다 짧은 음성 구간은 잡음으로 간주 (초)
+MIN_SPEECH_SECONDS = 0.1
+
+# 음성 구간 앞뒤로 남겨둘 여유 (초)
+PADDING_SECONDS = 0.15
+
+
+class SilentAudioError(ValueError):
+    """음성이 전혀 감지되지 않은 오디오"""
+    pass
+
+
+class SpeechMap:
+    """잘라낸 오디오의 시간 → 원본 오디오 시간 변환 맵"""
+
+    def __init__(self, segments: List[Tuple[int, int]], sample_rate: int, original_samples: int):
+        # segments: 원본 기준 (시작 샘플, 끝 샘플) 목록
+        self.segments = segments
+        self.sample_rate = sample_rate
+        self.original_samples = original_samples
+
+    @property
+    def original_duration(self) -> float:
+        return self.original_samples / self.sample_rate
+
+    @property
+    def speech_duration(self) -> float:
+        return sum(end - start for start, end in self.segments) / self.sample_rate
+
+    def to_original(self, seconds: float) -> float:
+        """잘라낸 오디오 기준 시간을 원본 기준 시간으로 변환"""
+        position = int(round(seconds * self.sample_rate))
+        offset = 0
+        for start, end in self.segments:
+            length = end - start
+            if position <= offset + length:
+                return (start + position - offset) / self.sample_rate
+            offset += length
+        # 범위를 벗어나면 마지막 음성 구간의 끝으로 고정
+        return (self.segments[-1][1] if self.segments else 0) / self.sample_rate
+
+    def to_list(self) -> List[dict]:
+        """API 응답용 원본 기준 음성 구간 목록"""
+        return [
+            {"start": round(start / self.sample_rate, 2), "end": round(end / self.sample_rate, 2)}
+            for start, end in self.segments
+        ]
+
+
+def frame_features(audio: np.ndarray, sample_rate: int) -> Tuple[np.ndarray, np.ndarray, int]:
+    """프레임별 RMS와 영교차율 계산 (벡터화)"""
+    frame_length = max(int(FRAME_SECONDS * sample_rate), 1)
+    n_frames = len(audio) // frame_length
+    if n_frames == 0:
+        return np.zeros(0), np.zeros(0), frame_length
+
+    frames = audio[:n_frames * frame_length].reshape(n_frames, frame_length)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return rms, zcr, frame_length
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """True 구간의 (시작, 끝) 프레임 인덱스 목록"""
+    padded = np.concatenate([[False], mask, [False]])
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[0::2], edges[1::2]))
+
+
+def detect_speech_segments(audio: np.ndarray, sample_rate: int) -> List[Tuple[int, int]]:
+    """
+    음성 구간을 검출합니다.
+
+    Returns:
+        원본 기준 (시작 샘플, 끝 샘플) 목록. 음성이 없으면 빈 목록
+    """
+    rms, zcr, frame_length = frame_features(audio, sample_rate)
+    if len(rms) == 0:
+        return []
+
+    # 하위 10% 프레임을 잡음 바닥으로 보고 임계값 결정 (큰 프레임 RMS 기준 상한 적용)
+    noise_floor = float(np.percentile(rms, 10))
+    peak = float(np.percentile(rms, 95))
+    threshold = max(MIN_SPEECH_RMS, min(noise_floor * NOISE_FLOOR_RATIO, peak * PEAK_RMS_RATIO))
+    is_speech = (rms >= threshold) | ((rms >= threshold * 0.5) & (zcr >= FRICATIVE_ZCR))
+
+    # 짧은 휴지는 음성으로 메움
+    min_silence_frames = int(MIN_SILENCE_SECONDS / FRAME_SECONDS)
+    for start, end in _runs(~is_speech):
+        if start > 0 and end < len(is_speech) and end - start < min_silence_frames:
+            is_speech[start:end] = True
+
+    # 너무 짧은 음성 구간 제거 후 여유 구간 추가
+    min_speech_frames = max(int(MIN_SPEECH_SECONDS / FRAME_SECONDS), 1)
+    padding = int(PADDING_SECONDS * sample_rate)
+    segments: List[Tuple[int, int]] = []
+    for start, end in _runs(is_speech):
+        if end - start < min_speech_frames:
+            continue
+        seg_start = max(int(start) * frame_length - padding, 0)
+        seg_end = min(int(end) * frame_length + padding, len(audio))
+        if segments and seg_start <= segments[-1][1]:
+            segments[-1] = (segments[-1][0], seg_end)
+        else:
+            segments.append((seg_start, seg_end))
+    return segments
+
+
+def trim_silence(audio: np.ndarray, sample_rate: int) -> Tuple[np.ndarray, SpeechMap]:
+    """
+    무음 구간을 잘라낸 오디오와 타임스탬프 맵을 반환합니다.
+
+    프레임 하나(30ms)보다 짧은 오디오는 판단할 수 없으므로 그대로 반환합니다 (호출하는 쪽에서 패딩).
+
+    Raises:
+        SilentAudioError: 음성이 전혀 없는 경우
+    """
+    if len(audio) < max(int(FRAME_SECONDS * sample_rate), 1):
+        return audio, SpeechMap([(0, len(audio))], sample_rate, len(audio))
+
+    segments = detect_speech_segments(audio, sample_rate)
+    if not segments:
+        raise SilentAudioError("음성이 감지되지 않았습니다.")
+
+    trimmed = np.concatenate([audio[start:end] for start, end in segments])
+    speech_map = SpeechMap(segments, sample_rate, len(audio))
+    logger.info(
+        f"무음 제거: {speech_map.original_duration:.2f}초 → {speech_map.speech_duration:.2f}초 "
+        f"({len(segments)}개 구간)"
+    )
+    return trimmed, speech_map